@@ -4,7 +4,7 @@ A provider for accessing Google BigQuery data for the Service Quality Oracle.
 
 import logging
 from datetime import date
-from typing import cast
+from typing import Dict, List, cast
 
 from bigframes import pandas as bpd
 from pandera.typing import DataFrame
@@ -76,70 +76,64 @@ class BigQueryProvider:
         end_date_str = end_date.strftime("%Y-%m-%d")
         return f"""
         WITH
-        -- Get daily query metrics per indexer
-        DailyMetrics AS (
+        -- Get query metrics per indexer, day and subgraph in the only scan of the table
+        DeploymentMetrics AS (
             SELECT
                 day_partition AS day,
                 indexer,
+                deployment,
                 COUNT(*) AS query_attempts,
-                SUM(CASE
-                    WHEN status = '200 OK'
+                COUNTIF(
+                    status = '200 OK'
                     AND response_time_ms < {self.max_latency_ms}
                     AND blocks_behind < {self.max_blocks_behind}
-                    THEN 1
-                    ELSE 0
-                END) AS good_responses,
-                COUNT(DISTINCT deployment) AS unique_subgraphs_served
+                ) AS good_responses
             FROM
                 {self.table_name}
             WHERE
                 day_partition BETWEEN '{start_date_str}' AND '{end_date_str}'
             GROUP BY
-                day_partition, indexer
+                day_partition, indexer, deployment
         ),
-        -- Determine which days count as 'online' (>= 1 good query on >= 10 subgraphs)
-        DaysOnline AS (
+        -- Flag the first day each subgraph got a good response, so subgraphs can be counted once per indexer
+        FirstGoodResponseDays AS (
             SELECT
-                indexer,
-                day,
-                unique_subgraphs_served,
-                CASE WHEN good_responses >= 1 AND unique_subgraphs_served >= {self.min_subgraphs}
-                    THEN 1 ELSE 0
-                END AS is_online_day
+                *,
+                deployment IS NOT NULL
+                AND day = MIN(IF(good_responses > 0, day, NULL)) OVER (PARTITION BY indexer, deployment)
+                AS is_first_good_response_day
             FROM
-                DailyMetrics
+                DeploymentMetrics
         ),
-        -- Calculate unique subgraphs served with at least one good query
-        UniqueSubgraphs AS (
+        -- Get daily query metrics per indexer
+        DailyMetrics AS (
             SELECT
+                day,
                 indexer,
-                COUNT(DISTINCT deployment) AS unique_good_response_subgraphs
+                SUM(query_attempts) AS query_attempts,
+                SUM(good_responses) AS good_responses,
+                COUNT(deployment) AS unique_subgraphs_served,
+                COUNTIF(is_first_good_response_day) AS new_good_response_subgraphs
             FROM
-                {self.table_name}
-            WHERE
-                day_partition BETWEEN '{start_date_str}' AND '{end_date_str}'
-                AND status = '200 OK'
-                AND response_time_ms < {self.max_latency_ms}
-                AND blocks_behind < {self.max_blocks_behind}
+                FirstGoodResponseDays
             GROUP BY
-                indexer
+                day, indexer
         ),
-        -- Calculate overall metrics per indexer
+        -- Calculate overall metrics per indexer, where a day counts as 'online' if it has
+        -- >= 1 good query on >= 10 subgraphs
         IndexerMetrics AS (
             SELECT
-                d.indexer,
-                SUM(m.query_attempts) AS total_query_attempts,
-                SUM(m.good_responses) AS total_good_responses,
-                SUM(d.is_online_day) AS total_good_days_online,
-                ds.unique_good_response_subgraphs
+                indexer,
+                SUM(query_attempts) AS total_query_attempts,
+                SUM(good_responses) AS total_good_responses,
+                COUNTIF(good_responses >= 1 AND unique_subgraphs_served >= {self.min_subgraphs})
+                    AS total_good_days_online,
+                IF(SUM(good_responses) > 0, SUM(new_good_response_subgraphs), NULL)
+                    AS unique_good_response_subgraphs
             FROM
-                DailyMetrics m
-            JOIN
-                DaysOnline d USING (indexer, day)
-            LEFT JOIN
-                UniqueSubgraphs ds ON m.indexer = ds.indexer
+                DailyMetrics
             GROUP BY
-                d.indexer, ds.unique_good_response_subgraphs
+                indexer
         )
         -- Final result with eligibility determination
         SELECT
@@ -187,3 +181,61 @@ class BigQueryProvider:
 
         # Return the results df
         return self._read_gbq_dataframe(query)
+
+
+    def _get_indexer_addresses_by_eligibility_query(self, start_date: date, end_date: date) -> str:
+        """
+        Construct an SQL query that groups indexer addresses by eligibility status server-side.
+
+        Wraps the eligibility query so that only the indexer addresses are transferred, aggregated into one
+        array per eligibility status and kept in the same order as the full eligibility query.
+
+        Args:
+            start_date (date): The start date for the data range.
+            end_date (date): The end date for the data range.
+
+        Returns:
+            str: SQL query string returning one row per eligibility status.
+        """
+        eligibility_query = self._get_indexer_eligibility_query(start_date=start_date, end_date=end_date)
+        return f"""
+        SELECT
+            eligible_for_indexing_rewards,
+            ARRAY_AGG(indexer IGNORE NULLS ORDER BY total_good_days_online DESC, good_responses DESC) AS indexers
+        FROM (
+            {eligibility_query}
+        )
+        GROUP BY
+            eligible_for_indexing_rewards
+        """
+
+
+    def fetch_indexer_addresses_by_eligibility(self, start_date: date, end_date: date) -> Dict[int, List[str]]:
+        """
+        Fetch only the indexer addresses from Google BigQuery, grouped by issuance eligibility status.
+
+        This avoids transferring the full set of per-indexer metrics when they are not archived.
+
+        Depends on:
+            - _get_indexer_addresses_by_eligibility_query()
+            - _read_gbq_dataframe()
+
+        Args:
+            start_date (date): The start date for the data to fetch from BigQuery.
+            end_date (date): The end date for the data to fetch from BigQuery.
+
+        Returns:
+            Dict[int, List[str]]: Indexer addresses keyed by eligibility status (1 eligible, 0 ineligible).
+                Both keys are always present.
+        """
+        # Construct the query and fetch one row per eligibility status
+        query = self._get_indexer_addresses_by_eligibility_query(start_date=start_date, end_date=end_date)
+        grouped_indexers = self._read_gbq_dataframe(query)
+
+        # Return the address lists keyed by eligibility status, defaulting to empty lists
+        indexers_by_eligibility: Dict[int, List[str]] = {1: [], 0: []}
+        for status, indexers in zip(
+            grouped_indexers["eligible_for_indexing_rewards"], grouped_indexers["indexers"]
+        ):
+            indexers_by_eligibility[int(status)] = list(indexers)
+        return indexers_by_eligibility
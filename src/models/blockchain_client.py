@@ -8,12 +8,19 @@ This module handles all blockchain interactions including:
 - Gas estimation and nonce management
 """
 
-import json
 import logging
+import math
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Tuple, cast
 
+from eth_account import Account
 from eth_account.datastructures import SignedTransaction
+from orjson import loads as json_loads
+from requests import Session
+from requests.adapters import HTTPAdapter
 from requests.exceptions import ConnectionError, HTTPError, Timeout
 from web3 import Web3
 from web3.contract import Contract
@@ -33,6 +40,24 @@ from src.utils.slack_notifier import SlackNotifier
 logger = logging.getLogger(__name__)
 
 
+# Maximum number of batch transaction receipts awaited concurrently
+MAX_CONCURRENT_RECEIPT_WAITS = 16
+
+# Maximum number of batch transactions estimated, built and signed concurrently
+MAX_CONCURRENT_BATCH_PREPARATIONS = 8
+
+# Seconds between receipt polls while waiting for a transaction, instead of web3's default of 0.1
+RECEIPT_POLL_LATENCY_SECONDS = 0.5
+
+# Number of addresses in the gas probe used to fit the batch size to the block gas limit
+BATCH_SIZE_PROBE_ADDRESSES = 50
+
+# Share of the block gas limit a single batch transaction may be sized to use
+BATCH_BLOCK_GAS_TARGET = 0.8
+
+# Seconds the preferred RPC provider is given to connect before the other providers are probed
+RPC_PROBE_HEAD_START_SECONDS = 2
+
 # Exceptions that should trigger a retry to a different RPC provider
 RPC_FAILOVER_EXCEPTIONS = (
     ConnectionError,
@@ -46,6 +71,59 @@ RPC_FAILOVER_EXCEPTIONS = (
 )
 
 
+@lru_cache(maxsize=None)
+def _read_contract_abi(abi_path: Path) -> List[Dict]:
+    """Read and parse a contract ABI file once per process. The returned ABI must not be mutated."""
+    with open(abi_path, "rb") as f:
+        return json_loads(f.read())
+
+
+@lru_cache(maxsize=8)
+def _get_web3(rpc_url: str) -> Web3:
+    """
+    Get a Web3 instance for an RPC URL, reusing its HTTP session across reconnects and client instances.
+
+    The session keeps enough pooled connections for every concurrent receipt wait, so no thread has to open
+    (and then discard) a fresh TLS connection to the provider.
+    """
+    session = Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=MAX_CONCURRENT_RECEIPT_WAITS)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return Web3(Web3.HTTPProvider(rpc_url, session=session))
+
+
+@lru_cache(maxsize=8)
+def _get_contract(rpc_url: str, contract_address: ChecksumAddress, abi_path: Path) -> Contract:
+    """Get the contract bound to an RPC URL's Web3 instance, building its functions from the ABI only once."""
+    return _get_web3(rpc_url).eth.contract(address=contract_address, abi=_read_contract_abi(abi_path))
+
+
+@lru_cache(maxsize=4)
+def _derive_account_address(formatted_private_key: str) -> str:
+    """Derive the account address for a private key once per process, as key derivation dominates account setup."""
+    return Account.from_key(formatted_private_key).address
+
+
+@lru_cache(maxsize=8192)
+def _to_checksum_address(address: str) -> ChecksumAddress:
+    """Checksum an address, caching the result as the same addresses recur across transactions."""
+    return Web3.to_checksum_address(address)
+
+
+def _to_address_bytes(address: str) -> bytes:
+    """
+    Convert a hex address to its raw 20 bytes for ABI encoding.
+
+    The ABI encoder accepts raw addresses without checking their checksum, which would otherwise cost a keccak
+    hash per address every time the contract call is encoded.
+    """
+    address_bytes = bytes.fromhex(address[2:] if address[:2] in ("0x", "0X") else address)
+    if len(address_bytes) != 20:
+        raise ValueError(f"Address must be 20 bytes long, got {len(address_bytes)}: {address}")
+    return address_bytes
+
+
 class BlockchainClient:
     """Handles all blockchain interactions"""
 
@@ -71,14 +149,18 @@ class BlockchainClient:
         """
         self.rpc_providers = rpc_providers
         self.contract_address = contract_address
+        self.checksum_contract_address = _to_checksum_address(contract_address)
         self.project_root = project_root
         self.block_explorer_url = block_explorer_url.rstrip("/")
+        self.tx_url_prefix = f"{self.block_explorer_url}/tx/"
         self.tx_timeout_seconds = tx_timeout_seconds
         self.slack_notifier = slack_notifier
+        self.abi_path = project_root / "contracts" / "contract.abi.json"
         self.contract_abi = self._load_contract_abi()
         self.current_rpc_index = 0
         self.w3: Optional[Web3] = None
         self.contract: Optional[Contract] = None
+        self._rpc_failover_lock = threading.Lock()
         self._connect_to_rpc()
 
 
@@ -86,52 +168,111 @@ class BlockchainClient:
         """Load the contract ABI from the contracts directory."""
         # Try to load the ABI file
         try:
-            abi_path = self.project_root / "contracts" / "contract.abi.json"
-            with open(abi_path) as f:
-                return json.load(f)
+            return _read_contract_abi(self.abi_path)
 
         # If the ABI file cannot be loaded, raise an error
         except Exception as e:
-            logger.error(f"Failed to load contract ABI: {str(e)}")
+            logger.error("Failed to load contract ABI: %s", e)
             raise
 
 
-    def _connect_to_rpc(self) -> None:
-        """Connect to the next available RPC provider."""
-        initial_index = self.current_rpc_index
-        for i in range(len(self.rpc_providers)):
-            rpc_url = self.rpc_providers[self.current_rpc_index]
-            provider_type = "primary" if self.current_rpc_index == 0 else f"backup #{self.current_rpc_index}"
+    def _probe_rpc_provider(self, index: int) -> Optional[Tuple[Web3, Contract]]:
+        """
+        Try to connect to the RPC provider at the given index.
 
-            # Try to connect to the RPC provider
-            try:
-                logger.info(f"Attempting to connect to {provider_type} RPC provider: {rpc_url}")
-                w3 = Web3(Web3.HTTPProvider(rpc_url))
-                if w3.is_connected():
-                    self.w3 = w3
-                    self.contract = self.w3.eth.contract(
-                        address=Web3.to_checksum_address(self.contract_address), abi=self.contract_abi
-                    )
-                    logger.info(f"Successfully connected to {provider_type} RPC provider at {rpc_url}")
+        Args:
+            index: Index of the provider in the RPC provider list
+
+        Returns:
+            The connected Web3 instance and contract, or None if the provider could not be reached.
+        """
+        rpc_url = self.rpc_providers[index]
+        provider_type = "primary" if index == 0 else f"backup #{index}"
+
+        # Try to connect to the RPC provider
+        try:
+            logger.info("Attempting to connect to %s RPC provider: %s", provider_type, rpc_url)
+            w3 = _get_web3(rpc_url)
+            if w3.is_connected():
+                return w3, _get_contract(rpc_url, self.checksum_contract_address, self.abi_path)
+
+            # If we could not connect log the error
+            else:
+                logger.warning("Could not connect to %s RPC provider: %s", provider_type, rpc_url)
+
+        # If we get an error, log the error
+        except Exception as e:
+            logger.warning("Error connecting to %s RPC provider %s: %s", provider_type, rpc_url, e)
+
+        return None
+
+
+    def _use_rpc_provider(self, index: int, connection: Tuple[Web3, Contract]) -> None:
+        """Make the connected RPC provider at the given index the active one."""
+        self.current_rpc_index = index
+        self.w3, self.contract = connection
+        provider_type = "primary" if index == 0 else f"backup #{index}"
+        logger.info("Successfully connected to %s RPC provider at %s", provider_type, self.rpc_providers[index])
+
+
+    def _connect_to_rpc(self, failed_index: Optional[int] = None) -> None:
+        """
+        Connect to the next available RPC provider.
+
+        The provider at the current index is probed first and given a short head start, so it is used whenever it
+        answers promptly. Otherwise the remaining providers are probed concurrently and the first to connect wins,
+        bounding the connection time by the fastest responder rather than the sum of all timeouts.
+
+        Args:
+            failed_index: Index of a provider that has just failed. It answering a probe says nothing about its
+                calls succeeding, so it is kept out of the race and only probed once every other provider failed.
+        """
+        provider_count = len(self.rpc_providers)
+        if provider_count == 0:
+            raise ConnectionError("Failed to connect to any of the 0 RPC providers.")
+
+        probe_order = [(self.current_rpc_index + offset) % provider_count for offset in range(provider_count)]
+        if failed_index is not None and provider_count > 1:
+            probe_order.remove(failed_index)
+        executor = ThreadPoolExecutor(max_workers=provider_count)
+        try:
+            # Give the preferred provider a head start
+            preferred_index = probe_order[0]
+            futures = {executor.submit(self._probe_rpc_provider, preferred_index): preferred_index}
+            done, _ = wait(futures, timeout=RPC_PROBE_HEAD_START_SECONDS)
+            for future in done:
+                connection = future.result()
+                if connection:
+                    self._use_rpc_provider(preferred_index, connection)
+                    return
+
+            # Probe the remaining providers concurrently and use whichever connects first
+            for index in probe_order[1:]:
+                futures[executor.submit(self._probe_rpc_provider, index)] = index
+            for future in as_completed(futures):
+                connection = future.result()
+                if connection:
+                    self._use_rpc_provider(futures[future], connection)
                     return
 
-                # If we could not connect log the error
-                else:
-                    logger.warning(f"Could not connect to {provider_type} RPC provider: {rpc_url}")
+        # Do not wait for slow providers once one has connected
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
-            # If we get an error, log the error
-            except Exception as e:
-                logger.warning(f"Error connecting to {provider_type} RPC provider {rpc_url}: {str(e)}")
+        # Fall back to the provider that failed, as the last one in the rotation
+        if failed_index not in (None, *probe_order):
+            connection = self._probe_rpc_provider(failed_index)
+            if connection:
+                self._use_rpc_provider(failed_index, connection)
+                return
 
-            self.current_rpc_index = (self.current_rpc_index + 1) % len(self.rpc_providers)
-            if self.current_rpc_index == initial_index:
-                break
-        raise ConnectionError(f"Failed to connect to any of the {len(self.rpc_providers)} RPC providers.")
+        raise ConnectionError(f"Failed to connect to any of the {provider_count} RPC providers.")
 
 
     def _get_next_rpc_provider(self) -> None:
         """Rotate to the next RPC provider and reconnect."""
-        previous_provider_url = self.rpc_providers[self.current_rpc_index]
+        previous_index = self.current_rpc_index
+        previous_provider_url = self.rpc_providers[previous_index]
         self.current_rpc_index = (self.current_rpc_index + 1) % len(self.rpc_providers)
         new_provider_url = self.rpc_providers[self.current_rpc_index]
 
@@ -145,7 +286,7 @@ class BlockchainClient:
         if self.slack_notifier:
             self.slack_notifier.send_info_notification(message=warning_message, title="RPC Provider Rotation")
 
-        self._connect_to_rpc()
+        self._connect_to_rpc(failed_index=previous_index)
 
 
     def _execute_rpc_call(self, func: Callable, *args: Any, **kwargs: Any) -> Any:
@@ -165,6 +306,7 @@ class BlockchainClient:
         """
         initial_index = self.current_rpc_index
         while True:
+            attempt_index = self.current_rpc_index
             try:
                 # Add retry logic with backoff for the specific function call
 
@@ -177,11 +319,15 @@ class BlockchainClient:
 
             # If we get an exception after all retries, log the error and switch to the next RPC provider
             except RPC_FAILOVER_EXCEPTIONS as e:
-                current_provider = self.rpc_providers[self.current_rpc_index]
+                current_provider = self.rpc_providers[attempt_index]
                 logger.warning(
-                    f"RPC call failed with provider at index {self.current_rpc_index} ({current_provider}): {e}"
+                    "RPC call failed with provider at index %d (%s): %s", attempt_index, current_provider, e
                 )
-                self._get_next_rpc_provider()
+
+                # Calls may run concurrently, so only rotate if no other call has moved off this provider already
+                with self._rpc_failover_lock:
+                    if self.current_rpc_index == attempt_index:
+                        self._get_next_rpc_provider()
 
                 # If we have tried all RPC providers, log the error and raise an exception
                 if self.current_rpc_index == initial_index:
@@ -190,7 +336,7 @@ class BlockchainClient:
 
             # If we get an unexpected exception, log the error and raise the exception
             except Exception as e:
-                logger.error(f"An unexpected error occurred during RPC call: {e}")
+                logger.error("An unexpected error occurred during RPC call: %s", e)
                 raise
 
 
@@ -209,35 +355,36 @@ class BlockchainClient:
         """
         try:
             formatted_key = validate_and_format_private_key(private_key)
-            account = Web3().eth.account.from_key(formatted_key)
-            logger.info(f"Using account: {account.address}")
-            return account.address, formatted_key
+            account_address = _derive_account_address(formatted_key)
+            logger.info("Using account: %s", account_address)
+            return account_address, formatted_key
 
         except KeyValidationError as e:
-            logger.error(f"Invalid private key provided: {e}")
+            logger.error("Invalid private key provided: %s", e)
             raise
 
         except Exception as e:
-            logger.error(f"Failed to retrieve account from private key: {str(e)}")
+            logger.error("Failed to retrieve account from private key: %s", e)
             raise
 
 
     def _estimate_transaction_gas(
         self,
         contract_func: Any,
-        indexer_addresses: List[str],
+        indexer_addresses: List[bytes],
         data_bytes: bytes,
         sender_address: ChecksumAddress,
+        estimated_gas: Optional[int] = None,
     ) -> int:
         """
         Estimate gas for the transaction with 25% buffer.
 
         Args:
-            w3: Web3 instance
             contract_func: Contract function to call
             indexer_addresses: List of indexer addresses
             data_bytes: Data bytes for the transaction
             sender_address: Transaction sender address
+            estimated_gas: Optional prefetched gas estimate, avoiding the RPC call
 
         Returns:
             int: Estimated gas with 25% buffer
@@ -249,100 +396,236 @@ class BlockchainClient:
             def gas_estimator():
                 return contract_func(indexer_addresses, data_bytes).estimate_gas({"from": sender_address})
 
-            estimated_gas = self._execute_rpc_call(gas_estimator)
+            if estimated_gas is None:
+                estimated_gas = self._execute_rpc_call(gas_estimator)
             gas_limit = int(estimated_gas * 1.25)  # 25% buffer
-            logger.info(f"Estimated gas: {estimated_gas}, with buffer: {gas_limit}")
+            logger.info("Estimated gas: %s, with buffer: %s", estimated_gas, gas_limit)
             return gas_limit
 
         # If the gas estimation fails, log the error and raise an exception
         except Exception as e:
-            logger.error(f"Gas estimation failed: {str(e)}")
+            logger.error("Gas estimation failed: %s", e)
             raise
 
 
-    def _determine_transaction_nonce(self, sender_address: ChecksumAddress, replace: bool) -> int:
+    def _fetch_transaction_state(
+        self,
+        sender_address: ChecksumAddress,
+        contract_function_name: Optional[str] = None,
+        contract_args: Optional[List[Any]] = None,
+    ) -> Optional[Tuple[int, int, BlockData, int, Optional[int]]]:
+        """
+        Fetch everything needed to build a transaction from the sender in a single batched JSON-RPC request.
+
+        This covers the sender's pending and latest nonces, the latest block and the sender's balance, plus the
+        gas estimate for a contract call when one is given. This is an optimistic fast path. Providers that do not
+        support batching, or any other failure (including a reverting gas estimate), return None so callers fall
+        back to individual calls with the usual retry, failover and error handling.
+
+        Args:
+            sender_address: Transaction sender address
+            contract_function_name: Optional name of the contract function to estimate gas for
+            contract_args: Arguments for the contract function
+
+        Returns:
+            A tuple of (pending_nonce, latest_nonce, latest_block, balance, estimated_gas), where estimated_gas is
+            None if no contract function was given, or None if the batch request failed.
+        """
+        # Try to send all requests in one round trip
+        try:
+            with self.w3.batch_requests() as batch:
+                batch.add(self.w3.eth.get_transaction_count(sender_address, "pending"))
+                batch.add(self.w3.eth.get_transaction_count(sender_address, "latest"))
+                batch.add(self.w3.eth.get_block("latest"))
+                batch.add(self.w3.eth.get_balance(sender_address))
+                if contract_function_name:
+                    call_data = self.contract.encode_abi(contract_function_name, args=contract_args)
+                    batch.add(
+                        self.w3.eth.estimate_gas(
+                            {"from": sender_address, "to": self.checksum_contract_address, "data": call_data}
+                        )
+                    )
+                pending_nonce, latest_nonce, latest_block, balance, *estimate = batch.execute()
+
+            # Guard against error payloads or unexpected response shapes
+            values = [pending_nonce, latest_nonce, balance, *estimate]
+            if not all(isinstance(value, int) for value in values):
+                raise ValueError(f"Unexpected batch responses: {values!r}")
+
+            estimated_gas = cast(int, estimate[0]) if estimate else None
+            return (
+                cast(int, pending_nonce),
+                cast(int, latest_nonce),
+                cast(BlockData, latest_block),
+                cast(int, balance),
+                estimated_gas,
+            )
+
+        # If batching is not possible, fall back to individual calls
+        except Exception as e:
+            logger.warning("Batched RPC request failed, falling back to individual calls: %s", e)
+            return None
+
+
+    def _fit_batch_size_to_gas_limit(
+        self,
+        sender_address: ChecksumAddress,
+        indexer_addresses: List[str],
+        contract_function: str,
+        data_bytes: bytes,
+        batch_size: int,
+        latest_block: Optional[BlockData] = None,
+    ) -> int:
+        """
+        Fit the batch size to the block gas limit, so a batch never needs more gas than a block can hold.
+
+        The fixed and per-address gas cost are derived from two gas estimates, for a single address and for a
+        probe of up to BATCH_SIZE_PROBE_ADDRESSES addresses, sent in one batched JSON-RPC request. Any failure
+        falls back to the configured batch size.
+
+        Args:
+            sender_address: Transaction sender address
+            indexer_addresses: The indexer addresses to be batched, the first of which are used for the probe
+            contract_function: Name of the contract function to be called for each batch
+            data_bytes: Data bytes for the transaction
+            batch_size: The configured batch size, used as the upper bound
+            latest_block: Optional prefetched latest block, avoiding the RPC call for its gas limit
+
+        Returns:
+            int: The largest batch size, up to the configured one, that fits the block gas target
+        """
+        probe_addresses = [_to_address_bytes(addr) for addr in indexer_addresses[:BATCH_SIZE_PROBE_ADDRESSES]]
+        if len(probe_addresses) < 2:
+            return batch_size
+
+        # Try to estimate the gas for a single address and for the whole probe in one round trip
+        try:
+            if latest_block is None:
+                latest_block = self._execute_rpc_call(self.w3.eth.get_block, "latest")
+            block_gas_limit = latest_block["gasLimit"]
+
+            with self.w3.batch_requests() as batch:
+                for args in ([probe_addresses[:1], data_bytes], [probe_addresses, data_bytes]):
+                    call_data = self.contract.encode_abi(contract_function, args=args)
+                    batch.add(
+                        self.w3.eth.estimate_gas(
+                            {"from": sender_address, "to": self.checksum_contract_address, "data": call_data}
+                        )
+                    )
+                single_gas, probe_gas = batch.execute()
+
+            # Guard against error payloads or unexpected response shapes
+            if not all(isinstance(value, int) for value in (single_gas, probe_gas)):
+                raise ValueError(f"Unexpected batch responses: {[single_gas, probe_gas]!r}")
+
+            single_address_gas, probe_address_gas = cast(int, single_gas), cast(int, probe_gas)
+            gas_per_address = (probe_address_gas - single_address_gas) / (len(probe_addresses) - 1)
+            if gas_per_address <= 0:
+                return batch_size
+
+            fixed_gas = single_address_gas - gas_per_address
+            fitted_batch_size = int((block_gas_limit * BATCH_BLOCK_GAS_TARGET - fixed_gas) // gas_per_address)
+
+        # If the probe fails, keep the configured batch size
+        except Exception as e:
+            logger.warning("Failed to fit batch size to the block gas limit, using %d: %s", batch_size, e)
+            return batch_size
+
+        if fitted_batch_size < batch_size:
+            logger.info(
+                "Reducing batch size from %d to %d to fit the block gas limit of %d",
+                batch_size,
+                max(fitted_batch_size, 1),
+                block_gas_limit,
+            )
+            return max(fitted_batch_size, 1)
+        return batch_size
+
+
+    def _determine_transaction_nonce(
+        self,
+        sender_address: ChecksumAddress,
+        replace: bool,
+        nonce_counts: Optional[Tuple[int, int]] = None,
+    ) -> int:
         """
         Determine the appropriate nonce for the transaction.
 
         Args:
-            w3: Web3 instance
             sender_address: Transaction sender address
             replace: Whether to replace pending transactions
+            nonce_counts: Optional prefetched (pending, latest) nonces, avoiding the RPC calls
 
         Returns:
             int: Transaction nonce to use
         """
         # If we are not replacing a pending transaction, use the next available nonce
         if not replace:
-            nonce = self._execute_rpc_call(self.w3.eth.get_transaction_count, sender_address)
-            logger.info(f"Using next available nonce: {nonce}")
+            if nonce_counts:
+                nonce = nonce_counts[1]
+            else:
+                nonce = self._execute_rpc_call(self.w3.eth.get_transaction_count, sender_address)
+            logger.info("Using next available nonce: %s", nonce)
             return nonce
 
-        # If we are replacing a pending transaction, try to find and replace it
+        # If we are replacing a pending transaction, compare our pending and latest nonces to find it
         logger.info("Attempting to find and replace a pending transaction")
-
-        # Try to find pending transactions
         try:
-            pending_txs_data = self._execute_rpc_call(self.w3.eth.get_block, "pending", full_transactions=True)
-            pending_txs = cast(BlockData, pending_txs_data)
-            sender_pending_txs = [
-                tx
-                for tx in pending_txs["transactions"]
-                if isinstance(tx, dict) and tx.get("from") == sender_address
-            ]
-
-            # If we found pending transactions, use the nonce of the first pending transaction
-            if sender_pending_txs:
-                sender_pending_txs.sort(key=lambda x: x["nonce"])
-                nonce = sender_pending_txs[0]["nonce"]
-                logger.info(f"Found pending transaction with nonce {nonce} for replacement")
-                return nonce
-
-        # If we could not find pending transactions log the issue
-        except Exception as e:
-            logger.warning(f"Could not check pending transactions: {str(e)}")
+            if nonce_counts:
+                pending_nonce, latest_nonce = nonce_counts
+            else:
+                pending_nonce = self._execute_rpc_call(
+                    self.w3.eth.get_transaction_count, sender_address, "pending"
+                )
+                latest_nonce = self._execute_rpc_call(self.w3.eth.get_transaction_count, sender_address, "latest")
 
-        # Check for nonce gaps
-        try:
-            current_nonce = self._execute_rpc_call(self.w3.eth.get_transaction_count, sender_address, "pending")
-            latest_nonce = self._execute_rpc_call(self.w3.eth.get_transaction_count, sender_address, "latest")
-            if current_nonce > latest_nonce:
-                logger.info(f"Detected nonce gap: latest={latest_nonce}, pending={current_nonce}")
+            # A gap means our oldest pending transaction holds the latest nonce, so reuse it to replace it
+            if pending_nonce > latest_nonce:
+                logger.info("Detected nonce gap: latest=%s, pending=%s", latest_nonce, pending_nonce)
                 return latest_nonce
 
+            # No pending transactions from this sender, so the pending nonce is the next available one
+            logger.info("No pending transaction to replace, using next available nonce: %s", pending_nonce)
+            return pending_nonce
+
         # If we could not check nonce gaps log the issue
         except Exception as e:
-            logger.warning(f"Could not check nonce gap: {str(e)}")
+            logger.warning("Could not check nonce gap: %s", e)
 
         # Fallback to next available nonce
         nonce = self._execute_rpc_call(self.w3.eth.get_transaction_count, sender_address)
-        logger.info(f"Using next available nonce: {nonce}")
+        logger.info("Using next available nonce: %s", nonce)
         return nonce
 
 
-    def _get_gas_prices(self) -> Tuple[int, int]:
-        """Get base fee and max priority fee for transaction."""
+    def _get_gas_prices(self, latest_block: Optional[BlockData] = None) -> Tuple[int, int]:
+        """
+        Get base fee and max priority fee for transaction.
+
+        Args:
+            latest_block: Optional prefetched latest block, avoiding the RPC call for the base fee
+        """
         # Get current gas prices with detailed logging
         try:
-            latest_block_data = self._execute_rpc_call(self.w3.eth.get_block, "latest")
-            latest_block = cast(BlockData, latest_block_data)
+            if latest_block is None:
+                latest_block = cast(BlockData, self._execute_rpc_call(self.w3.eth.get_block, "latest"))
             base_fee_hex = latest_block["baseFeePerGas"]
             base_fee = int(base_fee_hex) if isinstance(base_fee_hex, int) else int(str(base_fee_hex), 16)
-            logger.info(f"Latest block base fee: {base_fee / 1e9:.2f} gwei")
+            logger.info("Latest block base fee: %.2f gwei", base_fee / 1e9)
 
         # If the base fee cannot be retrieved, use a fallback value
         except Exception as e:
-            logger.warning(f"Could not get base fee: {e}")
+            logger.warning("Could not get base fee: %s", e)
             base_fee = self.w3.to_wei(10, "gwei")
 
         # Try to get the max priority fee
         try:
             max_priority_fee = self._execute_rpc_call(lambda: self.w3.eth.max_priority_fee)
-            logger.info(f"Max priority fee: {max_priority_fee / 1e9:.2f} gwei")
+            logger.info("Max priority fee: %.2f gwei", max_priority_fee / 1e9)
 
         # If the max priority fee cannot be retrieved, use a fallback value
         except Exception as e:
-            logger.warning(f"Could not get max priority fee: {e}")
+            logger.warning("Could not get max priority fee: %s", e)
             max_priority_fee = self.w3.to_wei(2, "gwei")  # fallback
 
         # Return the base fee and max priority fee
@@ -368,7 +651,7 @@ class BlockchainClient:
             max_priority_fee_per_gas = max_priority_fee * 2
             tx_params["maxFeePerGas"] = max_fee_per_gas
             tx_params["maxPriorityFeePerGas"] = max_priority_fee_per_gas
-            logger.info(f"High gas for replacement: {max_fee_per_gas / 1e9:.2f} gwei")
+            logger.info("High gas for replacement: %.2f gwei", max_fee_per_gas / 1e9)
 
         # If we are not replacing a pending transaction, use a lower gas price
         else:
@@ -376,16 +659,16 @@ class BlockchainClient:
             max_priority_fee_per_gas = max_priority_fee
             tx_params["maxFeePerGas"] = max_fee_per_gas
             tx_params["maxPriorityFeePerGas"] = max_priority_fee_per_gas
-            logger.info(f"Standard gas: {max_fee_per_gas / 1e9:.2f} gwei")
+            logger.info("Standard gas: %.2f gwei", max_fee_per_gas / 1e9)
 
-        logger.info(f"Transaction parameters: nonce={nonce}, gas={gas_limit}, chain_id={chain_id}")
+        logger.info("Transaction parameters: nonce=%s, gas=%s, chain_id=%s", nonce, gas_limit, chain_id)
         return tx_params
 
 
     def _build_and_sign_transaction(
         self,
         contract_func: Any,
-        indexer_addresses: List[str],
+        indexer_addresses: List[bytes],
         data_bytes: bytes,
         tx_params: Dict,
         private_key: str,
@@ -400,16 +683,48 @@ class BlockchainClient:
 
         # If building and signing fails, log the error and handle it
         except Exception as e:
-            logger.error(f"Failed to build or sign transaction: {str(e)}")
+            logger.error("Failed to build or sign transaction: %s", e)
             raise
 
 
-    def _send_signed_transaction(self, signed_tx: SignedTransaction) -> str:
+    def _wait_for_transaction_receipt(self, tx_hash: bytes) -> str:
+        """
+        Wait for the receipt of a sent transaction and check that it succeeded.
+
+        Args:
+            tx_hash: The hash of the sent transaction.
+
+        Returns:
+            The transaction hash as a hex string.
+
+        Raises:
+            Exception: If the transaction reverted.
+        """
+        receipt = self._execute_rpc_call(
+            self.w3.eth.wait_for_transaction_receipt,
+            tx_hash,
+            self.tx_timeout_seconds,
+            poll_latency=RECEIPT_POLL_LATENCY_SECONDS,
+        )
+
+        # If the transaction was successful, log the success and return the hash
+        if receipt["status"] == 1:
+            logger.info("Transaction successful: %s0x%s", self.tx_url_prefix, tx_hash.hex())
+            return tx_hash.hex()
+
+        # If the transaction failed, handle the error
+        error_msg = f"Transaction failed: {self.tx_url_prefix}0x{tx_hash.hex()}"
+        logger.error(error_msg)
+        raise Exception(error_msg)
+
+
+    def _send_signed_transaction(self, signed_tx: SignedTransaction, wait_for_receipt: bool = True) -> str:
         """
-        Send a signed transaction and wait for the receipt.
+        Send a signed transaction and, by default, wait for the receipt.
 
         Args:
             signed_tx: The signed transaction to send.
+            wait_for_receipt: If False, return as soon as the transaction has been accepted by the RPC provider.
 
         Returns:
             The transaction hash as a hex string.
@@ -418,23 +733,14 @@ class BlockchainClient:
         try:
             # Send the signed transaction
             tx_hash = self._execute_rpc_call(self.w3.eth.send_raw_transaction, signed_tx.raw_transaction)
-            logger.info(f"Transaction sent with hash: 0x{tx_hash.hex()}")
+            logger.info("Transaction sent with hash: 0x%s", tx_hash.hex())
 
-            # Wait for the transaction receipt
-            receipt = self._execute_rpc_call(
-                self.w3.eth.wait_for_transaction_receipt, tx_hash, self.tx_timeout_seconds
-            )
-
-            # If the transaction was successful, log the success and return the hash
-            if receipt["status"] == 1:
-                logger.info(f"Transaction successful: {self.block_explorer_url}/tx/0x{tx_hash.hex()}")
+            # Return immediately when the caller waits for the receipt itself
+            if not wait_for_receipt:
                 return tx_hash.hex()
 
-            # If the transaction failed, handle the error
-            else:
-                error_msg = f"Transaction failed: {self.block_explorer_url}/tx/0x{tx_hash.hex()}"
-                logger.error(error_msg)
-                raise Exception(error_msg)
+            # Wait for the transaction receipt
+            return self._wait_for_transaction_receipt(tx_hash)
 
         # If the transaction fails, handle the error
         except Exception as e:
@@ -442,17 +748,13 @@ class BlockchainClient:
             logger.error(error_msg)
             raise Exception(error_msg)
 
-        # This part should be unreachable, but it's here for safety.
-        raise Exception("Transaction failed for an unknown reason.")
 
-
-    def _execute_complete_transaction(self, params: Dict) -> str:
+    def _prepare_signed_transaction(self, params: Dict) -> SignedTransaction:
         """
-        Execute the full lifecycle of a blockchain transaction.
+        Prepare a blockchain transaction up to the point of sending it.
 
-        This method orchestrates the entire process of sending a transaction,
-        including parameter validation, gas estimation, nonce determination,
-        transaction building, signing, and sending.
+        This method covers parameter validation, gas estimation, nonce determination,
+        transaction building and signing, so transactions can be prepared ahead of being sent.
 
         Args:
             params (Dict): A dictionary containing all necessary parameters for the transaction.
@@ -462,13 +764,16 @@ class BlockchainClient:
                 - contract_function (str): The name of the contract function to call.
                 - chain_id (int): The ID of the blockchain.
                 - replace (bool): Flag to indicate if a pending transaction should be replaced.
+                - nonce (int, optional): Nonce to use instead of determining it from the sender's nonces.
+                - latest_block (BlockData, optional): Latest block already fetched by the caller. Together with
+                  a nonce, this skips fetching the sender's state again.
 
         Returns:
-            str: The transaction hash of the successful transaction.
+            SignedTransaction: The signed transaction, ready to be sent.
 
         Raises:
             ValueError: If required parameters are missing.
-            Exception: For errors during the transaction process.
+            Exception: For errors while preparing the transaction.
         """
         # Validate required parameters
         required_params = [
@@ -489,10 +794,12 @@ class BlockchainClient:
         contract_function_name = params["contract_function"]
         chain_id = params["chain_id"]
         replace = params["replace"]
+        nonce = params.get("nonce")
+        latest_block = params.get("latest_block")
 
         # 1. Setup account
         sender_address_str, formatted_private_key = self._setup_transaction_account(private_key)
-        sender_address = Web3.to_checksum_address(sender_address_str)
+        sender_address = _to_checksum_address(sender_address_str)
 
         # 2. Get contract function
         if not self.contract or not hasattr(self.contract.functions, contract_function_name):
@@ -501,19 +808,38 @@ class BlockchainClient:
             )
         contract_func = getattr(self.contract.functions, contract_function_name)
 
-        # Log details
-        logger.info(f"Executing transaction for function: {contract_function_name}")
-        balance = self._execute_rpc_call(self.w3.eth.get_balance, sender_address)
-        logger.info(f"Account balance: {self.w3.from_wei(balance, 'ether')} ETH")
-
-        # 3. Estimate gas
-        gas_limit = self._estimate_transaction_gas(contract_func, indexer_addresses, data_bytes, sender_address)
-
-        # 4. Determine nonce
-        nonce = self._determine_transaction_nonce(sender_address, replace)
+        # 3. Unless the caller already has the sender's state, fetch nonces, the latest block, the balance and
+        # the gas estimate in one batched request, when the provider supports it
+        state_from_caller = nonce is not None and latest_block is not None
+        prefetched = None
+        if not state_from_caller:
+            prefetched = self._fetch_transaction_state(
+                sender_address, contract_function_name, [indexer_addresses, data_bytes]
+            )
+            latest_block = prefetched[2] if prefetched else None
+        nonce_counts = prefetched[:2] if prefetched else None
+
+        # Log details. The balance is only logged, so it is not fetched on its own unless it will be shown
+        logger.info("Executing transaction for function: %s", contract_function_name)
+        if prefetched:
+            logger.info("Account balance: %s ETH", self.w3.from_wei(prefetched[3], "ether"))
+        elif not state_from_caller and logger.isEnabledFor(logging.INFO):
+            balance = self._execute_rpc_call(self.w3.eth.get_balance, sender_address)
+            logger.info("Account balance: %s ETH", self.w3.from_wei(balance, "ether"))
+
+        # 4. Estimate gas
+        gas_limit = self._estimate_transaction_gas(
+            contract_func,
+            indexer_addresses,
+            data_bytes,
+            sender_address,
+            estimated_gas=prefetched[4] if prefetched else None,
+        )
 
-        # 5. Get gas prices
-        base_fee, max_priority_fee = self._get_gas_prices()
+        # 5. Determine nonce, unless the caller assigned one, and get gas prices
+        if nonce is None:
+            nonce = self._determine_transaction_nonce(sender_address, replace, nonce_counts=nonce_counts)
+        base_fee, max_priority_fee = self._get_gas_prices(latest_block=latest_block)
 
         # 6. Build transaction parameters
         tx_params = self._build_transaction_params(
@@ -521,12 +847,27 @@ class BlockchainClient:
         )
 
         # 7. Build and sign transaction
-        signed_tx = self._build_and_sign_transaction(
+        return self._build_and_sign_transaction(
             contract_func, indexer_addresses, data_bytes, tx_params, formatted_private_key
         )
 
-        # 8. Send transaction
-        return self._send_signed_transaction(signed_tx)
+
+    def _execute_complete_transaction(self, params: Dict) -> str:
+        """
+        Execute the full lifecycle of a blockchain transaction.
+
+        This method prepares the transaction (see _prepare_signed_transaction for the parameters it takes),
+        then sends it and, by default, waits for the receipt.
+
+        Args:
+            params (Dict): The transaction parameters, plus optionally:
+                - wait_for_receipt (bool, optional): Whether to wait for the receipt, defaults to True.
+
+        Returns:
+            str: The transaction hash of the successful (or, when not waiting, sent) transaction.
+        """
+        signed_tx = self._prepare_signed_transaction(params)
+        return self._send_signed_transaction(signed_tx, wait_for_receipt=params.get("wait_for_receipt", True))
 
 
     def send_transaction_to_allow_indexers(
@@ -537,6 +878,8 @@ class BlockchainClient:
         contract_function: str,
         replace: bool = False,
         data_bytes: bytes = b"",
+        nonce: Optional[int] = None,
+        wait_for_receipt: bool = True,
     ) -> str:
         """
         Sends a single transaction to allow a list of indexers to claim issuance rewards.
@@ -548,31 +891,52 @@ class BlockchainClient:
             contract_function: The specific contract function to be called (e.g., 'allow' or 'disallow').
             replace: If True, attempts to replace a pending transaction.
             data_bytes: Additional data for the transaction, if required.
+            nonce: Nonce to use, if already assigned by the caller. Determined from the chain otherwise.
+            wait_for_receipt: If False, return once the transaction has been sent, without waiting for the receipt.
 
         Returns:
             The hash of the sent transaction.
         """
+        # Group all parameters for the transaction execution
+        transaction_params = self._get_allow_indexers_transaction_params(
+            indexer_addresses, private_key, chain_id, contract_function, replace, data_bytes, nonce
+        )
+        transaction_params["wait_for_receipt"] = wait_for_receipt
+
+        # Execute the transaction and return the hash
+        return self._execute_complete_transaction(transaction_params)
+
+
+    def _get_allow_indexers_transaction_params(
+        self,
+        indexer_addresses: List[str],
+        private_key: str,
+        chain_id: int,
+        contract_function: str,
+        replace: bool,
+        data_bytes: bytes,
+        nonce: Optional[int],
+    ) -> Dict:
+        """Group the parameters of a transaction that allows a list of indexers, ready for execution."""
         logger.info(
-            f"Preparing to send transaction for {len(indexer_addresses)} indexers "
-            f"using function '{contract_function}'."
+            "Preparing to send transaction for %d indexers using function '%s'.",
+            len(indexer_addresses),
+            contract_function,
         )
 
-        # Convert addresses to checksum format
-        checksum_addresses = [Web3.to_checksum_address(addr) for addr in indexer_addresses]
+        # Convert addresses to raw bytes, which the ABI encoder takes without re-checking the checksum
+        address_bytes = [_to_address_bytes(addr) for addr in indexer_addresses]
 
-        # Group all parameters for the transaction execution
-        transaction_params = {
+        return {
             "private_key": private_key,
-            "indexer_addresses": checksum_addresses,
+            "indexer_addresses": address_bytes,
             "data_bytes": data_bytes,
             "contract_function": contract_function,
             "chain_id": chain_id,
             "replace": replace,
+            "nonce": nonce,
         }
 
-        # Execute the transaction and return the hash
-        return self._execute_complete_transaction(transaction_params)
-
 
     def batch_allow_indexers_issuance_eligibility(
         self,
@@ -589,14 +953,16 @@ class BlockchainClient:
 
         This function splits a large list of indexer addresses into smaller batches
         and sends a separate transaction for each batch to manage gas limits and
-        network constraints effectively.
+        network constraints effectively. Batches are given consecutive nonces and prepared
+        concurrently, sent back to back in nonce order, then their receipts are awaited concurrently.
 
         Args:
             indexer_addresses: The full list of indexer addresses to be processed.
             private_key: The private key for signing transactions.
             chain_id: The ID of the blockchain network.
             contract_function: The contract function to be called for each batch.
-            batch_size: The number of indexer addresses to include in each transaction.
+            batch_size: The maximum number of indexer addresses to include in each transaction, lowered when
+                a batch of this size would not fit the block gas limit.
             replace: Flag to indicate if pending transactions should be replaced.
             data_bytes: Additional data for the transaction.
 
@@ -611,35 +977,123 @@ class BlockchainClient:
             current_rpc_provider = self.rpc_providers[self.current_rpc_index]
             return [], current_rpc_provider
 
+        # Drop repeated addresses case-insensitively, keeping each first occurrence as written and in order,
+        # so no gas is spent allowing an indexer twice
+        first_seen_addresses: Dict[str, str] = {}
+        for address in indexer_addresses:
+            first_seen_addresses.setdefault(address.lower(), address)
+        unique_addresses = list(first_seen_addresses.values())
+        if len(unique_addresses) < len(indexer_addresses):
+            logger.info("Removed %d duplicate indexer addresses", len(indexer_addresses) - len(unique_addresses))
+            indexer_addresses = unique_addresses
+
+        # Assign consecutive nonces from one base nonce, so batches can be sent without waiting on each other
+        sender_address_str, _ = self._setup_transaction_account(private_key)
+        sender_address = _to_checksum_address(sender_address_str)
+        prefetched = self._fetch_transaction_state(sender_address)
+        base_nonce = self._determine_transaction_nonce(
+            sender_address, replace, nonce_counts=prefetched[:2] if prefetched else None
+        )
+        latest_block = prefetched[2] if prefetched else None
+        if prefetched:
+            logger.info("Account balance: %s ETH", self.w3.from_wei(prefetched[3], "ether"))
+
+        # Never build a batch that needs more gas than a block can hold
+        batch_size = self._fit_batch_size_to_gas_limit(
+            sender_address,
+            indexer_addresses,
+            contract_function,
+            data_bytes,
+            batch_size,
+            latest_block=latest_block,
+        )
+
+        # Spread the addresses over the fewest batches of at most batch_size, with sizes differing by at most one,
+        # so the day's eligible set never leaves a near-empty last batch paying a whole transaction's overhead
+        batch_count = math.ceil(len(indexer_addresses) / batch_size)
+        base_batch_size, larger_batch_count = divmod(len(indexer_addresses), batch_count)
+        batches = []
+        batch_start = 0
+        for batch_index in range(batch_count):
+            batch_end = batch_start + base_batch_size + (batch_index < larger_batch_count)
+            batches.append(indexer_addresses[batch_start:batch_end])
+            batch_start = batch_end
+
         logger.info(
-            f"Starting batch transaction for {len(indexer_addresses)} indexers, with batch size {batch_size}."
+            "Starting batch transaction for %d indexers in %d batches of at most %d.",
+            len(indexer_addresses),
+            batch_count,
+            len(batches[0]),
         )
 
-        transaction_hashes = []
-        # Process addresses in batches
-        for i in range(0, len(indexer_addresses), batch_size):
-            batch = indexer_addresses[i : i + batch_size]
-            logger.info(f"Processing batch {i // batch_size + 1}: {len(batch)} indexers.")
 
-            try:
-                # Execute the transaction for the current batch
-                tx_hash = self.send_transaction_to_allow_indexers(
-                    batch,
-                    private_key,
-                    chain_id,
-                    contract_function,
-                    replace,
-                    data_bytes,
-                )
-                tx_hash = "0x" + tx_hash
-                tx_url = f"{self.block_explorer_url}/tx/{tx_hash}"
-                transaction_hashes.append(tx_url)
-                logger.info(f"Successfully sent batch {i // batch_size + 1}, tx_hash: {tx_hash}")
+        def prepare_batch(batch_index: int) -> SignedTransaction:
+            params = self._get_allow_indexers_transaction_params(
+                batches[batch_index],
+                private_key,
+                chain_id,
+                contract_function,
+                replace,
+                data_bytes,
+                nonce=base_nonce + batch_index,
+            )
+            params["latest_block"] = latest_block
+            return self._prepare_signed_transaction(params)
 
-            except Exception as e:
-                # Log the error and stop processing further batches
-                logger.error(f"Failed to send batch {i // batch_size + 1}. Halting batch processing. Error: {e}")
-                raise
+        # Prepare the batches concurrently, as each one only depends on its own nonce and the state fetched above
+        sent_tx_hashes = []
+        send_error = None
+        executor = ThreadPoolExecutor(max_workers=min(len(batches), MAX_CONCURRENT_BATCH_PREPARATIONS))
+        try:
+            prepared_batches = [executor.submit(prepare_batch, batch_index) for batch_index in range(len(batches))]
+
+            # Send the batches in nonce order as they become ready, without waiting for their receipts,
+            # stopping at the first batch that cannot be prepared or sent
+            for batch_index, prepared_batch in enumerate(prepared_batches):
+                logger.info("Processing batch %d: %d indexers.", batch_index + 1, len(batches[batch_index]))
+
+                try:
+                    tx_hash = self._send_signed_transaction(prepared_batch.result(), wait_for_receipt=False)
+                    sent_tx_hashes.append(tx_hash)
+
+                except Exception as e:
+                    # Log the error and stop sending further batches
+                    logger.error(
+                        "Failed to send batch %d. Halting batch processing. Error: %s", batch_index + 1, e
+                    )
+                    send_error = e
+                    break
+
+        # Do not prepare batches that will not be sent
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        # Wait for the receipts of all sent batches concurrently, in the order they were sent
+        transaction_hashes = []
+        receipt_error = None
+        if sent_tx_hashes:
+            with ThreadPoolExecutor(
+                max_workers=min(len(sent_tx_hashes), MAX_CONCURRENT_RECEIPT_WAITS)
+            ) as executor:
+                futures = [
+                    executor.submit(self._wait_for_transaction_receipt, bytes.fromhex(tx_hash.removeprefix("0x")))
+                    for tx_hash in sent_tx_hashes
+                ]
+                for batch_number, future in enumerate(futures, start=1):
+                    try:
+                        transaction_hashes.append(self.tx_url_prefix + "0x" + future.result())
+
+                    except Exception as e:
+                        logger.error("Batch %d failed while waiting for its receipt. Error: %s", batch_number, e)
+                        receipt_error = receipt_error or e
+
+        # Log every confirmed batch in a single line rather than one line per batch
+        if transaction_hashes:
+            logger.info("Transaction links (%d):\n%s", len(transaction_hashes), "\n".join(transaction_hashes))
+
+        # Surface the first failure only after every sent batch has been awaited
+        if send_error or receipt_error:
+            raise send_error or receipt_error
 
         # Return transaction hashes and the current RPC provider used
         current_rpc_provider = self.rpc_providers[self.current_rpc_index]
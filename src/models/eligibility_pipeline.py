@@ -3,35 +3,42 @@ Eligibility pipeline module for the Service Quality Oracle.
 
 This module contains the logic for processing raw BigQuery data into a list of eligible indexers. It handles:
 - Parsing and filtering of indexer performance data.
-- Generation of CSV files for record-keeping.
+- Generation of CSV and Parquet files for record-keeping.
 - Cleanup of old data.
 """
 
 import logging
 import shutil
 import time
-from datetime import date, datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of old date directories removed in parallel during cleanup
+CLEANUP_MAX_WORKERS = 4
+
 
 class EligibilityPipeline:
     """Handles the data processing pipeline and file management operations."""
 
-    def __init__(self, project_root: Path):
+    def __init__(self, project_root: Path, archive_raw_data: bool = True):
         """
         Initialize the eligibility pipeline.
 
         Args:
             project_root: Path to project root directory
+            archive_raw_data: Whether the raw BigQuery results are archived alongside the indexer lists
         """
         # Set the project root and output directory
         self.project_root = project_root
         self.output_dir = project_root / "data" / "output"
+        self.archive_raw_data = archive_raw_data
 
 
     def process(self, input_data_from_bigquery: pd.DataFrame, current_date: date) -> Tuple[List[str], List[str]]:
@@ -49,59 +56,130 @@ class EligibilityPipeline:
         required_cols = ["indexer", "eligible_for_indexing_rewards"]
         self.validate_dataframe_structure(input_data_from_bigquery, required_cols)
 
-        # Make a copy to avoid modifying the original DataFrame and prevent SettingWithCopyWarning
-        processed_df = input_data_from_bigquery.copy()
+        # 2. Build the eligibility mask once and partition the indexer column into eligible and ineligible
+        eligible_mask = self._build_eligibility_mask(input_data_from_bigquery["eligible_for_indexing_rewards"])
+        indexers = input_data_from_bigquery["indexer"].to_numpy()
+        eligible_indexers = indexers[eligible_mask]
+        ineligible_indexers = indexers[~eligible_mask]
 
-        # Coerce eligibility column to numeric, treating errors (e.g., non-numeric values) as NaN, then fill with 0
-        processed_df["eligible_for_indexing_rewards"] = pd.to_numeric(
-            processed_df["eligible_for_indexing_rewards"], errors="coerce"
-        ).fillna(0)
+        # 3. Generate and save files, ensuring the original data is used for the raw artifact
+        output_date_dir = self.get_date_output_directory(current_date)
+        self._generate_files(input_data_from_bigquery, eligible_indexers, ineligible_indexers, output_date_dir)
 
-        # 2. Filter data into eligible and ineligible groups
-        eligible_df = processed_df[processed_df["eligible_for_indexing_rewards"] == 1].copy()
+        # 4. Return the lists of indexers
+        return eligible_indexers.tolist(), ineligible_indexers.tolist()
 
-        ineligible_df = processed_df[processed_df["eligible_for_indexing_rewards"] != 1].copy()
 
-        # 3. Generate and save files, ensuring the original data is used for the raw artifact
+    def save_indexer_lists(
+        self, eligible_indexers: List[str], ineligible_indexers: List[str], current_date: date
+    ) -> Tuple[List[str], List[str]]:
+        """
+        Save already-partitioned indexer lists, for runs where the raw BigQuery data is not archived.
+
+        Args:
+            eligible_indexers: Eligible indexer addresses.
+            ineligible_indexers: Ineligible indexer addresses.
+            current_date: The date of the current run, used for creating the output directory.
+
+        Returns:
+            Tuple[List[str], List[str]]: The eligible and ineligible indexer lists, unchanged
+        """
         output_date_dir = self.get_date_output_directory(current_date)
-        self._generate_files(input_data_from_bigquery, eligible_df, ineligible_df, output_date_dir)
+        # Object arrays keep any missing address as None or NaN, rather than turning it into the string "nan"
+        self._generate_files(
+            None,
+            np.asarray(eligible_indexers, dtype=object),
+            np.asarray(ineligible_indexers, dtype=object),
+            output_date_dir,
+        )
+        return eligible_indexers, ineligible_indexers
 
-        # 4. Return the lists of indexers
-        return eligible_df["indexer"].tolist(), ineligible_df["indexer"].tolist()
+
+    def _build_eligibility_mask(self, eligibility_col: pd.Series) -> np.ndarray:
+        """
+        Build a boolean mask marking rows where the eligibility column equals 1.
+
+        Boolean and integer columns are used directly without coercion. Any other dtype is coerced to numeric,
+        treating errors (e.g., non-numeric values) and nulls as ineligible.
+
+        Args:
+            eligibility_col: The eligible_for_indexing_rewards column.
+
+        Returns:
+            np.ndarray: Boolean mask, True for eligible rows.
+        """
+        values = eligibility_col.to_numpy()
+
+        # BigQuery BOOL columns are already the mask we need
+        if values.dtype == np.bool_:
+            return values
+
+        # Plain integer columns cannot hold nulls, so compare directly
+        if values.dtype.kind in "iu":
+            return values == 1
+
+        # Fall back to numeric coercion for floats, strings, objects and nullable extension dtypes
+        numeric = pd.to_numeric(eligibility_col, errors="coerce")
+        return numeric.to_numpy(dtype=float, na_value=np.nan) == 1
 
 
     def _generate_files(
-        self, raw_data: pd.DataFrame, eligible_df: pd.DataFrame, ineligible_df: pd.DataFrame, output_date_dir: Path
+        self,
+        raw_data: Optional[pd.DataFrame],
+        eligible_indexers: np.ndarray,
+        ineligible_indexers: np.ndarray,
+        output_date_dir: Path,
     ) -> None:
         """
-        Save the raw and filtered dataframes to CSV files in a date-specific directory.
-        - indexer_issuance_eligibility_data.csv (raw data)
+        Save the raw data and the partitioned indexer addresses to a date-specific directory.
+        - indexer_issuance_eligibility_data.parquet (raw data, zstd-compressed, skipped if raw_data is None)
         - eligible_indexers.csv (only eligible indexer addresses)
         - ineligible_indexers.csv (only ineligible indexer addresses)
 
         Args:
-            raw_data: The input DataFrame containing all indexer data.
-            eligible_df: DataFrame containing only eligible indexers.
-            ineligible_df: DataFrame containing only ineligible indexers.
+            raw_data: The input DataFrame containing all indexer data, or None to skip archiving it.
+            eligible_indexers: Array of eligible indexer addresses.
+            ineligible_indexers: Array of ineligible indexer addresses.
             output_date_dir: The directory where files will be saved.
         """
         # Ensure the output directory exists, creating parent directories if necessary
         output_date_dir.mkdir(exist_ok=True, parents=True)
 
-        # Save raw data for internal use
-        raw_data_path = output_date_dir / "indexer_issuance_eligibility_data.csv"
-        raw_data.to_csv(raw_data_path, index=False)
-        logger.info(f"Saved raw BigQuery results to: {raw_data_path}")
-
-        # Save filtered data
+        raw_data_path = output_date_dir / "indexer_issuance_eligibility_data.parquet"
         eligible_path = output_date_dir / "eligible_indexers.csv"
         ineligible_path = output_date_dir / "ineligible_indexers.csv"
 
-        eligible_df[["indexer"]].to_csv(eligible_path, index=False)
-        ineligible_df[["indexer"]].to_csv(ineligible_path, index=False)
+        # Save raw data for internal use as compressed Parquet, which is smaller and faster to write than CSV
+        if raw_data is not None:
+            raw_data.to_parquet(raw_data_path, compression="zstd", index=False)
+            logger.info(f"Saved raw BigQuery results to: {raw_data_path}")
+
+        # Save the partitioned indexer addresses
+        self._write_indexer_csv(eligible_path, eligible_indexers)
+        self._write_indexer_csv(ineligible_path, ineligible_indexers)
+        logger.info(f"Saved {len(eligible_indexers)} eligible indexers to: {eligible_path}")
+        logger.info(f"Saved {len(ineligible_indexers)} ineligible indexers to: {ineligible_path}")
+
+
+    def _write_indexer_csv(self, path: Path, indexers: np.ndarray) -> None:
+        """
+        Write a single-column CSV of indexer addresses with an "indexer" header.
+
+        Addresses never need quoting, so the file is joined into one string and written in a single call,
+        rather than formatting each row separately as np.savetxt or the csv module would. Missing addresses are
+        written as empty fields, as DataFrame.to_csv would.
 
-        logger.info(f"Saved {len(eligible_df)} eligible indexers to: {eligible_path}")
-        logger.info(f"Saved {len(ineligible_df)} ineligible indexers to: {ineligible_path}")
+        Args:
+            path: The CSV file to write.
+            indexers: Array of indexer addresses.
+        """
+        rows = indexers.tolist()
+        missing = pd.isna(indexers)
+        if missing.any():
+            rows = ["" if is_missing else str(row) for row, is_missing in zip(rows, missing)]
+
+        with open(path, "w") as f:
+            f.write("\n".join(["indexer", *rows]) + "\n")
 
 
     def clean_old_date_directories(self, max_age_before_deletion: int) -> None:
@@ -122,40 +200,57 @@ class EligibilityPipeline:
             logger.warning(f"Output directory does not exist: {self.output_dir}")
             return
 
-        directories_removed = 0
+        old_directories = []
 
-        # Only process directories with date format YYYY-MM-DD
-        for item in self.output_dir.iterdir():
+        # Only process directories named like YYYY-MM-DD; the glob filters out most other entries up front
+        for item in self.output_dir.glob("[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]"):
             if not item.is_dir():
                 continue
 
             try:
-                # Try to parse the directory name as a date
-                dir_date = datetime.strptime(item.name, "%Y-%m-%d").date()
-                age_days = (today - dir_date).days
-
-                # Remove if older than max_age_before_deletion
-                if age_days > max_age_before_deletion:
-                    logger.info(f"Removing old data directory: {item} ({age_days} days old)")
-                    try:
-                        shutil.rmtree(item)
-                        directories_removed += 1
-                    except (FileNotFoundError, OSError) as e:
-                        # Directory already deleted by another process or became inaccessible
-                        logger.debug(f"Directory {item} already removed or inaccessible: {e}")
-                        continue
-
+                # Build the date directly from the name's fixed-width fields
+                dir_date = date(int(item.name[:4]), int(item.name[5:7]), int(item.name[8:10]))
             except ValueError:
-                # Skip directories that don't match date format
+                # Skip directories that look like dates but are not valid ones (e.g. 2025-13-40)
                 logger.debug(f"Skipping non-date directory: {item.name}")
                 continue
 
+            age_days = (today - dir_date).days
+
+            # Collect directories older than max_age_before_deletion
+            if age_days > max_age_before_deletion:
+                logger.info(f"Removing old data directory: {item} ({age_days} days old)")
+                old_directories.append(item)
+
+        # Remove the old directories concurrently, as each removal is I/O-bound
+        with ThreadPoolExecutor(max_workers=CLEANUP_MAX_WORKERS) as executor:
+            directories_removed = sum(executor.map(self._remove_directory, old_directories))
+
         if directories_removed > 0:
             logger.info(f"Removed {directories_removed} old data directories")
         else:
             logger.info("No old data directories found to remove")
 
 
+    def _remove_directory(self, directory: Path) -> bool:
+        """
+        Remove a directory and its contents.
+
+        Args:
+            directory: Directory to remove
+
+        Returns:
+            bool: True if the directory was removed, False if it was already gone or inaccessible
+        """
+        try:
+            shutil.rmtree(directory)
+            return True
+        except (FileNotFoundError, OSError) as e:
+            # Directory already deleted by another process or became inaccessible
+            logger.debug(f"Directory {directory} already removed or inaccessible: {e}")
+            return False
+
+
     def get_date_output_directory(self, current_date: date) -> Path:
         """
         Get the output directory path for a specific date.
@@ -177,7 +272,7 @@ class EligibilityPipeline:
             current_date: The date to check for existing data
 
         Returns:
-            bool: True if all required CSV files exist and are not empty
+            bool: True if all required data files exist and are not empty
         """
         output_date_dir = self.get_date_output_directory(current_date)
 
@@ -185,12 +280,10 @@ class EligibilityPipeline:
         if not output_date_dir.exists():
             return False
 
-        # Define required files
-        required_files = [
-            "eligible_indexers.csv",
-            "indexer_issuance_eligibility_data.csv",
-            "ineligible_indexers.csv",
-        ]
+        # Define required files, the raw data archive is only expected when it is enabled
+        required_files = ["eligible_indexers.csv", "ineligible_indexers.csv"]
+        if self.archive_raw_data:
+            required_files.append("indexer_issuance_eligibility_data.parquet")
 
         # Check that all required files exist and are not empty
         for filename in required_files:
@@ -217,21 +310,21 @@ class EligibilityPipeline:
             float: Age of the data in minutes (based on oldest file)
 
         Raises:
-            FileNotFoundError: If no CSV files exist for the given date
+            FileNotFoundError: If no data files exist for the given date
         """
         output_date_dir = self.get_date_output_directory(current_date)
 
         if not output_date_dir.exists():
             raise FileNotFoundError(f"No data directory found for date: {current_date}")
 
-        csv_files = list(output_date_dir.glob("*.csv"))
-        if not csv_files:
-            raise FileNotFoundError(f"No CSV files found in directory: {output_date_dir}")
+        data_files = [*output_date_dir.glob("*.csv"), *output_date_dir.glob("*.parquet")]
+        if not data_files:
+            raise FileNotFoundError(f"No data files found in directory: {output_date_dir}")
 
         # Get the oldest file's modification time to be conservative
         # Handle race condition where files could disappear between glob() and stat()
         file_mtimes = []
-        for file in csv_files:
+        for file in data_files:
             try:
                 file_mtimes.append(file.stat().st_mtime)
             except (FileNotFoundError, OSError):
@@ -240,7 +333,7 @@ class EligibilityPipeline:
                 continue
 
         if not file_mtimes:
-            raise FileNotFoundError(f"All CSV files disappeared during age calculation in: {output_date_dir}")
+            raise FileNotFoundError(f"All data files disappeared during age calculation in: {output_date_dir}")
 
         oldest_mtime = min(file_mtimes)
         age_seconds = time.time() - oldest_mtime
@@ -256,7 +349,7 @@ class EligibilityPipeline:
             max_age_minutes: Maximum age in minutes for data to be considered fresh
 
         Returns:
-            bool: True if all required CSV files exist, are complete, and are fresh
+            bool: True if all required data files exist, are complete, and are fresh
         """
         # First check if data exists and is complete
         if not self.has_existing_processed_data(current_date):
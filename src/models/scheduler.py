@@ -1,15 +1,23 @@
+import fcntl
 import logging
 import os
+import signal
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
 
-import pytz
 import schedule
-from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential_jitter
 
 import src.models.service_quality_oracle as oracle
-from src.utils.configuration import credential_manager, load_config, validate_all_required_env_vars
+from src.utils.configuration import (
+    ConfigurationError,
+    credential_manager,
+    invalidate_config_cache,
+    load_config,
+    validate_all_required_env_vars,
+)
 from src.utils.slack_notifier import create_slack_notifier
 
 # Configure logging
@@ -24,11 +32,55 @@ logger = logging.getLogger("oracle-scheduler")
 LAST_RUN_FILE = "/app/data/last_run.txt"
 HEALTHCHECK_FILE = "/app/healthcheck"
 
+# Lock file held for the duration of an oracle run, so scheduler instances sharing /app/data never run concurrently
+ORACLE_LOCK_FILE = "/app/data/oracle.lock"
+
+# Errors that a retry of the oracle run cannot fix, such as missing or invalid configuration
+NON_RETRYABLE_EXCEPTIONS = (ConfigurationError,)
+
+# Longest the scheduler sleeps between heartbeats, well inside the 300s healthcheck staleness limit
+HEARTBEAT_INTERVAL_SECONDS = 120
+
+
+def _write_file_atomically(path, content, durable=False):
+    """
+    Write a file in a single write to a temporary file that is then renamed over it, so readers never see a
+    partially written file. With durable=True the data is fsynced before the rename, so it also survives a crash.
+    """
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w") as f:
+        f.write(content)
+        if durable:
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+
+def _is_retryable_failure(exception):
+    """
+    Decide whether a failed oracle run is worth retrying.
+
+    oracle.main reports a failed run as SystemExit(1) chained to the error that caused it, and a halt by its
+    circuit breaker as SystemExit(0). Only runs that failed with an ordinary, non-configuration error are retried;
+    breaker halts, interrupts and configuration errors end the run straight away.
+    """
+    if isinstance(exception, SystemExit):
+        if not exception.code or exception.__cause__ is None:
+            return False
+        exception = exception.__cause__
+    return isinstance(exception, Exception) and not isinstance(exception, NON_RETRYABLE_EXCEPTIONS)
+
+
+def _raise_keyboard_interrupt(signum, frame):
+    """Turn a termination signal (e.g. from `docker stop`) into KeyboardInterrupt for a graceful shutdown."""
+    raise KeyboardInterrupt(f"Received signal {signum}")
+
 
 class Scheduler:
 
     def __init__(self):
         self.slack_notifier = None
+        self.healthcheck_message = None
         self.config = self.initialize()
 
 
@@ -66,31 +118,48 @@ class Scheduler:
 
 
     def save_last_run_date(self, run_date):
-        """Save the date of the last successful run to a file that we continuously overwrite each time"""
+        """
+        Save the date of the last successful run to a file that we continuously overwrite each time.
+        The file is replaced atomically and durably, so a crash mid-write leaves the previous date intact.
+        """
         try:
             os.makedirs(os.path.dirname(LAST_RUN_FILE), exist_ok=True)
-            with open(LAST_RUN_FILE, "w") as f:
-                f.write(run_date.strftime("%Y-%m-%d"))
+            _write_file_atomically(LAST_RUN_FILE, run_date.strftime("%Y-%m-%d"), durable=True)
         except Exception as e:
             logger.error(f"Error saving last run date: {e}")
 
 
     def update_healthcheck(self, message=None):
-        """Update the healthcheck file with current timestamp and optional message"""
+        """
+        Update the healthcheck file with current timestamp and optional message.
+        The heartbeat is not worth an fsync, as a lost update is simply rewritten on the next one.
+
+        The Docker healthcheck only looks at the file's modification time, so when the message is unchanged
+        since the last update (e.g. repeated heartbeats) the file is only touched instead of rewritten.
+        """
         try:
-            with open(HEALTHCHECK_FILE, "w") as f:
-                timestamp = datetime.now().isoformat()
-                f.write(f"Last update: {timestamp}")
-                if message:
-                    f.write(f"\n{message}")
+            if message is not None and message == self.healthcheck_message:
+                os.utime(HEALTHCHECK_FILE, None)
+                return
+        except OSError:
+            # The file is gone or inaccessible, so rewrite it below
+            pass
+
+        try:
+            content = f"Last update: {datetime.now().isoformat()}"
+            if message:
+                content += f"\n{message}"
+            _write_file_atomically(HEALTHCHECK_FILE, content)
+            self.healthcheck_message = message
         except Exception as e:
+            self.healthcheck_message = None
             logger.warning(f"Failed to update healthcheck file: {e}")
 
 
     @retry(
         stop=stop_after_attempt(5),
-        wait=wait_exponential(multiplier=1, min=60, max=600),
-        retry=retry_if_exception_type(Exception),
+        wait=wait_exponential_jitter(initial=60, max=600, jitter=30),
+        retry=retry_if_exception(_is_retryable_failure),
         before_sleep=lambda retry_state: logger.warning(
             f"Retry attempt {retry_state.attempt_number} after error: {retry_state.outcome.exception()}"
         ),
@@ -107,20 +176,93 @@ class Scheduler:
         start_time = datetime.now()
         logger.info(f"Starting Service Quality Oracle run at {start_time} for date {run_date}")
 
-        # The oracle.main() function handles its own exceptions, notifications, and credential setup.
-        # The scheduler's role is simply to trigger it and handle the retry logic.
-        oracle.main(run_date_override=run_date)
+        # Skip the run if another scheduler instance is already running the oracle. If the lock file cannot be
+        # used at all, e.g. on a read-only data volume, run without it rather than never running the oracle.
+        try:
+            lock_fd = self._acquire_run_lock()
+            if lock_fd is None:
+                logger.warning(f"Another oracle run holds {ORACLE_LOCK_FILE}, skipping the run for {run_date}")
+                return
+        except OSError as e:
+            logger.warning(f"Could not lock {ORACLE_LOCK_FILE}, running the oracle for {run_date} without it: {e}")
+            lock_fd = None
+
+        future = None
+        try:
+            # Pick up any config.toml changes made since the previous run, while the run itself reuses one load
+            invalidate_config_cache()
+
+            # The oracle.main() function handles its own exceptions, notifications, and credential setup.
+            # The scheduler's role is simply to trigger it and handle the retry logic.
+            # It runs in a worker thread so the healthcheck stays fresh during runs longer than the heartbeat.
+            executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="oracle-run")
+            try:
+                future = executor.submit(oracle.main, run_date_override=run_date)
+                while not wait([future], timeout=HEARTBEAT_INTERVAL_SECONDS).done:
+                    self.update_healthcheck(f"Oracle run for {run_date} in progress")
+
+                # Re-raise any failure of the run for the retry logic
+                future.result()
+
+            # On shutdown, let the in-flight run finish rather than abandon it mid-submission
+            except KeyboardInterrupt:
+                logger.warning(f"Shutdown requested, waiting for the oracle run for {run_date} to finish first")
+                raise
+
+            # A halt by the oracle's circuit breaker (exit code 0) must not stop the scheduler, which would leave
+            # the container down, as it only restarts on failure. Skip this run and keep scheduling the next ones.
+            except SystemExit as e:
+                if e.code:
+                    raise
+                logger.warning(f"Oracle run for {run_date} was halted by its circuit breaker, skipping the run")
+                return
+
+            # However the wait ends, join the worker, so a retry or the next run never overlaps this one
+            finally:
+                executor.shutdown(wait=True)
+
+            # If oracle.main() completes without sys.exit, it was successful.
+            # Record successful run and update healthcheck.
+            self.save_last_run_date(run_date)
+            end_time = datetime.now()
+            duration_in_seconds = (end_time - start_time).total_seconds()
+            success_message = (
+                f"Scheduler successfully triggered oracle run for {run_date}. Duration: {duration_in_seconds:.2f}s"
+            )
+            logger.info(success_message)
+            self.update_healthcheck(success_message)
+
+        # Closing the lock file releases the lock. If the worker is still running, e.g. after a second interrupt
+        # while joining it, the lock is only released once the run ends, so no other run can overlap it.
+        finally:
+            if lock_fd is not None and (future is None or future.done()):
+                os.close(lock_fd)
+            elif lock_fd is not None:
+                logger.warning(f"Oracle run for {run_date} is still running, keeping the run lock until it ends")
+                future.add_done_callback(lambda _: os.close(lock_fd))
+
 
-        # If oracle.main() completes without sys.exit, it was successful.
-        # Record successful run and update healthcheck.
-        self.save_last_run_date(run_date)
-        end_time = datetime.now()
-        duration_in_seconds = (end_time - start_time).total_seconds()
-        success_message = (
-            f"Scheduler successfully triggered oracle run for {run_date}. Duration: {duration_in_seconds:.2f}s"
-        )
-        logger.info(success_message)
-        self.update_healthcheck(success_message)
+    def _acquire_run_lock(self):
+        """
+        Take an exclusive, non-blocking lock on the oracle lock file.
+
+        Returns:
+            The locked file descriptor, to be closed to release the lock, or None if another process holds it
+
+        Raises:
+            OSError: If the lock file cannot be created, opened or locked
+        """
+        os.makedirs(os.path.dirname(ORACLE_LOCK_FILE), exist_ok=True)
+        lock_fd = os.open(ORACLE_LOCK_FILE, os.O_RDWR | os.O_CREAT)
+        try:
+            fcntl.flock(lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return lock_fd
+        except BlockingIOError:
+            os.close(lock_fd)
+            return None
+        except OSError:
+            os.close(lock_fd)
+            raise
 
 
     def check_missed_runs(self):
@@ -177,7 +319,6 @@ class Scheduler:
             else:
                 logger.info("Slack notifications disabled for scheduler")
 
-            pytz.timezone("UTC")
             run_time = config["SCHEDULED_RUN_TIME"]
             logger.info(f"Scheduling daily run at {run_time} UTC")
             schedule.every().day.at(run_time).do(self.run_oracle, run_date_override=None)
@@ -211,11 +352,20 @@ class Scheduler:
     def run(self):
         """Main loop for the scheduler"""
         logger.info("Scheduler started and waiting for scheduled runs")
+
+        # Stop the same way on SIGTERM as on Ctrl+C, instead of being killed mid-sleep without a notification
+        signal.signal(signal.SIGTERM, _raise_keyboard_interrupt)
+
         try:
             while True:
                 schedule.run_pending()
                 self.update_healthcheck("Scheduler heartbeat")
-                time.sleep(60)
+
+                # Sleep until the next job is due, waking up in between only to keep the heartbeat fresh
+                idle_seconds = schedule.idle_seconds()
+                if idle_seconds is None:
+                    idle_seconds = HEARTBEAT_INTERVAL_SECONDS
+                time.sleep(min(max(idle_seconds, 0), HEARTBEAT_INTERVAL_SECONDS))
 
         except KeyboardInterrupt:
             logger.info("Scheduler stopped by user")
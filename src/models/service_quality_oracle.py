@@ -10,6 +10,7 @@ This module serves as the entry point for the oracle functionality, responsible
 import logging
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta
 from pathlib import Path
 
@@ -24,10 +25,11 @@ from src.utils.configuration import (
 )
 from src.utils.slack_notifier import create_slack_notifier
 
-# Set up basic logging
-logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
+# Resolved once at import rather than on every run
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
 
 def main(run_date_override: date = None):
     """
@@ -43,7 +45,7 @@ def main(run_date_override: date = None):
     """
     start_time = time.time()
     stage = "Initialization"
-    project_root_path = Path(__file__).resolve().parents[2]
+    project_root_path = PROJECT_ROOT
     slack_notifier = None
 
     # --- Circuit Breaker Initialization and Check ---
@@ -70,19 +72,42 @@ def main(run_date_override: date = None):
 
         credential_manager.setup_google_credentials()
 
+        # Connect to the blockchain in the background, hiding the RPC provider probes behind the data stages
+        logger.info("Instantiating BlockchainClient...")
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="blockchain-client")
+        blockchain_client_future = executor.submit(
+            BlockchainClient,
+            rpc_providers=config["BLOCKCHAIN_RPC_URLS"],
+            contract_address=config["BLOCKCHAIN_CONTRACT_ADDRESS"],
+            project_root=project_root_path,
+            block_explorer_url=config["BLOCK_EXPLORER_URL"],
+            tx_timeout_seconds=config["TX_TIMEOUT_SECONDS"],
+            slack_notifier=slack_notifier,
+        )
+        executor.shutdown(wait=False)
+
         # Define the date for the current run
         current_run_date = run_date_override or date.today()
         start_date = current_run_date - timedelta(days=config["BIGQUERY_ANALYSIS_PERIOD_DAYS"])
         end_date = current_run_date
 
+        # Archiving the raw BigQuery results requires fetching every metric, otherwise only addresses are fetched.
+        # Archiving is on unless explicitly disabled
+        archive_raw_data = config.get("ARCHIVE_RAW_BIGQUERY_DATA") is not False
+
         # Initialize pipeline early to check for cached data
-        pipeline = EligibilityPipeline(project_root=project_root_path)
+        pipeline = EligibilityPipeline(project_root=project_root_path, archive_raw_data=archive_raw_data)
 
         # Check for fresh cached data first (30 minutes by default)
         cache_max_age_minutes = int(config.get("CACHE_MAX_AGE_MINUTES", 30))
         force_refresh = config.get("FORCE_BIGQUERY_REFRESH", "false").lower() == "true"
 
-        if not force_refresh and pipeline.has_fresh_processed_data(current_run_date, cache_max_age_minutes):
+        # Check the cache once, as it stats every data file and its answer does not change within the run
+        use_cached_data = not force_refresh and pipeline.has_fresh_processed_data(
+            current_run_date, cache_max_age_minutes
+        )
+
+        if use_cached_data:
             # --- Use Cached Data Path ---
             stage = "Loading Cached Data"
             logger.info(f"Using cached data for {current_run_date} (fresh within {cache_max_age_minutes} minutes)")
@@ -97,7 +122,7 @@ def main(run_date_override: date = None):
                 logger.warning(f"Failed to load cached data: {cache_error}. Falling back to BigQuery.")
                 force_refresh = True
 
-        if force_refresh or not pipeline.has_fresh_processed_data(current_run_date, cache_max_age_minutes):
+        if force_refresh or not use_cached_data:
             # --- Fresh Data Path (BigQuery + Processing) ---
             stage = "Data Fetching from BigQuery"
             reason = "forced refresh" if force_refresh else "no fresh cached data available"
@@ -117,15 +142,34 @@ def main(run_date_override: date = None):
                 max_latency_ms=config["MAX_LATENCY_MS"],
                 max_blocks_behind=config["MAX_BLOCKS_BEHIND"],
             )
-            eligibility_data = bigquery_provider.fetch_indexer_issuance_eligibility_data(start_date, end_date)
-            logger.info(f"Successfully fetched data for {len(eligibility_data)} indexers from BigQuery.")
-
-            # --- Data Processing Stage ---
-            stage = "Data Processing and Artifact Generation"
-            eligible_indexers, _ = pipeline.process(
-                input_data_from_bigquery=eligibility_data,
-                current_date=current_run_date,
-            )
+            if archive_raw_data:
+                eligibility_data = bigquery_provider.fetch_indexer_issuance_eligibility_data(start_date, end_date)
+                logger.info(f"Successfully fetched data for {len(eligibility_data)} indexers from BigQuery.")
+
+                # --- Data Processing Stage ---
+                stage = "Data Processing and Artifact Generation"
+                eligible_indexers, _ = pipeline.process(
+                    input_data_from_bigquery=eligibility_data,
+                    current_date=current_run_date,
+                )
+
+            else:
+                indexers_by_eligibility = bigquery_provider.fetch_indexer_addresses_by_eligibility(
+                    start_date, end_date
+                )
+                logger.info(
+                    f"Successfully fetched addresses for {sum(map(len, indexers_by_eligibility.values()))} "
+                    "indexers from BigQuery."
+                )
+
+                # --- Artifact Generation Stage ---
+                stage = "Data Processing and Artifact Generation"
+                eligible_indexers, _ = pipeline.save_indexer_lists(
+                    eligible_indexers=indexers_by_eligibility[1],
+                    ineligible_indexers=indexers_by_eligibility[0],
+                    current_date=current_run_date,
+                )
+
             logger.info(f"Found {len(eligible_indexers)} eligible indexers after processing.")
 
         # Clean up old data directories (run this regardless of cache hit/miss)
@@ -133,15 +177,7 @@ def main(run_date_override: date = None):
 
         # --- Blockchain Submission Stage ---
         stage = "Blockchain Submission"
-        logger.info("Instantiating BlockchainClient...")
-        blockchain_client = BlockchainClient(
-            rpc_providers=config["BLOCKCHAIN_RPC_URLS"],
-            contract_address=config["BLOCKCHAIN_CONTRACT_ADDRESS"],
-            project_root=project_root_path,
-            block_explorer_url=config["BLOCK_EXPLORER_URL"],
-            tx_timeout_seconds=config["TX_TIMEOUT_SECONDS"],
-            slack_notifier=slack_notifier,
-        )
+        blockchain_client = blockchain_client_future.result()
         transaction_links, rpc_provider_used = blockchain_client.batch_allow_indexers_issuance_eligibility(
             indexer_addresses=eligible_indexers,
             private_key=config["PRIVATE_KEY"],
@@ -192,8 +228,11 @@ def main(run_date_override: date = None):
                     exc_info=True,
                 )
 
-        sys.exit(1)
+        # Chain the error, so the scheduler can tell a transient failure from a configuration error
+        raise SystemExit(1) from e
 
 
 if __name__ == "__main__":
+    # Set up basic logging only when run directly, as the scheduler configures logging when it imports this module
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
     main()
@@ -2,13 +2,41 @@
 Application circuit breaker utility to prevent infinite restart loops.
 """
 
+import bisect
 import logging
-from datetime import datetime, timedelta
+import os
+import time
+from datetime import datetime
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Union
 
 logger = logging.getLogger(__name__)
 
+# Size above which the failure log is rewritten to drop entries too old to ever open the circuit again
+MAX_LOG_FILE_BYTES = 64 * 1024
+
+# Bytes read from the end of the failure log on a check, enough for hundreds of entries
+LOG_TAIL_BYTES = 4096
+
+
+def _parse_failure_timestamp(entry: Union[str, bytes]) -> Optional[int]:
+    """
+    Parse a failure log entry, written as Unix epoch seconds or, by older versions, as a local ISO datetime.
+
+    Returns:
+        Optional[int]: The failure timestamp as Unix epoch seconds, or None if the entry cannot be parsed.
+    """
+    try:
+        return int(entry)
+    except ValueError:
+        pass
+
+    try:
+        text = entry.decode() if isinstance(entry, bytes) else entry
+        return int(datetime.fromisoformat(text).timestamp())
+    except ValueError:
+        return None
+
 
 class CircuitBreaker:
     """
@@ -33,30 +61,74 @@ class CircuitBreaker:
         self.window_minutes = window_minutes
         self.log_file = log_file
 
+        # Cleared once the log file is seen to be missing and set again when a failure is written to it,
+        # so reset() can skip the filesystem on the common path where nothing ever failed
+        self._log_file_may_exist = True
 
-    def _get_failure_timestamps(self) -> List[datetime]:
+
+    def _get_failure_timestamps(self) -> List[int]:
         """
-        Reads and parses all timestamps from the log file.
+        Reads and parses the most recent timestamps from the log file. Only the last `failure_threshold` entries
+        can decide whether the circuit is open, so only the end of the file is read unless it holds fewer entries.
 
         Returns:
-            List[datetime]: A list of datetime objects representing the failure timestamps.
+            List[int]: The failure timestamps as Unix epoch seconds, oldest first.
         """
         # If the log file does not exist, return an empty list
         if not self.log_file.exists():
+            self._log_file_may_exist = False
             return []
 
-        # If the log file exists, read and parse all timestamps
+        # If the log file exists, read and parse the timestamps at its tail
         try:
-            with self.log_file.open("r") as f:
-                timestamps = [datetime.fromisoformat(line.strip()) for line in f if line.strip()]
-            return timestamps
-
-        # If there is an error reading or parsing the log file, log the error and return an empty list
-        except (IOError, ValueError) as e:
-            logger.error(f"Error reading or parsing circuit breaker log file {self.log_file}: {e}")
+            with self.log_file.open("rb") as f:
+                tail_start = max(0, self.log_file.stat().st_size - LOG_TAIL_BYTES)
+                f.seek(tail_start)
+                entries = f.read().split()
+
+                # The first entry of a partial read may be cut off, so drop it and reread if too few remain
+                if tail_start > 0:
+                    timestamps = self._parse_recent_timestamps(entries[1:])
+                    if len(timestamps) < self.failure_threshold:
+                        f.seek(0)
+                        timestamps = self._parse_recent_timestamps(f.read().split())
+                    return timestamps
+
+            return self._parse_recent_timestamps(entries)
+
+        # If there is an error reading the log file, log the error and return an empty list
+        except IOError as e:
+            logger.error(f"Error reading circuit breaker log file {self.log_file}: {e}")
             return []
 
 
+    def _parse_recent_timestamps(self, entries: List[bytes]) -> List[int]:
+        """
+        Parses the last `failure_threshold` timestamps among the log entries, skipping entries that cannot be
+        parsed rather than discarding every failure recorded alongside them.
+
+        Returns:
+            List[int]: The parsed failure timestamps, oldest first.
+        """
+        timestamps = []
+        skipped_count = 0
+        for entry in reversed(entries):
+            timestamp = _parse_failure_timestamp(entry)
+            if timestamp is None:
+                skipped_count += 1
+                continue
+
+            timestamps.append(timestamp)
+            if len(timestamps) == self.failure_threshold:
+                break
+
+        if skipped_count:
+            logger.warning(f"Skipped {skipped_count} unparseable entries in circuit breaker log {self.log_file}")
+
+        timestamps.reverse()
+        return timestamps
+
+
     def check(self) -> bool:
         """
         Check the state of the circuit. This is used to determine if the application should proceed or halt.
@@ -71,14 +143,14 @@ class CircuitBreaker:
         if not timestamps:
             return True
 
-        # Calculate the window start time and get the recent failures
-        window_start = datetime.now() - timedelta(minutes=self.window_minutes)
-        recent_failures = [ts for ts in timestamps if ts > window_start]
+        # Calculate the window start time and count the recent failures, which sit at the end of the sorted log
+        window_start = int(time.time()) - self.window_minutes * 60
+        recent_count = len(timestamps) - bisect.bisect_right(timestamps, window_start)
 
         # If the number of recent failures is greater than or equal to the failure threshold, return False
-        if len(recent_failures) >= self.failure_threshold:
+        if recent_count >= self.failure_threshold:
             logger.critical(
-                f"CIRCUIT BREAKER OPEN: Found {len(recent_failures)} failures in the last "
+                f"CIRCUIT BREAKER OPEN: Found {recent_count} failures in the last "
                 f"{self.window_minutes} minutes (threshold is {self.failure_threshold}). Halting execution."
             )
             return False
@@ -89,7 +161,7 @@ class CircuitBreaker:
 
 
     def record_failure(self) -> None:
-        """Records a failure by appending the current timestamp to the log file.
+        """Records a failure by appending the current Unix epoch timestamp to the log file.
 
         Returns:
             None
@@ -100,23 +172,57 @@ class CircuitBreaker:
             self.log_file.parent.mkdir(parents=True, exist_ok=True)
 
             # Append the current timestamp to the log file
+            self._log_file_may_exist = True
             with self.log_file.open("a") as f:
-                f.write(f"{datetime.now().isoformat()}\n")
+                f.write(f"{int(time.time())}\n")
 
             # Log the success
             logger.warning("Circuit breaker has recorded a failure.")
 
+            # Keep the log bounded in deployments that keep failing without a successful run to reset it
+            if self.log_file.stat().st_size > MAX_LOG_FILE_BYTES:
+                self._truncate_log()
+
         # If there is an error appending the timestamp to the log file, log the error
         except IOError as e:
             logger.error(f"Failed to record failure to circuit breaker log {self.log_file}: {e}")
 
 
+    def _truncate_log(self) -> None:
+        """
+        Rewrites the log file atomically, keeping only the entries from the last two failure windows.
+        Unparseable entries are dropped as well, and entries in the older ISO format are rewritten as epoch
+        seconds.
+
+        Returns:
+            None
+        """
+        keep_after = int(time.time()) - 2 * self.window_minutes * 60
+        kept_lines = []
+        with self.log_file.open("r") as f:
+            for line in f:
+                timestamp = _parse_failure_timestamp(line.strip())
+                if timestamp is not None and timestamp > keep_after:
+                    kept_lines.append(f"{timestamp}\n")
+
+        # Write the kept entries to a temporary file that replaces the log in one step
+        temp_file = self.log_file.with_name(f"{self.log_file.name}.tmp")
+        with temp_file.open("w") as f:
+            f.writelines(kept_lines)
+        os.replace(temp_file, self.log_file)
+        logger.info(f"Truncated circuit breaker log {self.log_file} to {len(kept_lines)} recent entries.")
+
+
     def reset(self) -> None:
         """Resets the circuit by deleting the log file on a successful run.
 
         Returns:
             None
         """
+        # If no failure was recorded since the log file was seen to be missing, there is nothing to delete
+        if not self._log_file_may_exist:
+            return
+
         # If the log file exists, delete it
         if self.log_file.exists():
             try:
@@ -2,18 +2,19 @@
 Centralized configuration and credential management for the Service Quality Oracle.
 """
 
-import json
+import hashlib
 import logging
 import os
 import re
 import sys
-from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, ClassVar, Optional
 
 import google.auth
 from google.oauth2 import service_account
 from google.oauth2.credentials import Credentials
+from orjson import loads as json_loads
 
 # Handle Python version compatibility for TOML loading
 if sys.version_info >= (3, 11):
@@ -23,6 +24,9 @@ else:
 
 logger = logging.getLogger(__name__)
 
+# Zero-padded 24-hour HH:MM, the format the scheduler expects for SCHEDULED_RUN_TIME
+_SCHEDULED_RUN_TIME_PATTERN = re.compile(r"(?:[01]\d|2[0-3]):[0-5]\d")
+
 
 class ConfigurationError(Exception):
     """Raised when configuration loading or validation fails."""
@@ -33,34 +37,118 @@ class ConfigurationError(Exception):
 # --- Configuration Loading ---
 
 
+def _to_int(value: Any) -> Optional[int]:
+    """Safely convert a config value to an integer, treating None and empty strings as unset."""
+    return int(value) if value is not None and value != "" else None
+
+
+def _to_bool(value: Any) -> Optional[bool]:
+    """Convert a "true" or "false" config value to a boolean, treating None and empty strings as unset."""
+    if isinstance(value, bool):
+        return value
+    if value is None or value == "":
+        return None
+    normalized = str(value).strip().lower()
+    if normalized not in ("true", "false"):
+        raise ConfigurationError(f"Expected 'true' or 'false', got {value!r}")
+    return normalized == "true"
+
+
+# fmt: off
+# Flat config keys built from config.toml, as (flat key, section, TOML key, converter applied to the value).
+# BLOCKCHAIN_RPC_URLS is not listed, as get_flat_config parses it separately.
+_FLAT_CONFIG_SPEC = (
+    # BigQuery settings
+    ("BIGQUERY_LOCATION_ID", "bigquery", "BIGQUERY_LOCATION_ID", None),
+    ("BIGQUERY_PROJECT_ID", "bigquery", "BIGQUERY_PROJECT_ID", None),
+    ("BIGQUERY_DATASET_ID", "bigquery", "BIGQUERY_DATASET_ID", None),
+    ("BIGQUERY_TABLE_ID", "bigquery", "BIGQUERY_TABLE_ID", None),
+
+    # Eligibility Criteria
+    ("MIN_ONLINE_DAYS", "eligibility_criteria", "MIN_ONLINE_DAYS", _to_int),
+    ("MIN_SUBGRAPHS", "eligibility_criteria", "MIN_SUBGRAPHS", _to_int),
+    ("MAX_LATENCY_MS", "eligibility_criteria", "MAX_LATENCY_MS", _to_int),
+    ("MAX_BLOCKS_BEHIND", "eligibility_criteria", "MAX_BLOCKS_BEHIND", _to_int),
+
+    # Blockchain settings
+    ("BLOCKCHAIN_CONTRACT_ADDRESS", "blockchain", "BLOCKCHAIN_CONTRACT_ADDRESS", None),
+    ("BLOCKCHAIN_FUNCTION_NAME", "blockchain", "BLOCKCHAIN_FUNCTION_NAME", None),
+    ("BLOCKCHAIN_CHAIN_ID", "blockchain", "BLOCKCHAIN_CHAIN_ID", _to_int),
+    ("BLOCK_EXPLORER_URL", "blockchain", "BLOCK_EXPLORER_URL", None),
+    ("TX_TIMEOUT_SECONDS", "blockchain", "TX_TIMEOUT_SECONDS", _to_int),
+
+    # Scheduling
+    ("SCHEDULED_RUN_TIME", "scheduling", "SCHEDULED_RUN_TIME", None),
+
+    # Subgraph URLs
+    ("SUBGRAPH_URL_PRE_PRODUCTION", "subgraph", "SUBGRAPH_URL_PRE_PRODUCTION", None),
+    ("SUBGRAPH_URL_PRODUCTION", "subgraph", "SUBGRAPH_URL_PRODUCTION", None),
+
+    # Processing settings
+    ("BATCH_SIZE", "processing", "BATCH_SIZE", _to_int),
+    ("MAX_AGE_BEFORE_DELETION", "processing", "MAX_AGE_BEFORE_DELETION", _to_int),
+    ("BIGQUERY_ANALYSIS_PERIOD_DAYS", "processing", "BIGQUERY_ANALYSIS_PERIOD_DAYS", _to_int),
+    ("ARCHIVE_RAW_BIGQUERY_DATA", "processing", "ARCHIVE_RAW_BIGQUERY_DATA", _to_bool),
+
+    # Secrets
+    ("GOOGLE_APPLICATION_CREDENTIALS", "secrets", "GOOGLE_APPLICATION_CREDENTIALS", None),
+    ("PRIVATE_KEY", "secrets", "BLOCKCHAIN_PRIVATE_KEY", None),
+    ("STUDIO_API_KEY", "secrets", "STUDIO_API_KEY", None),
+    ("STUDIO_DEPLOY_KEY", "secrets", "STUDIO_DEPLOY_KEY", None),
+    ("SLACK_WEBHOOK_URL", "secrets", "SLACK_WEBHOOK_URL", None),
+    ("ETHERSCAN_API_KEY", "secrets", "ETHERSCAN_API_KEY", None),
+    ("ARBITRUM_API_KEY", "secrets", "ARBITRUM_API_KEY", None),
+)
+# fmt: on
+
+# Config sections read by get_flat_config
+_FLAT_CONFIG_SECTIONS = frozenset(section for _, section, _, _ in _FLAT_CONFIG_SPEC)
+
+
+# The most recently parsed config.toml, keyed on its path, modification time and size
+_raw_config_cache: dict[tuple[str, int, int], dict] = {}
+
+
+@lru_cache(maxsize=1)
+def _find_default_config_path() -> str:
+    """Find the default configuration template path. Only a successful lookup is cached."""
+    # Check if we're in a Docker container
+    docker_path = Path("/app/config.toml")
+    if docker_path.exists():
+        return str(docker_path)
+
+    # For local development, look in project root
+    current_path = Path(__file__).parent
+    while current_path != current_path.parent:
+        config_path = current_path / "config.toml"
+        if config_path.exists():
+            return str(config_path)
+        current_path = current_path.parent
+
+    raise ConfigurationError("Could not find config.toml in project root or Docker container")
+
+
 class ConfigLoader:
     """Internal class to load configuration from TOML and environment variables."""
 
+    # $VARIABLE_NAME references to environment variables, compiled once for all loaders
+    _env_var_pattern: ClassVar[re.Pattern] = re.compile(r"\$([A-Z_][A-Z0-9_]*)")
+
     def __init__(self, config_path: Optional[str] = None):
         """Initialize the config loader"""
         self.config_path = config_path or self._get_default_config_path()
-        self._env_var_pattern = re.compile(r"\$([A-Z_][A-Z0-9_]*)")
 
+        # Parsed TOML and the env vars it references, computed once per loader on first use
+        self._raw: Optional[dict] = None
+        self._required_env_vars: Optional[frozenset[str]] = None
 
-    def _get_default_config_path(self) -> str:
-        """Get the default configuration template path."""
-        # Check if we're in a Docker container
-        docker_path = Path("/app/config.toml")
-        if docker_path.exists():
-            return str(docker_path)
-
-        # For local development, look in project root
-        current_path = Path(__file__).parent
-        while current_path != current_path.parent:
-            config_path = current_path / "config.toml"
-            if config_path.exists():
-                return str(config_path)
-            current_path = current_path.parent
 
-        raise ConfigurationError("Could not find config.toml in project root or Docker container")
+    def _get_default_config_path(self) -> str:
+        """Get the default configuration template path, which is looked up once per process."""
+        return _find_default_config_path()
 
 
-    def _substitute_env_vars(self, config_toml: Any) -> Any:
+    def _substitute_env_vars(self, config_toml: Any, resolved: Optional[dict[str, str]] = None) -> Any:
         """
         Recursively substitute environment variables in the config.
 
@@ -68,6 +156,7 @@ class ConfigLoader:
 
         Args:
             config_toml: config file to process
+            resolved: env var values already looked up during this substitution, shared across the recursion
 
         Returns:
             Processed config with environment variables substituted
@@ -75,39 +164,65 @@ class ConfigLoader:
         Raises:
             ConfigurationError: If required environment variable is missing
         """
-        if isinstance(config_toml, str):
-            # Find all environment variable references
-            env_vars = self._env_var_pattern.findall(config_toml)
+        if resolved is None:
+            resolved = {}
 
-            for env_var in env_vars:
-                env_value = os.getenv(env_var)
-                if env_value is None:
-                    raise ConfigurationError(f"Required environment variable {env_var} is not set")
+        if isinstance(config_toml, str):
+            # Most values reference no environment variable, so skip the regex for them
+            if "$" not in config_toml:
+                return config_toml
 
-                # Replace the environment variable reference with actual value
-                config_toml = config_toml.replace(f"${env_var}", env_value)
+            # A value that is a single reference, like "$BLOCKCHAIN_PRIVATE_KEY", is the variable's value itself
+            if config_toml[0] == "$":
+                match = self._env_var_pattern.fullmatch(config_toml)
+                if match:
+                    return self._get_env_var_value(match, resolved)
 
-            return config_toml
+            # Replace every environment variable reference in a single pass over the string
+            return self._env_var_pattern.sub(lambda match: self._get_env_var_value(match, resolved), config_toml)
 
         elif isinstance(config_toml, dict):
-            return {k: self._substitute_env_vars(v) for k, v in config_toml.items()}
+            return {k: self._substitute_env_vars(v, resolved) for k, v in config_toml.items()}
 
         elif isinstance(config_toml, list):
-            return [self._substitute_env_vars(item) for item in config_toml]
+            return [self._substitute_env_vars(item, resolved) for item in config_toml]
 
         return config_toml
 
 
+    def _get_env_var_value(self, match: re.Match, resolved: dict[str, str]) -> str:
+        """Return the value of the environment variable referenced by a $VARIABLE_NAME match, reading it once."""
+        env_var = match.group(1)
+        env_value = resolved.get(env_var)
+        if env_value is None:
+            env_value = os.environ.get(env_var)
+            if env_value is None:
+                raise ConfigurationError(f"Required environment variable {env_var} is not set")
+            resolved[env_var] = env_value
+        return env_value
+
+
     def _get_raw_config(self) -> dict:
         """
-        Get raw configuration from TOML file.
+        Get raw configuration from TOML file, parsing it only on the first call.
+        The parsed file is also shared with later loaders until the file changes. It is never mutated.
 
         Returns:
             toml file as a dictionary
         """
+        if self._raw is not None:
+            return self._raw
+
         try:
             with open(self.config_path, "rb") as f:
-                return tomllib.load(f)
+                file_stat = os.fstat(f.fileno())
+                cache_key = (self.config_path, file_stat.st_mtime_ns, file_stat.st_size)
+                self._raw = _raw_config_cache.get(cache_key)
+                if self._raw is None:
+                    self._raw = tomllib.load(f)
+                    _raw_config_cache.clear()
+                    _raw_config_cache[cache_key] = self._raw
+                return self._raw
 
         except FileNotFoundError as e:
             raise ConfigurationError(f"Configuration not found: {self.config_path}") from e
@@ -126,151 +241,109 @@ class ConfigLoader:
         raw_config = self._get_raw_config()
         substituted_config = self._substitute_env_vars(raw_config)
 
-        # Helper to safely convert values to integers
-
-
-        def to_int(v):
-            return int(v) if v is not None and v != "" else None
-
-        # fmt: off
-        # Convert nested structure to flat format
-        return {
-            # BigQuery settings
-            "BIGQUERY_LOCATION_ID": substituted_config.get("bigquery", {}).get("BIGQUERY_LOCATION_ID"),
-            "BIGQUERY_PROJECT_ID": substituted_config.get("bigquery", {}).get("BIGQUERY_PROJECT_ID"),
-            "BIGQUERY_DATASET_ID": substituted_config.get("bigquery", {}).get("BIGQUERY_DATASET_ID"),
-            "BIGQUERY_TABLE_ID": substituted_config.get("bigquery", {}).get("BIGQUERY_TABLE_ID"),
-
-            # Eligibility Criteria
-            "MIN_ONLINE_DAYS": to_int(substituted_config.get("eligibility_criteria", {}).get("MIN_ONLINE_DAYS")),
-            "MIN_SUBGRAPHS": to_int(substituted_config.get("eligibility_criteria", {}).get("MIN_SUBGRAPHS")),
-            "MAX_LATENCY_MS": to_int(substituted_config.get("eligibility_criteria", {}).get("MAX_LATENCY_MS")),
-            "MAX_BLOCKS_BEHIND": to_int(
-                substituted_config.get("eligibility_criteria", {}).get("MAX_BLOCKS_BEHIND")
-            ),
-
-            # Blockchain settings
-            "BLOCKCHAIN_CONTRACT_ADDRESS": substituted_config.get("blockchain", {}).get(
-                "BLOCKCHAIN_CONTRACT_ADDRESS"
-            ),
-            "BLOCKCHAIN_FUNCTION_NAME": substituted_config.get("blockchain", {}).get("BLOCKCHAIN_FUNCTION_NAME"),
-            "BLOCKCHAIN_CHAIN_ID": to_int(substituted_config.get("blockchain", {}).get("BLOCKCHAIN_CHAIN_ID")),
-            "BLOCKCHAIN_RPC_URLS": self._parse_rpc_urls(
-                substituted_config.get("blockchain", {}).get("BLOCKCHAIN_RPC_URLS")
-            ),
-            "BLOCK_EXPLORER_URL": substituted_config.get("blockchain", {}).get("BLOCK_EXPLORER_URL"),
-            "TX_TIMEOUT_SECONDS": to_int(substituted_config.get("blockchain", {}).get("TX_TIMEOUT_SECONDS")),
-
-            # Scheduling
-            "SCHEDULED_RUN_TIME": substituted_config.get("scheduling", {}).get("SCHEDULED_RUN_TIME"),
-
-            # Subgraph URLs
-            "SUBGRAPH_URL_PRE_PRODUCTION": substituted_config.get("subgraph", {}).get(
-                "SUBGRAPH_URL_PRE_PRODUCTION"
-            ),
-            "SUBGRAPH_URL_PRODUCTION": substituted_config.get("subgraph", {}).get("SUBGRAPH_URL_PRODUCTION"),
-
-            # Processing settings
-            "BATCH_SIZE": to_int(substituted_config.get("processing", {}).get("BATCH_SIZE")),
-            "MAX_AGE_BEFORE_DELETION": to_int(
-                substituted_config.get("processing", {}).get("MAX_AGE_BEFORE_DELETION")
-            ),
-            "BIGQUERY_ANALYSIS_PERIOD_DAYS": to_int(
-                substituted_config.get("processing", {}).get("BIGQUERY_ANALYSIS_PERIOD_DAYS")
-            ),
-
-            # Secrets
-            "GOOGLE_APPLICATION_CREDENTIALS": substituted_config.get("secrets", {}).get(
-                "GOOGLE_APPLICATION_CREDENTIALS"
-            ),
-            "PRIVATE_KEY": substituted_config.get("secrets", {}).get("BLOCKCHAIN_PRIVATE_KEY"),
-            "STUDIO_API_KEY": substituted_config.get("secrets", {}).get("STUDIO_API_KEY"),
-            "STUDIO_DEPLOY_KEY": substituted_config.get("secrets", {}).get("STUDIO_DEPLOY_KEY"),
-            "SLACK_WEBHOOK_URL": substituted_config.get("secrets", {}).get("SLACK_WEBHOOK_URL"),
-            "ETHERSCAN_API_KEY": substituted_config.get("secrets", {}).get("ETHERSCAN_API_KEY"),
-            "ARBITRUM_API_KEY": substituted_config.get("secrets", {}).get("ARBITRUM_API_KEY"),
-        }
-        # fmt: on
+        # Look up each config section once, then read every flat key from its section
+        sections = {section: substituted_config.get(section, {}) for section in _FLAT_CONFIG_SECTIONS}
+        flat_config = {}
+        for flat_key, section, toml_key, convert in _FLAT_CONFIG_SPEC:
+            value = sections[section].get(toml_key)
+            try:
+                flat_config[flat_key] = convert(value) if convert else value
+            except ConfigurationError as e:
+                raise ConfigurationError(f"Invalid value for {flat_key}: {e}") from e
+
+        flat_config["BLOCKCHAIN_RPC_URLS"] = self._parse_rpc_urls(
+            sections["blockchain"].get("BLOCKCHAIN_RPC_URLS")
+        )
+        return flat_config
 
 
     def _parse_rpc_urls(self, rpc_urls: Optional[list]) -> list[str]:
-        """Parse RPC URLs from list format."""
-        if not rpc_urls or not isinstance(rpc_urls, list) or not all(isinstance(url, str) for url in rpc_urls):
+        """Parse RPC URLs from list format, type-checking and stripping each URL in a single pass."""
+        if not isinstance(rpc_urls, list):
             return []
 
-        valid_providers = [url.strip() for url in rpc_urls if url.strip()]
-        if not valid_providers:
-            return []
+        valid_providers = []
+        for url in rpc_urls:
+            # A single non-string entry invalidates the whole list
+            if not isinstance(url, str):
+                return []
+
+            stripped_url = url.strip()
+            if stripped_url:
+                valid_providers.append(stripped_url)
 
         return valid_providers
 
 
-    def _collect_missing_env_vars(self, obj: Any) -> list[str]:
+    def _collect_env_var_references(self, obj: Any, env_vars: set[str]) -> None:
         """
-        Collect all missing environment variables from config object.
+        Collect the names of all environment variables referenced in a config object.
 
         Args:
-            obj: config object to collect missing environment variables from
-
-        Returns:
-            list of missing environment variables (if any)
+            obj: config object to collect environment variable references from
+            env_vars: set the referenced environment variable names are added to
         """
-        missing = []
-        # Collect the missing enviroment vaiables using the appropriate speicifc method
+        # Collect the environment variable references using the appropriate specific method
         if isinstance(obj, str):
-            env_vars = self._env_var_pattern.findall(obj)
-            for var in env_vars:
-                if os.getenv(var) is None:
-                    missing.append(var)
+            if "$" in obj:
+                env_vars.update(self._env_var_pattern.findall(obj))
 
         elif isinstance(obj, dict):
             for value in obj.values():
-                missing.extend(self._collect_missing_env_vars(value))
+                self._collect_env_var_references(value, env_vars)
 
         elif isinstance(obj, list):
             for item in obj:
-                missing.extend(self._collect_missing_env_vars(item))
+                self._collect_env_var_references(item, env_vars)
+
 
-        # After all the missing variables have been collected, return the list
-        return missing
+    def get_required_env_vars(self) -> frozenset[str]:
+        """Get the names of all environment variables referenced in the config, walking it only once."""
+        if self._required_env_vars is None:
+            env_vars: set[str] = set()
+            self._collect_env_var_references(self._get_raw_config(), env_vars)
+            self._required_env_vars = frozenset(env_vars)
+        return self._required_env_vars
 
 
     def get_missing_env_vars(self) -> list[str]:
-        raw_config = self._get_raw_config()
-        return self._collect_missing_env_vars(raw_config)
+        """Get the names of the referenced environment variables that are not set, sorted."""
+        return sorted(self.get_required_env_vars() - os.environ.keys())
+
+
+# Required flat config fields. All other fields from `get_flat_config` are considered optional.
+_REQUIRED_CONFIG_FIELDS = (
+    "BIGQUERY_LOCATION_ID",
+    "BIGQUERY_PROJECT_ID",
+    "BIGQUERY_DATASET_ID",
+    "BIGQUERY_TABLE_ID",
+    "MIN_ONLINE_DAYS",
+    "MIN_SUBGRAPHS",
+    "MAX_LATENCY_MS",
+    "MAX_BLOCKS_BEHIND",
+    "BLOCKCHAIN_CONTRACT_ADDRESS",
+    "BLOCKCHAIN_FUNCTION_NAME",
+    "BLOCKCHAIN_CHAIN_ID",
+    "BLOCKCHAIN_RPC_URLS",
+    "BLOCK_EXPLORER_URL",
+    "TX_TIMEOUT_SECONDS",
+    "SCHEDULED_RUN_TIME",
+    "SUBGRAPH_URL_PRE_PRODUCTION",
+    "SUBGRAPH_URL_PRODUCTION",
+    "BATCH_SIZE",
+    "MAX_AGE_BEFORE_DELETION",
+    "BIGQUERY_ANALYSIS_PERIOD_DAYS",
+    "PRIVATE_KEY",
+    "STUDIO_API_KEY",
+    "STUDIO_DEPLOY_KEY",
+    "SLACK_WEBHOOK_URL",
+    "ETHERSCAN_API_KEY",
+    "ARBITRUM_API_KEY",
+)
 
 
 def _validate_config(config: dict[str, Any]) -> dict[str, Any]:
-    # Define required fields. All other fields from `get_flat_config` are considered optional.
-    required = [
-        "BIGQUERY_LOCATION_ID",
-        "BIGQUERY_PROJECT_ID",
-        "BIGQUERY_DATASET_ID",
-        "BIGQUERY_TABLE_ID",
-        "MIN_ONLINE_DAYS",
-        "MIN_SUBGRAPHS",
-        "MAX_LATENCY_MS",
-        "MAX_BLOCKS_BEHIND",
-        "BLOCKCHAIN_CONTRACT_ADDRESS",
-        "BLOCKCHAIN_FUNCTION_NAME",
-        "BLOCKCHAIN_CHAIN_ID",
-        "BLOCKCHAIN_RPC_URLS",
-        "BLOCK_EXPLORER_URL",
-        "TX_TIMEOUT_SECONDS",
-        "SCHEDULED_RUN_TIME",
-        "SUBGRAPH_URL_PRE_PRODUCTION",
-        "SUBGRAPH_URL_PRODUCTION",
-        "BATCH_SIZE",
-        "MAX_AGE_BEFORE_DELETION",
-        "BIGQUERY_ANALYSIS_PERIOD_DAYS",
-        "PRIVATE_KEY",
-        "STUDIO_API_KEY",
-        "STUDIO_DEPLOY_KEY",
-        "SLACK_WEBHOOK_URL",
-        "ETHERSCAN_API_KEY",
-        "ARBITRUM_API_KEY",
-    ]
-    missing = [field for field in required if config.get(field) is None or config.get(field) in ("", [])]
+    missing = [field for field in _REQUIRED_CONFIG_FIELDS if config.get(field) in (None, "", [])]
     if missing:
         raise ConfigurationError(
             "Missing required configuration fields in config.toml or environment variables:",
@@ -278,10 +351,9 @@ def _validate_config(config: dict[str, Any]) -> dict[str, Any]:
         )
 
     # Validate specific field formats
-    try:
-        # The int() casts in get_flat_config will handle type errors for numeric fields.
-        datetime.strptime(config["SCHEDULED_RUN_TIME"], "%H:%M")
-    except (ValueError, TypeError):
+    # The int() casts in get_flat_config will handle type errors for numeric fields.
+    scheduled_run_time = config["SCHEDULED_RUN_TIME"]
+    if not isinstance(scheduled_run_time, str) or not _SCHEDULED_RUN_TIME_PATTERN.fullmatch(scheduled_run_time):
         raise ConfigurationError(
             f"Invalid SCHEDULED_RUN_TIME: {config['SCHEDULED_RUN_TIME']} - must be in HH:MM format."
         )
@@ -289,20 +361,47 @@ def _validate_config(config: dict[str, Any]) -> dict[str, Any]:
     return config
 
 
+@lru_cache(maxsize=1)
+def _get_config_loader() -> ConfigLoader:
+    """Returns the loader shared by env var validation and config loading, so config.toml is parsed once."""
+    return ConfigLoader()
+
+
+@lru_cache(maxsize=1)
+def _load_validated_config() -> dict[str, Any]:
+    """Loads and validates the configuration once per process. Failures are not cached."""
+    # Report a missing key as a configuration error, so it is not mistaken for a transient failure
+    try:
+        loader = _get_config_loader()
+        flat_config = loader.get_flat_config()
+        logger.info("Successfully loaded configuration")
+        return _validate_config(flat_config)
+    except KeyError as e:
+        raise ConfigurationError(f"Missing configuration key: {e}") from e
+
+
 def load_config() -> dict[str, Any]:
-    """Loads, validates, and returns the application configuration."""
-    loader = ConfigLoader()
-    flat_config = loader.get_flat_config()
-    logger.info("Successfully loaded configuration")
-    return _validate_config(flat_config)
+    """
+    Loads, validates, and returns the application configuration.
+
+    The validated configuration is cached for the lifetime of the process, so repeated scheduler runs skip
+    TOML parsing, env var substitution and validation. Each caller receives its own shallow copy.
+    Call invalidate_config_cache() to pick up changes to config.toml or the environment.
+    """
+    return dict(_load_validated_config())
+
+
+def invalidate_config_cache() -> None:
+    """Discards the cached configuration, so the next load_config() reads config.toml and the environment again."""
+    _get_config_loader.cache_clear()
+    _load_validated_config.cache_clear()
 
 
 def validate_all_required_env_vars() -> None:
     """Validates that all required environment variables are set."""
-    loader = ConfigLoader()
-    missing = loader.get_missing_env_vars()
+    missing = _get_config_loader().get_missing_env_vars()
     if missing:
-        raise ConfigurationError(f"Missing required environment variables: {', '.join(sorted(set(missing)))}")
+        raise ConfigurationError(f"Missing required environment variables: {', '.join(missing)}")
     logger.info("Successfully validated all required environment variables")
 
 
@@ -312,6 +411,10 @@ def validate_all_required_env_vars() -> None:
 class CredentialManager:
     """Handles credential management for Google Cloud services."""
 
+    def __init__(self) -> None:
+        # Digest of the inline credentials currently installed, so unchanged credentials are not rebuilt
+        self._installed_credentials_digest: Optional[str] = None
+
 
     def _parse_and_validate_credentials_json(self, creds_env: str) -> dict:
         """
@@ -329,19 +432,23 @@ class CredentialManager:
         # Try to parse the credentials
         try:
             # Parse the credentials
-            creds_data = json.loads(creds_env)
+            creds_data = json_loads(creds_env)
             cred_type = creds_data.get("type", "")
 
             # Validate the credentials data based on the type
             if cred_type == "authorized_user":
-                required = ["client_id", "client_secret", "refresh_token"]
-                if not all(k in creds_data for k in required):
-                    raise ValueError("Incomplete authorized_user credentials")
+                missing = {"client_id", "client_secret", "refresh_token"}.difference(creds_data)
+                if missing:
+                    raise ValueError(
+                        f"Incomplete authorized_user credentials, missing: {', '.join(sorted(missing))}"
+                    )
 
             elif cred_type == "service_account":
-                required = ["private_key", "client_email", "project_id"]
-                if not all(k in creds_data for k in required):
-                    raise ValueError("Incomplete service_account credentials")
+                missing = {"private_key", "client_email", "project_id"}.difference(creds_data)
+                if missing:
+                    raise ValueError(
+                        f"Incomplete service_account credentials, missing: {', '.join(sorted(missing))}"
+                    )
 
             else:
                 raise ValueError(f"Unsupported credential type: '{cred_type}'")
@@ -406,6 +513,15 @@ class CredentialManager:
 
         # Case 1: JSON credentials provided inline
         if creds_env.strip().startswith("{"):
+            # Reuse the installed credentials, and their cached access token, while the inline JSON is unchanged
+            creds_digest = hashlib.sha256(creds_env.encode()).hexdigest()
+            if (
+                creds_digest == self._installed_credentials_digest
+                and google.auth._default._CREDENTIALS is not None  # type: ignore[attr-defined]
+            ):
+                logger.debug("Reusing Google credentials loaded by a previous run")
+                return
+
             creds_data = None
             try:
                 # Parse and validate the credentials
@@ -416,6 +532,7 @@ class CredentialManager:
                     self._setup_user_credentials_from_dict(creds_data.copy())
                 else:
                     self._setup_service_account_credentials_from_dict(creds_data.copy())
+                self._installed_credentials_digest = creds_digest
 
             # If the credentials parsing fails, raise an error
             except Exception as e:
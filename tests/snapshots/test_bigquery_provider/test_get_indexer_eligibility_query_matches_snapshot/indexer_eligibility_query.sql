@@ -1,69 +1,63 @@
 
         WITH
-        -- Get daily query metrics per indexer
-        DailyMetrics AS (
+        -- Get query metrics per indexer, day and subgraph in the only scan of the table
+        DeploymentMetrics AS (
             SELECT
                 day_partition AS day,
                 indexer,
+                deployment,
                 COUNT(*) AS query_attempts,
-                SUM(CASE
-                    WHEN status = '200 OK'
+                COUNTIF(
+                    status = '200 OK'
                     AND response_time_ms < 5000
                     AND blocks_behind < 50000
-                    THEN 1
-                    ELSE 0
-                END) AS good_responses,
-                COUNT(DISTINCT deployment) AS unique_subgraphs_served
+                ) AS good_responses
             FROM
                 test.dataset.table
             WHERE
                 day_partition BETWEEN '2025-01-01' AND '2025-01-28'
             GROUP BY
-                day_partition, indexer
+                day_partition, indexer, deployment
         ),
-        -- Determine which days count as 'online' (>= 1 good query on >= 10 subgraphs)
-        DaysOnline AS (
+        -- Flag the first day each subgraph got a good response, so subgraphs can be counted once per indexer
+        FirstGoodResponseDays AS (
             SELECT
-                indexer,
-                day,
-                unique_subgraphs_served,
-                CASE WHEN good_responses >= 1 AND unique_subgraphs_served >= 10
-                    THEN 1 ELSE 0
-                END AS is_online_day
+                *,
+                deployment IS NOT NULL
+                AND day = MIN(IF(good_responses > 0, day, NULL)) OVER (PARTITION BY indexer, deployment)
+                AS is_first_good_response_day
             FROM
-                DailyMetrics
+                DeploymentMetrics
         ),
-        -- Calculate unique subgraphs served with at least one good query
-        UniqueSubgraphs AS (
+        -- Get daily query metrics per indexer
+        DailyMetrics AS (
             SELECT
+                day,
                 indexer,
-                COUNT(DISTINCT deployment) AS unique_good_response_subgraphs
+                SUM(query_attempts) AS query_attempts,
+                SUM(good_responses) AS good_responses,
+                COUNT(deployment) AS unique_subgraphs_served,
+                COUNTIF(is_first_good_response_day) AS new_good_response_subgraphs
             FROM
-                test.dataset.table
-            WHERE
-                day_partition BETWEEN '2025-01-01' AND '2025-01-28'
-                AND status = '200 OK'
-                AND response_time_ms < 5000
-                AND blocks_behind < 50000
+                FirstGoodResponseDays
             GROUP BY
-                indexer
+                day, indexer
         ),
-        -- Calculate overall metrics per indexer
+        -- Calculate overall metrics per indexer, where a day counts as 'online' if it has
+        -- >= 1 good query on >= 10 subgraphs
         IndexerMetrics AS (
             SELECT
-                d.indexer,
-                SUM(m.query_attempts) AS total_query_attempts,
-                SUM(m.good_responses) AS total_good_responses,
-                SUM(d.is_online_day) AS total_good_days_online,
-                ds.unique_good_response_subgraphs
+                indexer,
+                SUM(query_attempts) AS total_query_attempts,
+                SUM(good_responses) AS total_good_responses,
+                COUNTIF(good_responses >= 1 AND unique_subgraphs_served >= 10)
+                    AS total_good_days_online,
+                IF(SUM(good_responses) > 0, SUM(new_good_response_subgraphs), NULL)
+                    AS unique_good_response_subgraphs
             FROM
-                DailyMetrics m
-            JOIN
-                DaysOnline d USING (indexer, day)
-            LEFT JOIN
-                UniqueSubgraphs ds ON m.indexer = ds.indexer
+                DailyMetrics
             GROUP BY
-                d.indexer, ds.unique_good_response_subgraphs
+                indexer
         )
         -- Final result with eligibility determination
         SELECT
@@ -129,8 +129,7 @@ class TestReadGbqDataframe:
         self, mock_sleep: MagicMock, provider: BigQueryProvider, mock_bpd: MagicMock
     ):
         """
-        Tests the success case for _read_gbq_dataframe, ensuring it returns a DataFrame
-        and that the result is converted to pandas.
+        Tests the success case for _read_gbq_dataframe, ensuring it returns a DataFrame.
         """
         # Arrange
         mock_bpd.read_gbq.return_value.to_pandas.return_value = MOCK_DATAFRAME
@@ -282,3 +281,54 @@ class TestFetchIndexerIssuanceEligibilityData:
 
         provider._get_indexer_eligibility_query.assert_called_once_with(start_date=START_DATE, end_date=END_DATE)
         provider._read_gbq_dataframe.assert_called_once_with(MOCK_QUERY)
+
+
+class TestFetchIndexerAddressesByEligibility:
+    """Tests for the fetch_indexer_addresses_by_eligibility method."""
+
+
+    def test_get_indexer_addresses_by_eligibility_query_wraps_eligibility_query(self, provider: BigQueryProvider):
+        """
+        Tests that the grouped query aggregates addresses around the full eligibility query, skipping NULL
+        indexers, which would otherwise fail the whole query in BigQuery.
+        """
+        query = provider._get_indexer_addresses_by_eligibility_query(start_date=START_DATE, end_date=END_DATE)
+        base_query = provider._get_indexer_eligibility_query(start_date=START_DATE, end_date=END_DATE)
+
+        assert base_query in query
+        assert "ARRAY_AGG(indexer IGNORE NULLS ORDER BY" in query
+        assert "GROUP BY\n            eligible_for_indexing_rewards" in query
+
+
+    def test_fetch_indexer_addresses_by_eligibility_groups_addresses(self, provider: BigQueryProvider):
+        """
+        Tests that the grouped result is returned as address lists keyed by eligibility status.
+        """
+        # Arrange
+        grouped_df = pd.DataFrame({"eligible_for_indexing_rewards": [0, 1], "indexers": [["0x2"], ["0x1", "0x3"]]})
+        provider._get_indexer_addresses_by_eligibility_query = MagicMock(return_value=MOCK_QUERY)
+        provider._read_gbq_dataframe = MagicMock(return_value=grouped_df)
+
+        # Act
+        result = provider.fetch_indexer_addresses_by_eligibility(start_date=START_DATE, end_date=END_DATE)
+
+        # Assert
+        provider._read_gbq_dataframe.assert_called_once_with(MOCK_QUERY)
+        assert result == {1: ["0x1", "0x3"], 0: ["0x2"]}
+
+
+    def test_fetch_indexer_addresses_by_eligibility_defaults_missing_groups_to_empty(
+        self, provider: BigQueryProvider
+    ):
+        """
+        Tests that an eligibility status with no indexers is returned as an empty list.
+        """
+        # Arrange
+        grouped_df = pd.DataFrame({"eligible_for_indexing_rewards": [0], "indexers": [["0x2"]]})
+        provider._read_gbq_dataframe = MagicMock(return_value=grouped_df)
+
+        # Act
+        result = provider.fetch_indexer_addresses_by_eligibility(start_date=START_DATE, end_date=END_DATE)
+
+        # Assert
+        assert result == {1: [], 0: ["0x2"]}
@@ -3,8 +3,10 @@ Unit tests for the BlockchainClient.
 """
 
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from unittest.mock import MagicMock, PropertyMock, mock_open, patch
+from unittest.mock import ANY, MagicMock, PropertyMock, call, mock_open, patch
 
 import pytest
 import requests
@@ -12,7 +14,17 @@ from pytest_mock import MockerFixture
 from web3 import Web3
 from web3.exceptions import TransactionNotFound
 
-from src.models.blockchain_client import BlockchainClient, KeyValidationError
+from src.models.blockchain_client import (
+    MAX_CONCURRENT_RECEIPT_WAITS,
+    RECEIPT_POLL_LATENCY_SECONDS,
+    BlockchainClient,
+    KeyValidationError,
+    _derive_account_address,
+    _get_contract,
+    _get_web3,
+    _read_contract_abi,
+    _to_checksum_address,
+)
 
 # Mock constants
 MOCK_RPC_PROVIDERS = ["http://primary-rpc.com", "http://secondary-rpc.com"]
@@ -24,6 +36,23 @@ MOCK_PRIVATE_KEY = "0x0123456789abcdef0123456789abcdef0123456789abcdef0123456789
 MOCK_SENDER_ADDRESS = Web3.to_checksum_address("0x" + "c" * 40)
 MOCK_ABI = [{"type": "function", "name": "allow", "inputs": []}]
 MOCK_CHAIN_ID = 1
+MOCK_LATEST_BLOCK = {"baseFeePerGas": 100 * 10**9}
+
+
+@pytest.fixture(autouse=True)
+def clear_module_caches():
+    """Ensures every test builds Web3 and contracts, reads the ABI and checksums addresses through the mocks."""
+    _derive_account_address.cache_clear()
+    _get_contract.cache_clear()
+    _get_web3.cache_clear()
+    _read_contract_abi.cache_clear()
+    _to_checksum_address.cache_clear()
+    yield
+    _derive_account_address.cache_clear()
+    _get_contract.cache_clear()
+    _get_web3.cache_clear()
+    _read_contract_abi.cache_clear()
+    _to_checksum_address.cache_clear()
 
 
 @pytest.fixture
@@ -94,10 +123,10 @@ class TestInitializationAndConnection:
 
         # Assert
         # Assert ABI was loaded
-        mock_file.assert_called_once_with(MOCK_PROJECT_ROOT / "contracts" / "contract.abi.json")
+        mock_file.assert_called_once_with(MOCK_PROJECT_ROOT / "contracts" / "contract.abi.json", "rb")
 
         # Assert Web3 was initialized with the primary RPC
-        mock_w3.HTTPProvider.assert_called_with(MOCK_RPC_PROVIDERS[0])
+        mock_w3.HTTPProvider.assert_called_with(MOCK_RPC_PROVIDERS[0], session=ANY)
         mock_w3.assert_called_once_with(mock_w3.HTTPProvider.return_value)
 
         # Assert connection was checked
@@ -109,6 +138,92 @@ class TestInitializationAndConnection:
         assert client.contract is not None
 
 
+    def test_init_reuses_cached_abi_for_subsequent_clients(self, blockchain_client: BlockchainClient, mock_w3):
+        """
+        Tests that a second client for the same project root reuses the parsed ABI instead of re-reading it.
+        """
+        # Act
+        with patch("src.models.blockchain_client.Web3", mock_w3):
+            second_client = BlockchainClient(
+                rpc_providers=MOCK_RPC_PROVIDERS,
+                contract_address=MOCK_CONTRACT_ADDRESS,
+                project_root=MOCK_PROJECT_ROOT,
+                block_explorer_url=MOCK_BLOCK_EXPLORER_URL,
+                tx_timeout_seconds=MOCK_TX_TIMEOUT_SECONDS,
+            )
+
+        # Assert
+        blockchain_client.mock_file.assert_called_once()
+        assert second_client.contract_abi == MOCK_ABI
+
+
+    def test_reconnect_reuses_web3_instance_for_same_provider(self, blockchain_client: BlockchainClient, mock_w3):
+        """
+        Tests that reconnecting to a provider reuses its Web3 instance, and with it the pooled HTTP session.
+        """
+        # Arrange
+        first_w3 = blockchain_client.w3
+
+        # Act
+        blockchain_client._connect_to_rpc()
+
+        # Assert
+        assert blockchain_client.w3 is first_w3
+        mock_w3.HTTPProvider.assert_called_once_with(MOCK_RPC_PROVIDERS[0], session=ANY)
+
+
+    def test_reconnect_reuses_contract_for_same_provider(self, blockchain_client: BlockchainClient):
+        """
+        Tests that reconnecting to a provider reuses its contract object instead of rebuilding it from the ABI.
+        """
+        # Arrange
+        first_contract = blockchain_client.contract
+
+        # Act
+        blockchain_client._connect_to_rpc()
+
+        # Assert
+        assert blockchain_client.contract is first_contract
+        blockchain_client.w3.eth.contract.assert_called_once()
+
+
+    def test_web3_session_pools_a_connection_per_concurrent_receipt_wait(self, mock_w3):
+        """
+        Tests that the HTTP session handed to the provider keeps enough pooled connections for
+        every concurrent receipt wait.
+        """
+        # Act
+        _get_web3(MOCK_RPC_PROVIDERS[0])
+
+        # Assert
+        session = mock_w3.HTTPProvider.call_args.kwargs["session"]
+        adapter = session.get_adapter(MOCK_RPC_PROVIDERS[0])
+        assert adapter._pool_maxsize == MAX_CONCURRENT_RECEIPT_WAITS
+
+
+    def test_init_checksums_contract_address_once_across_providers(self, mock_w3, mock_slack, mock_file):
+        """
+        Tests that the contract address is checksummed once even when several providers are probed.
+        """
+        # Arrange
+        mock_w3.return_value.is_connected.side_effect = [False, True]
+
+        # Act
+        with patch("src.models.blockchain_client.Web3", mock_w3):
+            client = BlockchainClient(
+                rpc_providers=MOCK_RPC_PROVIDERS,
+                contract_address=MOCK_CONTRACT_ADDRESS,
+                project_root=MOCK_PROJECT_ROOT,
+                block_explorer_url=MOCK_BLOCK_EXPLORER_URL,
+                tx_timeout_seconds=MOCK_TX_TIMEOUT_SECONDS,
+                slack_notifier=mock_slack,
+            )
+
+        # Assert
+        assert client.current_rpc_index == 1
+        mock_w3.to_checksum_address.assert_called_once_with(MOCK_CONTRACT_ADDRESS)
+
+
     def test_init_fails_if_abi_not_found(self, mock_w3, mock_slack):
         """
         Tests that BlockchainClient raises an exception if the ABI file cannot be found.
@@ -159,6 +274,43 @@ class TestInitializationAndConnection:
                 assert client.current_rpc_index == 1
 
 
+    def test_init_uses_backup_rpc_if_primary_rpc_is_slow(self, mock_slack):
+        """
+        Tests that a backup RPC is used once the primary exceeds its head start, without waiting for it.
+        """
+        # Arrange: The primary hangs until released while the backup connects immediately
+        release_primary = threading.Event()
+        primary_w3 = MagicMock()
+        primary_w3.is_connected.side_effect = lambda: release_primary.wait(5)
+        backup_w3 = MagicMock()
+        backup_w3.is_connected.return_value = True
+        w3_by_url = {MOCK_RPC_PROVIDERS[0]: primary_w3, MOCK_RPC_PROVIDERS[1]: backup_w3}
+
+        with (
+            patch("builtins.open", mock_open(read_data=json.dumps(MOCK_ABI))),
+            patch("src.models.blockchain_client.RPC_PROBE_HEAD_START_SECONDS", 0.01),
+            patch("src.models.blockchain_client.Web3") as MockWeb3,
+        ):
+            MockWeb3.HTTPProvider.side_effect = lambda url, session: url
+            MockWeb3.side_effect = lambda provider: w3_by_url[provider]
+            MockWeb3.to_checksum_address.side_effect = lambda addr: addr
+
+            # Act
+            client = BlockchainClient(
+                rpc_providers=MOCK_RPC_PROVIDERS,
+                contract_address=MOCK_CONTRACT_ADDRESS,
+                project_root=MOCK_PROJECT_ROOT,
+                block_explorer_url=MOCK_BLOCK_EXPLORER_URL,
+                tx_timeout_seconds=MOCK_TX_TIMEOUT_SECONDS,
+                slack_notifier=mock_slack,
+            )
+            release_primary.set()
+
+        # Assert
+        assert client.current_rpc_index == 1
+        assert client.w3 is backup_w3
+
+
     def test_init_fails_if_all_rpcs_fail(self, mock_w3, mock_slack):
         """
         Tests that a ConnectionError is raised if the client cannot connect to any RPC provider.
@@ -216,6 +368,85 @@ class TestInitializationAndConnection:
         assert "Switching from previous RPC" in call_kwargs["message"]
 
 
+    def test_execute_rpc_call_fails_over_if_failed_primary_still_answers_probes(
+        self, mock_slack, mocker: MockerFixture
+    ):
+        """
+        Tests that a primary which answers connection probes but fails its calls does not win the reconnect race
+        against a slower backup, which would otherwise be reported as every provider being unreachable.
+        """
+        # Arrange: The primary connects at once, while the backup only connects after the head start
+        mocker.patch("tenacity.nap.time.sleep")
+        primary_w3 = MagicMock()
+        primary_w3.is_connected.return_value = True
+        backup_w3 = MagicMock()
+        backup_w3.is_connected.side_effect = lambda: threading.Event().wait(0.2) or True
+        w3_by_url = {MOCK_RPC_PROVIDERS[0]: primary_w3, MOCK_RPC_PROVIDERS[1]: backup_w3}
+
+        with (
+            patch("builtins.open", mock_open(read_data=json.dumps(MOCK_ABI))),
+            patch("src.models.blockchain_client.RPC_PROBE_HEAD_START_SECONDS", 0.01),
+            patch("src.models.blockchain_client.Web3") as MockWeb3,
+        ):
+            MockWeb3.HTTPProvider.side_effect = lambda url, session: url
+            MockWeb3.side_effect = lambda provider: w3_by_url[provider]
+            MockWeb3.to_checksum_address.side_effect = lambda addr: addr
+            client = BlockchainClient(
+                rpc_providers=MOCK_RPC_PROVIDERS,
+                contract_address=MOCK_CONTRACT_ADDRESS,
+                project_root=MOCK_PROJECT_ROOT,
+                block_explorer_url=MOCK_BLOCK_EXPLORER_URL,
+                tx_timeout_seconds=MOCK_TX_TIMEOUT_SECONDS,
+                slack_notifier=mock_slack,
+            )
+
+            def call():
+                if client.w3 is primary_w3:
+                    raise requests.exceptions.ConnectionError("Primary call failed")
+                return "Success"
+
+            # Act
+            result = client._execute_rpc_call(call)
+
+        # Assert
+        assert result == "Success"
+        assert client.current_rpc_index == 1
+        assert client.w3 is backup_w3
+
+
+    def test_execute_rpc_call_rotates_once_when_concurrent_calls_fail_on_same_provider(
+        self, blockchain_client: BlockchainClient, mocker: MockerFixture
+    ):
+        """
+        Tests that calls failing concurrently on the same provider rotate to the next provider only once,
+        rather than each one moving the client on by another provider.
+        """
+        # Arrange
+        mocker.patch("tenacity.nap.time.sleep")
+        blockchain_client.rpc_providers = ["http://primary", "http://backup1", "http://backup2"]
+        mock_connect = mocker.patch.object(blockchain_client, "_connect_to_rpc")
+        all_failed = threading.Barrier(2)
+
+        def call():
+            if blockchain_client.current_rpc_index == 0:
+                # Let both calls fail on the primary before either of them fails over
+                try:
+                    all_failed.wait(timeout=5)
+                except threading.BrokenBarrierError:
+                    pass
+                raise requests.exceptions.ConnectionError("RPC down")
+            return "Success"
+
+        # Act
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = list(executor.map(lambda _: blockchain_client._execute_rpc_call(call), range(2)))
+
+        # Assert
+        assert results == ["Success", "Success"]
+        assert blockchain_client.current_rpc_index == 1
+        mock_connect.assert_called_once()
+
+
     def test_execute_rpc_call_reraises_unexpected_exception(self, blockchain_client: BlockchainClient):
         """
         Tests that _execute_rpc_call does not attempt to failover on unexpected,
@@ -261,17 +492,39 @@ class TestTransactionLogic:
         Tests that _setup_transaction_account returns the correct address and formatted key
         for a valid private key.
         """
-        with patch(
-            "src.models.blockchain_client.validate_and_format_private_key", return_value=MOCK_PRIVATE_KEY
-        ) as mock_validate:
+        with (
+            patch(
+                "src.models.blockchain_client.validate_and_format_private_key", return_value=MOCK_PRIVATE_KEY
+            ) as mock_validate,
+            patch("src.models.blockchain_client.Account") as mock_account_cls,
+        ):
+            mock_account_cls.from_key.return_value.address = MOCK_SENDER_ADDRESS
+
             address, key = blockchain_client._setup_transaction_account(MOCK_PRIVATE_KEY)
 
             mock_validate.assert_called_once_with(MOCK_PRIVATE_KEY)
-            blockchain_client.mock_w3_instance.eth.account.from_key.assert_called_once_with(MOCK_PRIVATE_KEY)
+            mock_account_cls.from_key.assert_called_once_with(MOCK_PRIVATE_KEY)
             assert address == MOCK_SENDER_ADDRESS
             assert key == MOCK_PRIVATE_KEY
 
 
+    def test_setup_transaction_account_derives_address_once_per_key(self, blockchain_client: BlockchainClient):
+        """
+        Tests that repeated account setup for the same key, e.g. once per batch, derives the address only once.
+        """
+        with (
+            patch("src.models.blockchain_client.validate_and_format_private_key", return_value=MOCK_PRIVATE_KEY),
+            patch("src.models.blockchain_client.Account") as mock_account_cls,
+        ):
+            mock_account_cls.from_key.return_value.address = MOCK_SENDER_ADDRESS
+
+            for _ in range(3):
+                address, _ = blockchain_client._setup_transaction_account(MOCK_PRIVATE_KEY)
+
+            mock_account_cls.from_key.assert_called_once_with(MOCK_PRIVATE_KEY)
+            assert address == MOCK_SENDER_ADDRESS
+
+
     def test_setup_transaction_account_fails_with_invalid_key(self, blockchain_client: BlockchainClient):
         """
         Tests that _setup_transaction_account raises KeyValidationError for an invalid key.
@@ -316,6 +569,27 @@ class TestTransactionLogic:
         mock_contract_func.return_value.estimate_gas.assert_called_once_with({"from": MOCK_SENDER_ADDRESS})
 
 
+    def test_estimate_transaction_gas_uses_prefetched_estimate(self, blockchain_client: BlockchainClient):
+        """
+        Tests that a prefetched gas estimate is buffered without estimating gas again.
+        """
+        # Arrange
+        mock_contract_func = MagicMock()
+
+        # Act
+        gas_limit = blockchain_client._estimate_transaction_gas(
+            contract_func=mock_contract_func,
+            indexer_addresses=[],
+            data_bytes=b"",
+            sender_address=MOCK_SENDER_ADDRESS,
+            estimated_gas=100_000,
+        )
+
+        # Assert
+        assert gas_limit == 125_000
+        mock_contract_func.assert_not_called()
+
+
     def test_estimate_transaction_gas_fails_on_rpc_error(self, blockchain_client: BlockchainClient):
         """
         Tests that _estimate_transaction_gas raises an exception if the RPC call fails.
@@ -350,94 +624,239 @@ class TestTransactionLogic:
         blockchain_client.mock_w3_instance.eth.get_transaction_count.assert_called_once_with(MOCK_SENDER_ADDRESS)
 
 
-    def test_determine_transaction_nonce_uses_oldest_pending_for_replacement(
-        self, blockchain_client: BlockchainClient
-    ):
+    def test_determine_transaction_nonce_uses_latest_on_nonce_gap(self, blockchain_client: BlockchainClient):
         """
-        Tests that the nonce of the oldest pending transaction is used for replacement (replace=True).
+        Tests that the latest nonce is used for replacement when the sender has pending transactions.
         """
         # Arrange
-        # Simulate pending transactions for the sender
-        pending_txs = {
-            "transactions": [
-                {"from": MOCK_SENDER_ADDRESS, "nonce": 15},
-                {"from": "0xanotherAddress", "nonce": 16},
-                {"from": MOCK_SENDER_ADDRESS, "nonce": 12},  # This is the oldest
-            ]
-        }
-        blockchain_client.mock_w3_instance.eth.get_block.return_value = pending_txs
+        w3_instance = blockchain_client.mock_w3_instance
+        w3_instance.eth.get_transaction_count.side_effect = [10, 9]  # pending, latest
 
         # Act
         nonce = blockchain_client._determine_transaction_nonce(MOCK_SENDER_ADDRESS, replace=True)
 
         # Assert
-        assert nonce == 12
-        blockchain_client.mock_w3_instance.eth.get_block.assert_called_once_with("pending", full_transactions=True)
+        assert nonce == 9  # Should use the latest nonce from the gap
+        assert w3_instance.eth.get_transaction_count.call_args_list[0].args == (MOCK_SENDER_ADDRESS, "pending")
+        assert w3_instance.eth.get_transaction_count.call_args_list[1].args == (MOCK_SENDER_ADDRESS, "latest")
+        w3_instance.eth.get_block.assert_not_called()
 
 
-    def test_determine_transaction_nonce_falls_back_to_latest_on_nonce_gap(
-        self, blockchain_client: BlockchainClient
-    ):
+    def test_determine_transaction_nonce_uses_pending_if_no_gap(self, blockchain_client: BlockchainClient):
         """
-        Tests that nonce determination falls back to the latest nonce
-        if no pending txs are found but a nonce gap exists.
+        Tests that the pending nonce is used directly when the sender has no pending transactions.
         """
         # Arrange
-        blockchain_client.mock_w3_instance.eth.get_block.return_value = {"transactions": []}
-        blockchain_client.mock_w3_instance.eth.get_transaction_count.side_effect = [
-            10,
-            9,
-        ]  # pending, latest
+        w3_instance = blockchain_client.mock_w3_instance
+        w3_instance.eth.get_transaction_count.side_effect = [10, 10]  # pending, latest
 
         # Act
         nonce = blockchain_client._determine_transaction_nonce(MOCK_SENDER_ADDRESS, replace=True)
 
         # Assert
-        assert nonce == 9  # Should use the latest nonce from the gap
-        assert blockchain_client.mock_w3_instance.eth.get_transaction_count.call_count == 2
+        assert nonce == 10
+        assert w3_instance.eth.get_transaction_count.call_count == 2
+        w3_instance.eth.get_block.assert_not_called()
+
+
+    def test_determine_transaction_nonce_falls_back_on_error(self, blockchain_client: BlockchainClient):
+        """
+        Tests that nonce determination falls back to the next available nonce if the gap check fails.
+        """
+        # Arrange
+        w3_instance = blockchain_client.mock_w3_instance
+        w3_instance.eth.get_transaction_count.side_effect = [ValueError("Cannot get pending nonce"), 9]
+
+        # Act
+        nonce = blockchain_client._determine_transaction_nonce(MOCK_SENDER_ADDRESS, replace=True)
+
+        # Assert
+        assert nonce == 9  # Fallback to next available nonce
+        assert w3_instance.eth.get_transaction_count.call_args_list[-1].args == (MOCK_SENDER_ADDRESS,)
+
+
+    def test_determine_transaction_nonce_uses_prefetched_nonce_counts(self, blockchain_client: BlockchainClient):
+        """
+        Tests that prefetched nonce counts are used without any further RPC calls.
+        """
+        # Act
+        nonce = blockchain_client._determine_transaction_nonce(
+            MOCK_SENDER_ADDRESS, replace=True, nonce_counts=(10, 9)
+        )
 
+        # Assert
+        assert nonce == 9
+        blockchain_client.mock_w3_instance.eth.get_transaction_count.assert_not_called()
+
+
+    def test_fetch_transaction_state_returns_batched_results(self, blockchain_client: BlockchainClient):
+        """
+        Tests that nonces, the latest block and the balance are fetched in a single batched request.
+        """
+        # Arrange
+        w3_instance = blockchain_client.mock_w3_instance
+        batch = w3_instance.batch_requests.return_value.__enter__.return_value
+        batch.execute.return_value = [10, 9, MOCK_LATEST_BLOCK, 10**18]
 
-    def test_determine_transaction_nonce_falls_back_to_standard_if_no_pending_or_gap(
+        # Act
+        result = blockchain_client._fetch_transaction_state(MOCK_SENDER_ADDRESS)
+
+        # Assert
+        assert result == (10, 9, MOCK_LATEST_BLOCK, 10**18, None)
+        assert batch.add.call_count == 4
+        batch.execute.assert_called_once()
+        w3_instance.eth.estimate_gas.assert_not_called()
+
+
+    def test_fetch_transaction_state_includes_gas_estimate_for_contract_call(
         self, blockchain_client: BlockchainClient
     ):
         """
-        Tests that nonce determination falls back to the standard nonce if no pending txs or gaps are found.
+        Tests that the gas estimate for a contract call joins the same batched request.
         """
         # Arrange
         w3_instance = blockchain_client.mock_w3_instance
-        w3_instance.eth.get_block.return_value = {"transactions": []}  # No pending txs
-        w3_instance.eth.get_transaction_count.side_effect = [
-            10,  # pending
-            10,  # latest
-            10,  # fallback
-        ]
+        batch = w3_instance.batch_requests.return_value.__enter__.return_value
+        batch.execute.return_value = [10, 9, MOCK_LATEST_BLOCK, 10**18, 100_000]
+        blockchain_client.contract.encode_abi.return_value = "0xcalldata"
 
         # Act
-        nonce = blockchain_client._determine_transaction_nonce(MOCK_SENDER_ADDRESS, replace=True)
+        result = blockchain_client._fetch_transaction_state(MOCK_SENDER_ADDRESS, "allow", [[], b""])
 
         # Assert
-        assert nonce == 10  # Fallback to next available nonce
-        w3_instance.eth.get_block.assert_called_once_with("pending", full_transactions=True)
-        assert w3_instance.eth.get_transaction_count.call_count == 3
+        assert result == (10, 9, MOCK_LATEST_BLOCK, 10**18, 100_000)
+        assert batch.add.call_count == 5
+        blockchain_client.contract.encode_abi.assert_called_once_with("allow", args=[[], b""])
+        w3_instance.eth.estimate_gas.assert_called_once_with(
+            {"from": MOCK_SENDER_ADDRESS, "to": MOCK_CONTRACT_ADDRESS, "data": "0xcalldata"}
+        )
 
 
-    def test_determine_transaction_nonce_falls_back_on_error(self, blockchain_client: BlockchainClient):
+    def test_fetch_transaction_state_returns_none_if_batching_fails(self, blockchain_client: BlockchainClient):
         """
-        Tests that nonce determination falls back gracefully if checking for pending
-        transactions fails.
+        Tests that a failed batch request returns None so callers fall back to individual calls.
         """
         # Arrange
         w3_instance = blockchain_client.mock_w3_instance
-        w3_instance.eth.get_block.side_effect = ValueError("Cannot get pending block")
-        w3_instance.eth.get_transaction_count.return_value = 9
+        batch = w3_instance.batch_requests.return_value.__enter__.return_value
+        batch.execute.side_effect = ValueError("Batch requests not supported")
 
         # Act
-        nonce = blockchain_client._determine_transaction_nonce(MOCK_SENDER_ADDRESS, replace=True)
+        result = blockchain_client._fetch_transaction_state(MOCK_SENDER_ADDRESS)
 
         # Assert
-        assert nonce == 9  # Fallback to next available nonce
-        w3_instance.eth.get_block.assert_called_once()
-        w3_instance.eth.get_transaction_count.assert_called()
+        assert result is None
+
+
+    def test_fetch_transaction_state_returns_none_on_error_payload(self, blockchain_client: BlockchainClient):
+        """
+        Tests that an error item in the batch, such as a reverting gas estimate, returns None.
+        """
+        # Arrange
+        w3_instance = blockchain_client.mock_w3_instance
+        batch = w3_instance.batch_requests.return_value.__enter__.return_value
+        batch.execute.return_value = [10, 9, MOCK_LATEST_BLOCK, 10**18, {"error": "execution reverted"}]
+
+        # Act
+        result = blockchain_client._fetch_transaction_state(MOCK_SENDER_ADDRESS, "allow", [[], b""])
+
+        # Assert
+        assert result is None
+
+
+    def test_fit_batch_size_to_gas_limit_lowers_batch_size_to_fit_block(self, blockchain_client: BlockchainClient):
+        """
+        Tests that the batch size is lowered to what fits the block gas target, from a single batched probe.
+        """
+        # Arrange
+        addresses = [f"0x{i:040x}" for i in range(50)]
+        batch = blockchain_client.mock_w3_instance.batch_requests.return_value.__enter__.return_value
+        # 50,000 fixed gas plus 10,000 gas per address
+        batch.execute.return_value = [60_000, 550_000]
+
+        # Act
+        result = blockchain_client._fit_batch_size_to_gas_limit(
+            MOCK_SENDER_ADDRESS, addresses, "allow", b"", 250, latest_block={"gasLimit": 1_000_000}
+        )
+
+        # Assert
+        assert result == 75
+        assert batch.add.call_count == 2
+        blockchain_client.mock_w3_instance.eth.get_block.assert_not_called()
+
+
+    def test_fit_batch_size_to_gas_limit_keeps_batch_size_that_fits(self, blockchain_client: BlockchainClient):
+        """
+        Tests that the configured batch size is an upper bound that is kept when it fits the block.
+        """
+        # Arrange
+        addresses = [f"0x{i:040x}" for i in range(50)]
+        batch = blockchain_client.mock_w3_instance.batch_requests.return_value.__enter__.return_value
+        batch.execute.return_value = [60_000, 550_000]
+
+        # Act
+        result = blockchain_client._fit_batch_size_to_gas_limit(
+            MOCK_SENDER_ADDRESS, addresses, "allow", b"", 250, latest_block={"gasLimit": 32_000_000}
+        )
+
+        # Assert
+        assert result == 250
+
+
+    @pytest.mark.parametrize(
+        "execute_result",
+        [ValueError("Batch requests not supported"), [60_000, {"error": "execution reverted"}]],
+    )
+    def test_fit_batch_size_to_gas_limit_falls_back_to_batch_size_on_failure(
+        self, blockchain_client: BlockchainClient, execute_result
+    ):
+        """
+        Tests that a failed or reverting probe keeps the configured batch size.
+        """
+        # Arrange
+        addresses = [f"0x{i:040x}" for i in range(50)]
+        batch = blockchain_client.mock_w3_instance.batch_requests.return_value.__enter__.return_value
+        if isinstance(execute_result, Exception):
+            batch.execute.side_effect = execute_result
+        else:
+            batch.execute.return_value = execute_result
+
+        # Act
+        result = blockchain_client._fit_batch_size_to_gas_limit(
+            MOCK_SENDER_ADDRESS, addresses, "allow", b"", 250, latest_block={"gasLimit": 1_000_000}
+        )
+
+        # Assert
+        assert result == 250
+
+
+    def test_fit_batch_size_to_gas_limit_skips_probe_for_single_address(self, blockchain_client: BlockchainClient):
+        """
+        Tests that no probe is sent when there are too few addresses to measure the per-address gas.
+        """
+        # Act
+        result = blockchain_client._fit_batch_size_to_gas_limit(
+            MOCK_SENDER_ADDRESS, [f"0x{1:040x}"], "allow", b"", 250
+        )
+
+        # Assert
+        assert result == 250
+        blockchain_client.mock_w3_instance.batch_requests.assert_not_called()
+
+
+    def test_get_gas_prices_uses_prefetched_latest_block(self, blockchain_client: BlockchainClient):
+        """
+        Tests that a prefetched latest block is used for the base fee without fetching it again.
+        """
+        # Arrange
+        blockchain_client.w3.eth.max_priority_fee = 2 * 10**9
+
+        # Act
+        base_fee, _ = blockchain_client._get_gas_prices(latest_block=MOCK_LATEST_BLOCK)
+
+        # Assert
+        assert base_fee == 100 * 10**9
+        blockchain_client.mock_w3_instance.eth.get_block.assert_not_called()
 
 
     def test_get_gas_prices_succeeds_on_happy_path(self, blockchain_client: BlockchainClient):
@@ -598,7 +1017,7 @@ class TestTransactionLogic:
         blockchain_client.w3.eth.send_raw_transaction.assert_called_once_with(b"raw_tx_bytes")
         # Check that wait_for_transaction_receipt was called with the returned hash
         blockchain_client.w3.eth.wait_for_transaction_receipt.assert_called_once_with(
-            mock_tx_hash, MOCK_TX_TIMEOUT_SECONDS
+            mock_tx_hash, MOCK_TX_TIMEOUT_SECONDS, poll_latency=RECEIPT_POLL_LATENCY_SECONDS
         )
         # Check that the final hash is correct
         assert tx_hash == mock_tx_hash.hex()
@@ -652,6 +1071,10 @@ def mock_full_transaction_flow(mocker: MockerFixture):
     mock_estimate_gas = mocker.patch(
         "src.models.blockchain_client.BlockchainClient._estimate_transaction_gas", return_value=21000
     )
+    mock_prefetch = mocker.patch(
+        "src.models.blockchain_client.BlockchainClient._fetch_transaction_state",
+        return_value=(1, 1, MOCK_LATEST_BLOCK, 10**18, 20000),
+    )
     mock_determine_nonce = mocker.patch(
         "src.models.blockchain_client.BlockchainClient._determine_transaction_nonce", return_value=1
     )
@@ -670,14 +1093,20 @@ def mock_full_transaction_flow(mocker: MockerFixture):
         "src.models.blockchain_client.BlockchainClient._send_signed_transaction",
         return_value="final_tx_hash",
     )
+    mock_fit_batch_size = mocker.patch(
+        "src.models.blockchain_client.BlockchainClient._fit_batch_size_to_gas_limit",
+        side_effect=lambda *args, **kwargs: args[4],
+    )
     return {
         "setup": mock_setup,
         "estimate_gas": mock_estimate_gas,
+        "prefetch": mock_prefetch,
         "nonce": mock_determine_nonce,
         "gas_prices": mock_get_gas,
         "build_params": mock_build_params,
         "build_sign": mock_build_sign,
         "send": mock_send,
+        "fit_batch_size": mock_fit_batch_size,
     }
 
 
@@ -714,9 +1143,21 @@ class TestOrchestrationAndBatching:
         # Assert
         assert tx_hash == "final_tx_hash"
         mock_full_transaction_flow["setup"].assert_called_once_with(MOCK_PRIVATE_KEY)
-        mock_full_transaction_flow["estimate_gas"].assert_called_once()
-        mock_full_transaction_flow["nonce"].assert_called_once_with(MOCK_SENDER_ADDRESS, False)
-        mock_full_transaction_flow["gas_prices"].assert_called_once_with()
+        mock_full_transaction_flow["estimate_gas"].assert_called_once_with(
+            blockchain_client.contract.functions.allow,
+            [MOCK_SENDER_ADDRESS],
+            b"",
+            MOCK_SENDER_ADDRESS,
+            estimated_gas=20000,
+        )
+        mock_full_transaction_flow["prefetch"].assert_called_once_with(
+            MOCK_SENDER_ADDRESS, "allow", [[MOCK_SENDER_ADDRESS], b""]
+        )
+        blockchain_client.w3.eth.get_balance.assert_not_called()
+        mock_full_transaction_flow["nonce"].assert_called_once_with(
+            MOCK_SENDER_ADDRESS, False, nonce_counts=(1, 1)
+        )
+        mock_full_transaction_flow["gas_prices"].assert_called_once_with(latest_block=MOCK_LATEST_BLOCK)
         mock_full_transaction_flow["build_params"].assert_called_once_with(
             MOCK_SENDER_ADDRESS, 1, MOCK_CHAIN_ID, 21000, 100, 10, False
         )
@@ -727,7 +1168,69 @@ class TestOrchestrationAndBatching:
             {"tx": "params"},
             MOCK_PRIVATE_KEY,
         )
-        mock_full_transaction_flow["send"].assert_called_once_with("signed_tx")
+        mock_full_transaction_flow["send"].assert_called_once_with("signed_tx", wait_for_receipt=True)
+
+
+    def test_execute_complete_transaction_skips_balance_call_when_info_logging_is_disabled(
+        self,
+        blockchain_client: BlockchainClient,
+        mocker: MockerFixture,
+        mock_full_transaction_flow: dict,
+    ):
+        """
+        Tests that without a batched prefetch, the balance is not fetched on its own when it would not be logged.
+        """
+        # Arrange
+        blockchain_client.contract.functions.allow = MagicMock()
+        mock_full_transaction_flow["prefetch"].return_value = None
+        mocker.patch("src.models.blockchain_client.logger.isEnabledFor", return_value=False)
+        params = {
+            "private_key": MOCK_PRIVATE_KEY,
+            "indexer_addresses": [MOCK_SENDER_ADDRESS],
+            "data_bytes": b"",
+            "contract_function": "allow",
+            "chain_id": MOCK_CHAIN_ID,
+            "replace": False,
+        }
+
+        # Act
+        blockchain_client._execute_complete_transaction(params)
+
+        # Assert
+        blockchain_client.w3.eth.get_balance.assert_not_called()
+        mock_full_transaction_flow["send"].assert_called_once()
+
+
+    def test_execute_complete_transaction_uses_assigned_nonce(
+        self,
+        blockchain_client: BlockchainClient,
+        mock_full_transaction_flow: dict,
+    ):
+        """
+        Tests that a nonce assigned by the caller is used as-is and the send does not wait when asked not to.
+        """
+        # Arrange
+        blockchain_client.contract.functions.allow = MagicMock()
+        params = {
+            "private_key": MOCK_PRIVATE_KEY,
+            "indexer_addresses": [MOCK_SENDER_ADDRESS],
+            "data_bytes": b"",
+            "contract_function": "allow",
+            "chain_id": MOCK_CHAIN_ID,
+            "replace": False,
+            "nonce": 7,
+            "wait_for_receipt": False,
+        }
+
+        # Act
+        blockchain_client._execute_complete_transaction(params)
+
+        # Assert
+        mock_full_transaction_flow["nonce"].assert_not_called()
+        mock_full_transaction_flow["build_params"].assert_called_once_with(
+            MOCK_SENDER_ADDRESS, 7, MOCK_CHAIN_ID, 21000, 100, 10, False
+        )
+        mock_full_transaction_flow["send"].assert_called_once_with("signed_tx", wait_for_receipt=False)
 
 
     def test_execute_complete_transaction_fails_on_missing_params(self, blockchain_client: BlockchainClient):
@@ -791,23 +1294,77 @@ class TestOrchestrationAndBatching:
         mock_execute.assert_called_once()
         call_args = mock_execute.call_args.args[0]
         assert call_args["private_key"] == MOCK_PRIVATE_KEY
-        assert call_args["indexer_addresses"] == [MOCK_SENDER_ADDRESS]
+        assert call_args["indexer_addresses"] == [bytes.fromhex(MOCK_SENDER_ADDRESS[2:])]
         assert call_args["contract_function"] == "allow"
         assert call_args["replace"] is False
 
 
-    def test_batch_allow_indexers_splits_batches_correctly(self, blockchain_client: BlockchainClient):
+    def test_send_transaction_to_allow_indexers_passes_raw_address_bytes(
+        self, blockchain_client: BlockchainClient, mock_w3: MagicMock, mocker: MockerFixture
+    ):
+        """
+        Tests that indexer addresses are converted to raw 20-byte values up front, so gas estimation and
+        transaction building can encode them without checksumming every address.
+        """
+        # Arrange
+        mock_execute = mocker.patch(
+            "src.models.blockchain_client.BlockchainClient._execute_complete_transaction",
+            return_value="tx_hash",
+        )
+
+        # Act
+        blockchain_client.send_transaction_to_allow_indexers(
+            indexer_addresses=["0x" + "ab" * 20, "CD" * 20],
+            private_key=MOCK_PRIVATE_KEY,
+            chain_id=1,
+            contract_function="allow",
+        )
+
+        # Assert
+        assert mock_execute.call_args.args[0]["indexer_addresses"] == [b"\xab" * 20, b"\xcd" * 20]
+        assert mock_w3.to_checksum_address.call_args_list == [call(MOCK_CONTRACT_ADDRESS)]
+
+
+    def test_send_transaction_to_allow_indexers_fails_on_invalid_address(
+        self, blockchain_client: BlockchainClient, mocker: MockerFixture
+    ):
+        """
+        Tests that a malformed indexer address is rejected before any transaction is built.
+        """
+        # Arrange
+        mock_execute = mocker.patch("src.models.blockchain_client.BlockchainClient._execute_complete_transaction")
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="Address must be 20 bytes long"):
+            blockchain_client.send_transaction_to_allow_indexers(
+                indexer_addresses=["0xabc0"],
+                private_key=MOCK_PRIVATE_KEY,
+                chain_id=1,
+                contract_function="allow",
+            )
+        mock_execute.assert_not_called()
+
+
+    def test_batch_allow_indexers_splits_batches_correctly(
+        self, blockchain_client: BlockchainClient, mocker: MockerFixture, mock_full_transaction_flow: dict
+    ):
         """
         Tests that the batch processing logic correctly splits a list of addresses
         into multiple transactions based on batch size.
         """
         # Arrange
         # Create a list of 5 addresses
-        addresses = [f"0x{i}" * 40 for i in range(5)]
-        blockchain_client.send_transaction_to_allow_indexers = MagicMock(return_value="tx_hash")
+        addresses = [f"0x{i:040x}" for i in range(5)]
+        mock_prepare = mocker.patch(
+            "src.models.blockchain_client.BlockchainClient._prepare_signed_transaction", return_value="signed_tx"
+        )
+        mock_full_transaction_flow["send"].return_value = "ab"
+        mocker.patch(
+            "src.models.blockchain_client.BlockchainClient._wait_for_transaction_receipt", return_value="ab"
+        )
 
         # Act
-        # Use a batch size of 2, which should result in 3 calls (2, 2, 1)
+        # Use a batch size of 2, which should result in 3 transactions (2, 2, 1)
         tx_hashes, rpc_provider = blockchain_client.batch_allow_indexers_issuance_eligibility(
             indexer_addresses=addresses,
             private_key=MOCK_PRIVATE_KEY,
@@ -819,24 +1376,257 @@ class TestOrchestrationAndBatching:
         # Assert
         assert len(tx_hashes) == 3
         assert rpc_provider in blockchain_client.rpc_providers
-        assert blockchain_client.send_transaction_to_allow_indexers.call_count == 3
+        assert mock_full_transaction_flow["send"].call_count == 3
+
+        # Check the contents of each prepared transaction
+        prepared = sorted(
+            (c.args[0] for c in mock_prepare.call_args_list), key=lambda params: params["indexer_addresses"]
+        )
+        assert [params["indexer_addresses"] for params in prepared] == [
+            [bytes.fromhex(a[2:]) for a in addresses[0:2]],
+            [bytes.fromhex(a[2:]) for a in addresses[2:4]],
+            [bytes.fromhex(a[2:]) for a in addresses[4:5]],
+        ]
+
+
+    def test_batch_allow_indexers_balances_batch_sizes(
+        self, blockchain_client: BlockchainClient, mocker: MockerFixture, mock_full_transaction_flow: dict
+    ):
+        """
+        Tests that addresses are spread evenly over the fewest batches the batch size allows,
+        rather than filling every batch and leaving a small last one.
+        """
+        # Arrange
+        addresses = [f"0x{i:040x}" for i in range(7)]
+        mock_prepare = mocker.patch(
+            "src.models.blockchain_client.BlockchainClient._prepare_signed_transaction", return_value="signed_tx"
+        )
+        mock_full_transaction_flow["send"].return_value = "ab"
+        mocker.patch(
+            "src.models.blockchain_client.BlockchainClient._wait_for_transaction_receipt", return_value="ab"
+        )
+
+        # Act
+        # A batch size of 5 needs 2 transactions, which should carry 4 and 3 addresses instead of 5 and 2
+        blockchain_client.batch_allow_indexers_issuance_eligibility(
+            indexer_addresses=addresses,
+            private_key=MOCK_PRIVATE_KEY,
+            chain_id=1,
+            contract_function="allow",
+            batch_size=5,
+        )
+
+        # Assert
+        prepared = sorted(
+            (c.args[0] for c in mock_prepare.call_args_list), key=lambda params: params["indexer_addresses"]
+        )
+        assert [params["indexer_addresses"] for params in prepared] == [
+            [bytes.fromhex(a[2:]) for a in addresses[0:4]],
+            [bytes.fromhex(a[2:]) for a in addresses[4:7]],
+        ]
+
+
+    def test_batch_allow_indexers_assigns_consecutive_nonces_and_awaits_all_receipts(
+        self, blockchain_client: BlockchainClient, mocker: MockerFixture, mock_full_transaction_flow: dict
+    ):
+        """
+        Tests that batches are prepared with consecutive nonces from a single base nonce, sent in nonce order
+        without waiting, and that every receipt is awaited before the transaction links are returned in order.
+        """
+        # Arrange
+        addresses = [f"0x{i:040x}" for i in range(5)]
+        mock_prepare = mocker.patch(
+            "src.models.blockchain_client.BlockchainClient._prepare_signed_transaction",
+            side_effect=lambda params: f"signed_tx_{params['nonce']}",
+        )
+        mock_full_transaction_flow["send"].side_effect = ["aa", "bb", "cc"]
+        mock_wait = mocker.patch(
+            "src.models.blockchain_client.BlockchainClient._wait_for_transaction_receipt",
+            side_effect=lambda tx_hash: tx_hash.hex(),
+        )
+
+        # Act
+        tx_links, _ = blockchain_client.batch_allow_indexers_issuance_eligibility(
+            indexer_addresses=addresses,
+            private_key=MOCK_PRIVATE_KEY,
+            chain_id=1,
+            contract_function="allow",
+            batch_size=2,
+        )
+
+        # Assert
+        mock_full_transaction_flow["nonce"].assert_called_once()
+        assert sorted(c.args[0]["nonce"] for c in mock_prepare.call_args_list) == [1, 2, 3]
+        assert mock_full_transaction_flow["send"].call_args_list == [
+            call("signed_tx_1", wait_for_receipt=False),
+            call("signed_tx_2", wait_for_receipt=False),
+            call("signed_tx_3", wait_for_receipt=False),
+        ]
+        assert sorted(c.args[0] for c in mock_wait.call_args_list) == [b"\xaa", b"\xbb", b"\xcc"]
+        assert tx_links == [f"{MOCK_BLOCK_EXPLORER_URL}/tx/0x{h}" for h in ("aa", "bb", "cc")]
+
+
+    def test_batch_allow_indexers_prepares_batches_from_state_fetched_once(
+        self, blockchain_client: BlockchainClient, mocker: MockerFixture, mock_full_transaction_flow: dict
+    ):
+        """
+        Tests that the sender's state is fetched once for the whole batch run, and each batch is prepared
+        from it rather than fetching it again.
+        """
+        # Arrange
+        addresses = [f"0x{i:040x}" for i in range(5)]
+        blockchain_client.contract.functions.allow = MagicMock()
+        mock_full_transaction_flow["send"].return_value = "ab"
+        mocker.patch(
+            "src.models.blockchain_client.BlockchainClient._wait_for_transaction_receipt", return_value="ab"
+        )
+
+        # Act
+        blockchain_client.batch_allow_indexers_issuance_eligibility(
+            indexer_addresses=addresses,
+            private_key=MOCK_PRIVATE_KEY,
+            chain_id=1,
+            contract_function="allow",
+            batch_size=2,
+        )
+
+        # Assert
+        mock_full_transaction_flow["prefetch"].assert_called_once_with(MOCK_SENDER_ADDRESS)
+        assert mock_full_transaction_flow["gas_prices"].call_args_list == [
+            call(latest_block=MOCK_LATEST_BLOCK)
+        ] * 3
+        blockchain_client.w3.eth.get_balance.assert_not_called()
+
+
+    def test_batch_allow_indexers_removes_duplicate_addresses_before_batching(
+        self, blockchain_client: BlockchainClient, mocker: MockerFixture, mock_full_transaction_flow: dict
+    ):
+        """
+        Tests that repeated addresses, including ones differing only in case, are sent once, in first-seen order
+        and with the casing of their first occurrence.
+        """
+        # Arrange
+        first, second = f"0x{'a' * 40}", f"0x{'b' * 40}"
+        addresses = [first, second, first.upper().replace("0X", "0x"), second]
+        mock_params = mocker.patch(
+            "src.models.blockchain_client.BlockchainClient._get_allow_indexers_transaction_params"
+        )
+        mocker.patch("src.models.blockchain_client.BlockchainClient._prepare_signed_transaction")
+        mock_full_transaction_flow["send"].side_effect = ["aa"]
+        mocker.patch(
+            "src.models.blockchain_client.BlockchainClient._wait_for_transaction_receipt",
+            side_effect=lambda tx_hash: tx_hash.hex(),
+        )
+
+        # Act
+        tx_links, _ = blockchain_client.batch_allow_indexers_issuance_eligibility(
+            indexer_addresses=addresses,
+            private_key=MOCK_PRIVATE_KEY,
+            chain_id=1,
+            contract_function="allow",
+            batch_size=2,
+        )
+
+        # Assert
+        mock_params.assert_called_once()
+        assert mock_params.call_args.args[0] == [first, second]
+        assert len(tx_links) == 1
+
+
+    def test_batch_allow_indexers_logs_all_transaction_links_in_one_line(
+        self, blockchain_client: BlockchainClient, mocker: MockerFixture, mock_full_transaction_flow: dict
+    ):
+        """
+        Tests that the transaction links of all confirmed batches are logged with a single log call.
+        """
+        # Arrange
+        addresses = [f"0x{i:040x}" for i in range(3)]
+        mocker.patch("src.models.blockchain_client.BlockchainClient._prepare_signed_transaction")
+        mock_full_transaction_flow["send"].side_effect = ["aa", "bb", "cc"]
+        mocker.patch(
+            "src.models.blockchain_client.BlockchainClient._wait_for_transaction_receipt",
+            side_effect=lambda tx_hash: tx_hash.hex(),
+        )
+        mock_logger = mocker.patch("src.models.blockchain_client.logger")
+
+        # Act
+        tx_links, _ = blockchain_client.batch_allow_indexers_issuance_eligibility(
+            indexer_addresses=addresses,
+            private_key=MOCK_PRIVATE_KEY,
+            chain_id=1,
+            contract_function="allow",
+            batch_size=1,
+        )
+
+        # Assert
+        link_log_calls = [c for c in mock_logger.info.call_args_list if c.args[0].startswith("Transaction links")]
+        assert link_log_calls == [call("Transaction links (%d):\n%s", 3, "\n".join(tx_links))]
+
+
+    def test_batch_allow_indexers_raises_after_awaiting_sent_batches_when_a_receipt_fails(
+        self, blockchain_client: BlockchainClient, mocker: MockerFixture, mock_full_transaction_flow: dict
+    ):
+        """
+        Tests that a reverted batch is reported only after the receipts of all sent batches were awaited.
+        """
+        # Arrange
+        addresses = [f"0x{i:040x}" for i in range(4)]
+        mocker.patch("src.models.blockchain_client.BlockchainClient._prepare_signed_transaction")
+        mock_full_transaction_flow["send"].side_effect = ["aa", "bb"]
 
-        # Check the contents of each call
-        assert blockchain_client.send_transaction_to_allow_indexers.call_args_list[0][0][0] == addresses[0:2]
-        assert blockchain_client.send_transaction_to_allow_indexers.call_args_list[1][0][0] == addresses[2:4]
-        assert blockchain_client.send_transaction_to_allow_indexers.call_args_list[2][0][0] == addresses[4:5]
+
+        def wait_for_receipt(tx_hash):
+            if tx_hash == b"\xaa":
+                raise Exception("Transaction failed")
+            return tx_hash.hex()
+
+        mock_wait = mocker.patch(
+            "src.models.blockchain_client.BlockchainClient._wait_for_transaction_receipt",
+            side_effect=wait_for_receipt,
+        )
+
+        # Act & Assert
+        with pytest.raises(Exception, match="Transaction failed"):
+            blockchain_client.batch_allow_indexers_issuance_eligibility(
+                indexer_addresses=addresses,
+                private_key=MOCK_PRIVATE_KEY,
+                chain_id=1,
+                contract_function="allow",
+                batch_size=2,
+            )
+        assert mock_wait.call_count == 2
 
 
-    def test_batch_allow_indexers_halts_on_failure(self, blockchain_client: BlockchainClient):
+    @pytest.mark.parametrize("failing_step", ["prepare", "send"])
+    def test_batch_allow_indexers_halts_on_failure(
+        self,
+        blockchain_client: BlockchainClient,
+        mocker: MockerFixture,
+        mock_full_transaction_flow: dict,
+        failing_step: str,
+    ):
         """
-        Tests that the batch processing halts immediately if one of the transactions fails.
+        Tests that the batch processing stops sending at the first batch that cannot be prepared or sent,
+        while the batches already sent are still awaited.
         """
         # Arrange
-        addresses = [f"0x{i}" * 40 for i in range(5)]
+        addresses = [f"0x{i:040x}" for i in range(5)]
+
+        # Simulate failure on the second batch
+        def prepare(params):
+            if failing_step == "prepare" and params["nonce"] == 2:
+                raise Exception("RPC Error")
+            return f"signed_tx_{params['nonce']}"
 
-        # Simulate failure on the second call
-        blockchain_client.send_transaction_to_allow_indexers = MagicMock(
-            side_effect=["tx_hash_1", Exception("RPC Error"), "tx_hash_3"]
+        mocker.patch(
+            "src.models.blockchain_client.BlockchainClient._prepare_signed_transaction", side_effect=prepare
+        )
+        if failing_step == "send":
+            mock_full_transaction_flow["send"].side_effect = ["a1", Exception("RPC Error"), "a3"]
+        else:
+            mock_full_transaction_flow["send"].side_effect = ["a1", "a2", "a3"]
+        mock_wait = mocker.patch(
+            "src.models.blockchain_client.BlockchainClient._wait_for_transaction_receipt", return_value="a1"
         )
 
         # Act & Assert
@@ -850,17 +1640,19 @@ class TestOrchestrationAndBatching:
             )
 
         # Assert
-        # The method should have only been called twice (the first success, the second failure)
-        assert blockchain_client.send_transaction_to_allow_indexers.call_count == 2
+        # Nothing is sent after the failing batch
+        expected_sends = 2 if failing_step == "send" else 1
+        assert mock_full_transaction_flow["send"].call_count == expected_sends
+        # The batch that was already sent is still awaited
+        mock_wait.assert_called_once_with(b"\xa1")
 
 
-    def test_batch_allow_indexers_handles_empty_list(self, blockchain_client: BlockchainClient):
+    def test_batch_allow_indexers_handles_empty_list(
+        self, blockchain_client: BlockchainClient, mock_full_transaction_flow: dict
+    ):
         """
         Tests that batch processing handles an empty list of addresses gracefully.
         """
-        # Arrange
-        blockchain_client.send_transaction_to_allow_indexers = MagicMock()
-
         # Act
         tx_hashes, rpc_provider = blockchain_client.batch_allow_indexers_issuance_eligibility(
             indexer_addresses=[],
@@ -873,4 +1665,5 @@ class TestOrchestrationAndBatching:
         # Assert
         assert tx_hashes == []
         assert rpc_provider in blockchain_client.rpc_providers
-        blockchain_client.send_transaction_to_allow_indexers.assert_not_called()
+        mock_full_transaction_flow["build_sign"].assert_not_called()
+        mock_full_transaction_flow["send"].assert_not_called()
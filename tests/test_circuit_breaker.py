@@ -2,12 +2,13 @@
 Unit tests for the CircuitBreaker utility.
 """
 
+import time
 from datetime import datetime, timedelta
 from unittest.mock import MagicMock, mock_open, patch
 
 import pytest
 
-from src.utils.circuit_breaker import CircuitBreaker
+from src.utils.circuit_breaker import LOG_TAIL_BYTES, MAX_LOG_FILE_BYTES, CircuitBreaker
 
 
 @pytest.fixture
@@ -16,6 +17,7 @@ def mock_path():
     with patch("src.utils.circuit_breaker.Path"):
         mock_instance = MagicMock()
         mock_instance.exists.return_value = False
+        mock_instance.stat.return_value.st_size = 0
         mock_instance.open = mock_open()
         yield mock_instance
 
@@ -42,8 +44,8 @@ def test_check_returns_true_when_failures_are_below_threshold(breaker: CircuitBr
     WHEN check() is called
     THEN it should return True.
     """
-    now = datetime.now()
-    timestamps = [(now - timedelta(minutes=i)).isoformat() for i in range(2)]  # 2 failures
+    now = int(time.time())
+    timestamps = [str(now - i * 60) for i in range(2)]  # 2 failures
     mock_path.exists.return_value = True
     mock_path.open.return_value.__enter__.return_value.readlines.return_value = [f"{ts}\n" for ts in timestamps]
 
@@ -56,8 +58,8 @@ def test_check_returns_false_when_failures_meet_threshold(breaker: CircuitBreake
     WHEN check() is called
     THEN it should return False, halting execution.
     """
-    now = datetime.now()
-    timestamps = [(now - timedelta(minutes=i)).isoformat() for i in range(3)]  # 3 failures
+    now = int(time.time())
+    timestamps = [str(now - i * 60) for i in reversed(range(3))]  # 3 failures
     mock_path.exists.return_value = True
     mock_path.open.return_value.__enter__.return_value = mock_open(read_data="\n".join(timestamps)).return_value
 
@@ -70,12 +72,12 @@ def test_check_ignores_old_failures(breaker: CircuitBreaker, mock_path: MagicMoc
     WHEN check() is called
     THEN it should only count recent failures and return True.
     """
-    now = datetime.now()
+    now = int(time.time())
     timestamps = [
-        (now - timedelta(minutes=10)).isoformat(),  # Recent
-        (now - timedelta(minutes=20)).isoformat(),  # Recent
-        (now - timedelta(minutes=70)).isoformat(),  # Old
-        (now - timedelta(minutes=80)).isoformat(),  # Old
+        str(now - 80 * 60),  # Old
+        str(now - 70 * 60),  # Old
+        str(now - 20 * 60),  # Recent
+        str(now - 10 * 60),  # Recent
     ]
     mock_path.exists.return_value = True
     mock_path.open.return_value.__enter__.return_value = mock_open(read_data="\n".join(timestamps)).return_value
@@ -83,6 +85,66 @@ def test_check_ignores_old_failures(breaker: CircuitBreaker, mock_path: MagicMoc
     assert breaker.check() is True
 
 
+def test_check_only_parses_entries_that_can_open_the_circuit(breaker: CircuitBreaker, mock_path: MagicMock):
+    """
+    GIVEN a long log file whose older entries are corrupted
+    WHEN check() is called
+    THEN only the last failure_threshold entries should be parsed, and recent failures should open the circuit.
+    """
+    now = int(time.time())
+    timestamps = ["not-a-timestamp"] * 100 + [str(now - i * 60) for i in reversed(range(3))]
+    mock_path.exists.return_value = True
+    mock_path.open.return_value.__enter__.return_value = mock_open(read_data="\n".join(timestamps)).return_value
+
+    assert breaker.check() is False
+
+
+def test_check_reads_only_the_tail_of_a_long_log(tmp_path):
+    """
+    GIVEN a log file longer than the tail read, with corrupted entries before the tail
+    WHEN check() is called
+    THEN it should parse only the tail and open the circuit on its recent failures.
+    """
+    now = int(time.time())
+    log_file = tmp_path / "circuit_breaker.log"
+    recent_entries = [str(now - i * 60) for i in reversed(range(3))]
+    log_file.write_text("\n".join(["not-a-timestamp"] * LOG_TAIL_BYTES + recent_entries) + "\n")
+    breaker = CircuitBreaker(failure_threshold=3, window_minutes=60, log_file=log_file)
+
+    assert breaker.check() is False
+
+
+def test_check_reads_whole_log_when_tail_holds_too_few_entries(tmp_path):
+    """
+    GIVEN a log file whose tail holds fewer entries than the failure threshold
+    WHEN check() is called
+    THEN it should read the whole file and count every recent failure.
+    """
+    now = int(time.time())
+    log_file = tmp_path / "circuit_breaker.log"
+    entry_count = LOG_TAIL_BYTES // 5
+    log_file.write_text("\n".join(str(now - i) for i in reversed(range(entry_count))) + "\n")
+    breaker = CircuitBreaker(failure_threshold=entry_count, window_minutes=60, log_file=log_file)
+
+    assert breaker.check() is False
+
+
+def test_check_counts_failures_across_old_and_new_log_formats(tmp_path):
+    """
+    GIVEN a log file with ISO datetime entries written by an older version, an unparseable entry
+        and epoch second entries written since
+    WHEN check() is called
+    THEN it should skip the unparseable entry and count the recent failures in both formats.
+    """
+    now = datetime.now()
+    log_file = tmp_path / "circuit_breaker.log"
+    iso_entries = [(now - timedelta(minutes=minutes)).isoformat() for minutes in (20, 10)]
+    log_file.write_text("\n".join([*iso_entries, "not-a-timestamp", str(int(now.timestamp()))]) + "\n")
+    breaker = CircuitBreaker(failure_threshold=3, window_minutes=60, log_file=log_file)
+
+    assert breaker.check() is False
+
+
 def test_record_failure_appends_timestamp_to_log(breaker: CircuitBreaker, mock_path: MagicMock):
     """
     GIVEN a circuit breaker
@@ -97,6 +159,28 @@ def test_record_failure_appends_timestamp_to_log(breaker: CircuitBreaker, mock_p
     handle = mock_path.open()
     handle.write.assert_called_once()
     assert len(handle.write.call_args[0][0]) > 10
+    assert handle.write.call_args[0][0].strip().isdigit()
+
+
+def test_record_failure_truncates_oversized_log_to_recent_entries(tmp_path):
+    """
+    GIVEN a circuit breaker log file larger than the size limit, mostly made of old and corrupted entries
+    WHEN record_failure() is called
+    THEN the log should be rewritten with only the entries from the last two windows.
+    """
+    now = int(time.time())
+    log_file = tmp_path / "circuit_breaker.log"
+    old_entries = [str(now - 24 * 60 * 60)] * (MAX_LOG_FILE_BYTES // 8)
+    recent_entries = [str(now - 90 * 60), str(now - 10 * 60)]
+    log_file.write_text("\n".join(["not-a-timestamp", *old_entries, *recent_entries]) + "\n")
+    breaker = CircuitBreaker(failure_threshold=3, window_minutes=60, log_file=log_file)
+
+    breaker.record_failure()
+
+    lines = log_file.read_text().splitlines()
+    assert lines[:2] == recent_entries
+    assert len(lines) == 3
+    assert not (tmp_path / "circuit_breaker.log.tmp").exists()
 
 
 def test_reset_deletes_log_file(breaker: CircuitBreaker, mock_path: MagicMock):
@@ -119,3 +203,34 @@ def test_reset_does_nothing_if_log_file_does_not_exist(breaker: CircuitBreaker,
     mock_path.exists.return_value = False
     breaker.reset()
     mock_path.unlink.assert_not_called()
+
+
+def test_reset_skips_filesystem_when_check_found_no_log_file(breaker: CircuitBreaker, mock_path: MagicMock):
+    """
+    GIVEN check() found no circuit breaker log file and no failure was recorded since
+    WHEN reset() is called
+    THEN it should not touch the filesystem again.
+    """
+    mock_path.exists.return_value = False
+    breaker.check()
+
+    breaker.reset()
+
+    mock_path.exists.assert_called_once()
+    mock_path.unlink.assert_not_called()
+
+
+def test_reset_deletes_log_file_recorded_after_check(breaker: CircuitBreaker, mock_path: MagicMock):
+    """
+    GIVEN check() found no circuit breaker log file but a failure was recorded afterwards
+    WHEN reset() is called
+    THEN it should delete the log file.
+    """
+    mock_path.exists.return_value = False
+    breaker.check()
+    breaker.record_failure()
+    mock_path.exists.return_value = True
+
+    breaker.reset()
+
+    mock_path.unlink.assert_called_once()
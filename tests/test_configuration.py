@@ -3,6 +3,7 @@ Unit tests for the configuration loader and validator.
 """
 
 import json
+import os
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -12,8 +13,12 @@ from src.utils.configuration import (
     ConfigLoader,
     ConfigurationError,
     CredentialManager,
+    _find_default_config_path,
+    _raw_config_cache,
     _validate_config,
+    invalidate_config_cache,
     load_config,
+    tomllib,
     validate_all_required_env_vars,
 )
 
@@ -63,6 +68,18 @@ MOCK_AUTH_USER_JSON = (
 # --- Fixtures ---
 
 
+@pytest.fixture(autouse=True)
+def clear_config_cache():
+    """Ensures every test starts and ends without a cached configuration, config loader, config path or TOML."""
+    invalidate_config_cache()
+    _find_default_config_path.cache_clear()
+    _raw_config_cache.clear()
+    yield
+    invalidate_config_cache()
+    _find_default_config_path.cache_clear()
+    _raw_config_cache.clear()
+
+
 @pytest.fixture
 def mock_service_account_json() -> str:
     """Provides a mock service account JSON string."""
@@ -173,6 +190,24 @@ class TestConfigLoader:
         assert config["MIN_ONLINE_DAYS"] == 5  # Should be converted to int
 
 
+    def test_substitute_env_vars_handles_names_sharing_a_prefix(self, temp_config_file: str, monkeypatch):
+        """
+        GIVEN a string referencing two environment variables where one name is a prefix of the other
+        WHEN env vars are substituted
+        THEN each reference should be replaced by its own variable's value.
+        """
+        # Arrange
+        monkeypatch.setenv("RPC", "http://rpc.com")
+        monkeypatch.setenv("RPC_KEY", "secret")
+        loader = ConfigLoader(config_path=temp_config_file)
+
+        # Act
+        result = loader._substitute_env_vars({"urls": ["$RPC/$RPC_KEY", "$RPC_KEY@$RPC"]})
+
+        # Assert
+        assert result == {"urls": ["http://rpc.com/secret", "secret@http://rpc.com"]}
+
+
     def test_load_config_defaults_optional_integers_to_none(self, temp_config_file: str, mock_env):
         """
         GIVEN a config file where optional integer fields are missing
@@ -244,6 +279,40 @@ class TestConfigLoader:
             loader.get_flat_config()
 
 
+    def test_substitute_env_vars_raises_for_missing_whole_reference(self, temp_config_file: str, monkeypatch):
+        """
+        GIVEN a value that is a single reference to an unset environment variable
+        WHEN env vars are substituted
+        THEN it should raise a ConfigurationError naming the variable.
+        """
+        # Arrange
+        monkeypatch.delenv("MISSING_SECRET", raising=False)
+        loader = ConfigLoader(config_path=temp_config_file)
+
+        # Act & Assert
+        with pytest.raises(ConfigurationError, match="MISSING_SECRET is not set"):
+            loader._substitute_env_vars({"secret": "$MISSING_SECRET"})
+
+
+    def test_substitute_env_vars_reads_each_env_var_once(self, temp_config_file: str, monkeypatch):
+        """
+        GIVEN a config referencing the same environment variable many times
+        WHEN env vars are substituted
+        THEN the variable should be read from the environment only once.
+        """
+        # Arrange
+        monkeypatch.setenv("RPC_KEY", "secret")
+        loader = ConfigLoader(config_path=temp_config_file)
+
+        # Act
+        with patch("src.utils.configuration.os.environ.get", wraps=os.environ.get) as mock_environ_get:
+            result = loader._substitute_env_vars({"urls": ["$RPC_KEY"] * 3, "key": "$RPC_KEY"})
+
+        # Assert
+        assert result == {"urls": ["secret"] * 3, "key": "secret"}
+        mock_environ_get.assert_called_once_with("RPC_KEY")
+
+
     def test_get_default_config_path_returns_docker_path(self, monkeypatch):
         """
         GIVEN the app is running in a Docker-like environment
@@ -323,6 +392,31 @@ class TestConfigLoader:
             ConfigLoader()._get_default_config_path()
 
 
+    def test_get_default_config_path_is_looked_up_once(self, monkeypatch):
+        """
+        GIVEN the default config path has already been found
+        WHEN another ConfigLoader is created
+        THEN it should reuse the path without checking the filesystem again.
+        """
+        # Arrange
+        exists_calls = []
+
+
+        def mock_exists(path_obj):
+            exists_calls.append(path_obj)
+            return str(path_obj) == "/app/config.toml"
+
+        monkeypatch.setattr(Path, "exists", mock_exists)
+        ConfigLoader()
+
+        # Act
+        loader = ConfigLoader()
+
+        # Assert
+        assert loader.config_path == "/app/config.toml"
+        assert len(exists_calls) == 1
+
+
     def test_get_missing_env_vars_returns_missing_vars(self, monkeypatch, temp_config_file: str):
         """
         GIVEN a config file with environment variable placeholders
@@ -339,6 +433,49 @@ class TestConfigLoader:
         assert sorted(missing) == sorted(["TEST_PRIVATE_KEY", "STUDIO_API_KEY"])
 
 
+    def test_get_missing_env_vars_parses_config_once(self, monkeypatch, temp_config_file: str):
+        """
+        GIVEN a config loader that has already reported missing env vars
+        WHEN the vars are set and get_missing_env_vars is called again
+        THEN it should reuse the parsed config and reflect the current environment.
+        """
+        # Arrange
+        monkeypatch.delenv("TEST_PRIVATE_KEY", raising=False)
+        monkeypatch.delenv("STUDIO_API_KEY", raising=False)
+        loader = ConfigLoader(config_path=temp_config_file)
+        assert loader.get_missing_env_vars() == ["STUDIO_API_KEY", "TEST_PRIVATE_KEY"]
+        monkeypatch.setenv("TEST_PRIVATE_KEY", "0x12345")
+
+        # Act
+        with patch("src.utils.configuration.tomllib.load") as mock_toml_load:
+            missing = loader.get_missing_env_vars()
+
+        # Assert
+        mock_toml_load.assert_not_called()
+        assert missing == ["STUDIO_API_KEY"]
+
+
+    def test_get_raw_config_reuses_parsed_file_until_it_changes(self, temp_config_file: str):
+        """
+        GIVEN a config file already parsed by one loader
+        WHEN new loaders read it before and after the file changes
+        THEN the file should be parsed again only after it changed.
+        """
+        # Arrange
+        first = ConfigLoader(config_path=temp_config_file)._get_raw_config()
+
+        # Act
+        with patch("src.utils.configuration.tomllib.load", wraps=tomllib.load) as mock_toml_load:
+            unchanged = ConfigLoader(config_path=temp_config_file)._get_raw_config()
+            Path(temp_config_file).write_text(MOCK_TOML_CONFIG.replace('"test-project"', '"other-project"'))
+            changed = ConfigLoader(config_path=temp_config_file)._get_raw_config()
+
+        # Assert
+        assert unchanged is first
+        assert mock_toml_load.call_count == 1
+        assert changed["bigquery"]["BIGQUERY_PROJECT_ID"] == "other-project"
+
+
     @pytest.mark.parametrize(
         "rpc_input, expected_output",
         [
@@ -348,6 +485,7 @@ class TestConfigLoader:
             ("not-a-list", []),
             (["  "], []),
             (["http://test.com"], ["http://test.com"]),
+            (["http://test.com", 8545], []),
         ],
     )
     def test_parse_rpc_urls_handles_various_formats(self, rpc_input, expected_output):
@@ -402,6 +540,44 @@ class TestConfigLoader:
         assert config["MIN_ONLINE_DAYS"] is None
 
 
+    @pytest.mark.parametrize(
+        "toml_value, expected",
+        [('"true"', True), ('"FALSE"', False), ("true", True), ("false", False), ('""', None)],
+    )
+    def test_load_config_parses_boolean_values(self, tmp_path: Path, toml_value: str, expected):
+        """
+        GIVEN a config with a "true" or "false" string, a TOML boolean or an empty string for a boolean field
+        WHEN the config is loaded
+        THEN it should be converted to the matching boolean, or None when empty.
+        """
+        # Arrange
+        config_path = tmp_path / "config.toml"
+        config_path.write_text(f"[processing]\nARCHIVE_RAW_BIGQUERY_DATA = {toml_value}\n")
+        loader = ConfigLoader(config_path=str(config_path))
+
+        # Act
+        config = loader.get_flat_config()
+
+        # Assert
+        assert config["ARCHIVE_RAW_BIGQUERY_DATA"] is expected
+
+
+    def test_load_config_fails_on_invalid_boolean(self, tmp_path: Path):
+        """
+        GIVEN a config with an unrecognised value for a boolean field
+        WHEN the config is loaded
+        THEN it should raise a ConfigurationError naming the field.
+        """
+        # Arrange
+        config_path = tmp_path / "config.toml"
+        config_path.write_text('[processing]\nARCHIVE_RAW_BIGQUERY_DATA = "yes"\n')
+        loader = ConfigLoader(config_path=str(config_path))
+
+        # Act & Assert
+        with pytest.raises(ConfigurationError, match="Invalid value for ARCHIVE_RAW_BIGQUERY_DATA"):
+            loader.get_flat_config()
+
+
 class TestConfigValidation:
     """Tests for config validation logic."""
 
@@ -447,7 +623,8 @@ class TestConfigValidation:
             _validate_config(config)
 
 
-    def test_validate_config_fails_on_invalid_time_format(self, full_valid_config: dict):
+    @pytest.mark.parametrize("invalid_time", ["invalid-time", "24:00", "10:60", "9:30", "10:30:00", " 10:30"])
+    def test_validate_config_fails_on_invalid_time_format(self, full_valid_config: dict, invalid_time: str):
         """
         GIVEN a config with an invalid SCHEDULED_RUN_TIME format
         WHEN _validate_config is called
@@ -455,7 +632,7 @@ class TestConfigValidation:
         """
         # Arrange
         config = full_valid_config.copy()
-        config["SCHEDULED_RUN_TIME"] = "invalid-time"
+        config["SCHEDULED_RUN_TIME"] = invalid_time
 
         # Act & Assert
         with pytest.raises(ConfigurationError, match="Invalid SCHEDULED_RUN_TIME"):
@@ -507,6 +684,28 @@ class TestConfigValidation:
                 validate_all_required_env_vars()
 
 
+    def test_validate_all_required_env_vars_shares_parsed_config_with_load_config(self, mock_env):
+        """
+        GIVEN env var validation followed by loading the config, as on scheduler startup
+        WHEN both are called
+        THEN config.toml should be parsed only once, by a single shared ConfigLoader.
+        """
+        # Arrange
+        with (
+            patch("src.utils.configuration.ConfigLoader") as mock_loader,
+            patch("src.utils.configuration._validate_config", side_effect=lambda config: config),
+        ):
+            mock_loader.return_value.get_missing_env_vars.return_value = []
+            mock_loader.return_value.get_flat_config.return_value = {"key": "value"}
+
+            # Act
+            validate_all_required_env_vars()
+            load_config()
+
+            # Assert
+            mock_loader.assert_called_once_with()
+
+
 class TestCredentialManager:
     """Tests for the CredentialManager class."""
 
@@ -516,11 +715,11 @@ class TestCredentialManager:
         [
             (
                 '{"type": "service_account", "client_email": "ce", "project_id": "pi"}',
-                "Incomplete service_account",
+                "Incomplete service_account credentials, missing: private_key",
             ),
             (
                 '{"type": "authorized_user", "client_id": "ci", "client_secret": "cs"}',
-                "Incomplete authorized_user",
+                "Incomplete authorized_user credentials, missing: refresh_token",
             ),
             ('{"type": "unsupported"}', "Unsupported credential type"),
             ("{not valid json}", "Invalid credentials JSON"),
@@ -587,6 +786,47 @@ class TestCredentialManager:
         assert call_args[0] == parsed_json
 
 
+    def test_setup_google_credentials_reuses_unchanged_inline_credentials(
+        self, mock_env, mock_google_auth, mock_service_account_json
+    ):
+        """
+        GIVEN inline credentials that were already installed by a previous call
+        WHEN setup_google_credentials is called again with the same JSON
+        THEN the installed credentials, and their cached token, should be kept instead of being rebuilt.
+        """
+        # Arrange
+        mock_env.setenv("GOOGLE_APPLICATION_CREDENTIALS", mock_service_account_json)
+        manager = CredentialManager()
+        manager.setup_google_credentials()
+
+        # Act
+        manager.setup_google_credentials()
+
+        # Assert
+        mock_google_auth["service_account"].Credentials.from_service_account_info.assert_called_once()
+
+
+    def test_setup_google_credentials_rebuilds_changed_inline_credentials(
+        self, mock_env, mock_google_auth, mock_service_account_json, mock_auth_user_json
+    ):
+        """
+        GIVEN inline credentials that were already installed by a previous call
+        WHEN setup_google_credentials is called with different JSON
+        THEN the new credentials should be built and installed.
+        """
+        # Arrange
+        mock_env.setenv("GOOGLE_APPLICATION_CREDENTIALS", mock_service_account_json)
+        manager = CredentialManager()
+        manager.setup_google_credentials()
+        mock_env.setenv("GOOGLE_APPLICATION_CREDENTIALS", mock_auth_user_json)
+
+        # Act
+        manager.setup_google_credentials()
+
+        # Assert
+        mock_google_auth["creds"].assert_called_once()
+
+
     def test_setup_service_account_fails_on_sdk_error(self, mock_env, mock_google_auth, mock_service_account_json):
         """
         GIVEN the Google SDK fails to create credentials from service account info
@@ -763,3 +1003,66 @@ class TestLoadConfig:
         mock_loader_instance.get_flat_config.assert_called_once()
         mock_validate.assert_called_once_with({"key": "value"})
         assert config == {"validated_key": "validated_value"}
+
+
+    @patch("src.utils.configuration._validate_config")
+    @patch("src.utils.configuration.ConfigLoader")
+    def test_load_config_reports_missing_key_as_config_error(self, mock_loader_cls, mock_validate, mock_env):
+        """
+        GIVEN a configuration that is missing a key
+        WHEN load_config is called
+        THEN it should raise a ConfigurationError chained to the KeyError.
+        """
+        # Arrange
+        mock_loader_cls.return_value.get_flat_config.return_value = {}
+        mock_validate.side_effect = KeyError("SCHEDULED_RUN_TIME")
+
+        # Act & Assert
+        with pytest.raises(ConfigurationError, match="Missing configuration key") as excinfo:
+            load_config()
+        assert isinstance(excinfo.value.__cause__, KeyError)
+
+
+    @patch("src.utils.configuration._validate_config")
+    @patch("src.utils.configuration.ConfigLoader")
+    def test_load_config_caches_validated_config(self, mock_loader_cls, mock_validate, mock_env):
+        """
+        GIVEN a configuration that has already been loaded
+        WHEN load_config is called again
+        THEN it should return an equal copy without reloading or revalidating.
+        """
+        # Arrange
+        mock_validate.return_value = {"validated_key": "validated_value"}
+
+        # Act
+        first = load_config()
+        first["validated_key"] = "mutated"
+        second = load_config()
+
+        # Assert
+        mock_loader_cls.return_value.get_flat_config.assert_called_once()
+        mock_validate.assert_called_once()
+        assert second == {"validated_key": "validated_value"}
+
+
+    @patch("src.utils.configuration._validate_config")
+    @patch("src.utils.configuration.ConfigLoader")
+    def test_invalidate_config_cache_makes_next_load_read_config_again(
+        self, mock_loader_cls, mock_validate, mock_env
+    ):
+        """
+        GIVEN a configuration that has already been loaded
+        WHEN invalidate_config_cache is called
+        THEN nothing is loaded until the next load_config call, which loads the configuration again.
+        """
+        # Arrange
+        mock_validate.side_effect = [{"version": 1}, {"version": 2}]
+        load_config()
+
+        # Act
+        invalidate_config_cache()
+
+        # Assert
+        assert mock_loader_cls.return_value.get_flat_config.call_count == 1
+        assert load_config() == {"version": 2}
+        assert mock_loader_cls.return_value.get_flat_config.call_count == 2
@@ -7,7 +7,9 @@ import shutil
 from datetime import date, timedelta
 from pathlib import Path
 from typing import List
+from unittest.mock import patch
 
+import numpy as np
 import pandas as pd
 import pytest
 from pytest import FixtureRequest
@@ -95,6 +97,28 @@ def non_numeric_data() -> pd.DataFrame:
     )
 
 
+@pytest.fixture
+def bool_value_data() -> pd.DataFrame:
+    """Provides a sample DataFrame with a boolean eligibility column, as returned for BigQuery BOOL types."""
+    return pd.DataFrame(
+        {
+            "indexer": ["0x1", "0x2", "0x3", "0x4"],
+            "eligible_for_indexing_rewards": [True, False, True, False],
+        }
+    )
+
+
+@pytest.fixture
+def nullable_int_data() -> pd.DataFrame:
+    """Provides a sample DataFrame with a nullable integer eligibility column containing a null."""
+    return pd.DataFrame(
+        {
+            "indexer": ["0x1", "0x2", "0x3"],
+            "eligible_for_indexing_rewards": pd.array([1, None, 0], dtype="Int64"),
+        }
+    )
+
+
 # --- Test Helpers ---
 
 
@@ -107,7 +131,7 @@ def _assert_output_files(
 ) -> None:
     """Helper to assert file creation and content."""
     output_dir = pipeline.get_date_output_directory(current_date)
-    raw_path = output_dir / "indexer_issuance_eligibility_data.csv"
+    raw_path = output_dir / "indexer_issuance_eligibility_data.parquet"
     eligible_path = output_dir / "eligible_indexers.csv"
     ineligible_path = output_dir / "ineligible_indexers.csv"
 
@@ -116,7 +140,7 @@ def _assert_output_files(
     assert ineligible_path.exists(), "Ineligible indexers file was not created."
 
     # Verify content of the created files
-    raw_df = pd.read_csv(raw_path)
+    raw_df = pd.read_parquet(raw_path)
     eligible_df = pd.read_csv(eligible_path)
     ineligible_df = pd.read_csv(ineligible_path)
 
@@ -139,6 +163,8 @@ def _assert_output_files(
         ("float_value_data", ["0x1", "0x3"], ["0x2", "0x4"]),
         ("duplicate_indexer_data", ["0x1", "0x1", "0x3"], ["0x2"]),
         ("non_numeric_data", ["0x1"], ["0x2", "0x3"]),
+        ("bool_value_data", ["0x1", "0x3"], ["0x2", "0x4"]),
+        ("nullable_int_data", ["0x1"], ["0x2", "0x3"]),
     ],
     ids=[
         "mixed_eligibility",
@@ -149,6 +175,8 @@ def _assert_output_files(
         "float_values_for_eligibility",
         "data_with_duplicate_indexers",
         "data_with_non_numeric_values",
+        "bool_values_for_eligibility",
+        "nullable_int_values_for_eligibility",
     ],
 )
 def test_process_filters_and_saves_data_correctly(
@@ -203,6 +231,76 @@ def test_process_fails_on_none_input(pipeline: EligibilityPipeline):
         pipeline.process(invalid_input, current_date=date.today())
 
 
+def test_process_propagates_file_write_errors(pipeline: EligibilityPipeline, sample_data: pd.DataFrame):
+    """
+    Tests that a failure writing one of the output files is raised from `process`.
+    """
+    # Arrange
+    with patch.object(pd.DataFrame, "to_parquet", side_effect=OSError("Disk full")):
+        # Act & Assert
+        with pytest.raises(OSError, match="Disk full"):
+            pipeline.process(sample_data, current_date=date.today())
+
+
+# --- Tests for save_indexer_lists() ---
+
+
+def test_save_indexer_lists_writes_csvs_without_raw_data(tmp_path: Path):
+    """
+    Tests that `save_indexer_lists` writes the indexer CSVs without a raw data archive,
+    and that the result counts as existing processed data when archiving is disabled.
+    """
+    # Arrange
+    pipeline = EligibilityPipeline(project_root=tmp_path, archive_raw_data=False)
+    current_date = date.today()
+
+    # Act
+    eligible, ineligible = pipeline.save_indexer_lists(["0x1", "0x3"], ["0x2"], current_date)
+
+    # Assert
+    output_dir = pipeline.get_date_output_directory(current_date)
+    assert (eligible, ineligible) == (["0x1", "0x3"], ["0x2"])
+    assert not (output_dir / "indexer_issuance_eligibility_data.parquet").exists()
+    assert pd.read_csv(output_dir / "eligible_indexers.csv")["indexer"].tolist() == ["0x1", "0x3"]
+    assert pd.read_csv(output_dir / "ineligible_indexers.csv")["indexer"].tolist() == ["0x2"]
+    assert pipeline.has_existing_processed_data(current_date)
+    assert not EligibilityPipeline(project_root=tmp_path).has_existing_processed_data(current_date)
+
+
+def test_save_indexer_lists_writes_header_only_csv_for_empty_list(tmp_path: Path):
+    """
+    Tests that an empty indexer list is written as a CSV holding only the header row.
+    """
+    # Arrange
+    pipeline = EligibilityPipeline(project_root=tmp_path, archive_raw_data=False)
+    current_date = date.today()
+
+    # Act
+    pipeline.save_indexer_lists(["0x1"], [], current_date)
+
+    # Assert
+    output_dir = pipeline.get_date_output_directory(current_date)
+    assert (output_dir / "eligible_indexers.csv").read_text() == "indexer\n0x1\n"
+    assert (output_dir / "ineligible_indexers.csv").read_text() == "indexer\n"
+
+
+def test_save_indexer_lists_writes_missing_addresses_as_empty_fields(tmp_path: Path):
+    """
+    Tests that missing addresses are written as empty CSV fields, as DataFrame.to_csv would, instead of failing.
+    """
+    # Arrange
+    pipeline = EligibilityPipeline(project_root=tmp_path, archive_raw_data=False)
+    current_date = date.today()
+
+    # Act
+    pipeline.save_indexer_lists(["0x1", None], ["0x2", np.nan], current_date)
+
+    # Assert
+    output_dir = pipeline.get_date_output_directory(current_date)
+    assert (output_dir / "eligible_indexers.csv").read_text() == "indexer\n0x1\n\n"
+    assert (output_dir / "ineligible_indexers.csv").read_text() == "indexer\n0x2\n\n"
+
+
 # --- Tests for clean_old_date_directories() ---
 
 
@@ -243,6 +341,31 @@ def test_clean_old_date_directories_removes_correct_directories(
         assert not dirs_to_create[day].exists(), f"Directory for {day} days ago should have been deleted."
 
 
+def test_clean_old_date_directories_continues_when_removal_fails(pipeline: EligibilityPipeline):
+    """
+    Tests that a directory which cannot be removed does not stop the remaining old directories from being removed.
+    """
+    # Arrange
+    old_dirs = [pipeline.get_date_output_directory(date.today() - timedelta(days=day)) for day in (40, 41)]
+    for d in old_dirs:
+        d.mkdir(parents=True)
+    real_rmtree = shutil.rmtree
+
+
+    def flaky_rmtree(path):
+        if Path(path) == old_dirs[0]:
+            raise OSError("Permission denied")
+        real_rmtree(path)
+
+    # Act
+    with patch("src.models.eligibility_pipeline.shutil.rmtree", side_effect=flaky_rmtree):
+        pipeline.clean_old_date_directories(max_age_before_deletion=30)
+
+    # Assert
+    assert old_dirs[0].exists()
+    assert not old_dirs[1].exists()
+
+
 def test_clean_old_date_directories_ignores_malformed_names(pipeline: EligibilityPipeline):
     """
     Tests that `clean_old_date_directories` ignores directories with names that
@@ -255,10 +378,12 @@ def test_clean_old_date_directories_ignores_malformed_names(pipeline: Eligibilit
     # Create directories and a file to test against
     old_dir_to_be_deleted = pipeline.get_date_output_directory(old_date)
     malformed_dir = pipeline.output_dir / "not-a-date"
+    invalid_date_dir = pipeline.output_dir / "2000-13-40"
     some_file = pipeline.output_dir / "some-file.txt"
 
     old_dir_to_be_deleted.mkdir(parents=True)
     malformed_dir.mkdir(parents=True)
+    invalid_date_dir.mkdir(parents=True)
     some_file.touch()
 
     # Act
@@ -267,6 +392,7 @@ def test_clean_old_date_directories_ignores_malformed_names(pipeline: Eligibilit
     # Assert
     assert not old_dir_to_be_deleted.exists()
     assert malformed_dir.exists()
+    assert invalid_date_dir.exists()
     assert some_file.exists()
 
 
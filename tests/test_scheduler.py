@@ -3,6 +3,7 @@ Unit tests for the Scheduler, organized for clarity and complete coverage.
 """
 
 import sys
+import threading
 from datetime import date, datetime, timedelta
 from types import SimpleNamespace
 from unittest.mock import MagicMock, call, mock_open, patch
@@ -10,7 +11,7 @@ from unittest.mock import MagicMock, call, mock_open, patch
 import pytest
 from tenacity import wait_fixed
 
-from src.models.scheduler import Scheduler
+from src.models.scheduler import HEARTBEAT_INTERVAL_SECONDS, Scheduler, _raise_keyboard_interrupt
 from src.utils.configuration import ConfigurationError
 
 MOCK_CONFIG = {
@@ -39,11 +40,14 @@ def mock_dependencies():
     with (
         patch("src.models.scheduler.validate_all_required_env_vars") as mock_validate,
         patch("src.models.scheduler.load_config", return_value=MOCK_CONFIG) as mock_load_config,
+        patch("src.models.scheduler.invalidate_config_cache") as mock_invalidate_config_cache,
         patch("src.models.scheduler.create_slack_notifier") as mock_create_slack,
         patch("src.models.scheduler.credential_manager") as mock_creds,
         patch("src.models.scheduler.schedule") as mock_schedule,
         patch("src.models.scheduler.oracle") as mock_oracle,
         patch("src.models.scheduler.os") as mock_os,
+        patch("src.models.scheduler.signal") as mock_signal,
+        patch("src.models.scheduler.fcntl") as mock_fcntl,
         patch("builtins.open", new_callable=mock_open) as mock_open_file,
         patch("src.models.scheduler.sys.exit") as mock_exit,
         patch("src.models.scheduler.logger") as mock_logger,
@@ -62,12 +66,15 @@ def mock_dependencies():
         yield SimpleNamespace(
             validate=mock_validate,
             load_config=mock_load_config,
+            invalidate_config_cache=mock_invalidate_config_cache,
             create_slack=mock_create_slack,
             slack_notifier=mock_slack_notifier,
             creds=mock_creds,
             schedule=mock_schedule,
             oracle=mock_oracle,
             os=mock_os,
+            signal=mock_signal,
+            fcntl=mock_fcntl,
             open=mock_open_file,
             exit=mock_exit,
             logger=mock_logger,
@@ -83,6 +90,7 @@ def scheduler(mock_dependencies: SimpleNamespace) -> Scheduler:
         sch = Scheduler()
         sch.config = MOCK_CONFIG
         sch.slack_notifier = mock_dependencies.slack_notifier
+        sch.healthcheck_message = None
         sch.logger = mock_dependencies.logger
         yield sch
 
@@ -108,7 +116,7 @@ class TestSchedulerInitialization:
                 scheduler.run_oracle, run_date_override=None
             )
             mock_check_missed.assert_called_once()
-            mock_dependencies.open.assert_any_call("/app/healthcheck", "w")
+            mock_dependencies.os.replace.assert_any_call("/app/healthcheck.tmp", "/app/healthcheck")
 
 
     def test_init_handles_config_error_and_exits(self, mock_dependencies: SimpleNamespace):
@@ -253,8 +261,25 @@ class TestSchedulerStateManagement:
         scheduler.save_last_run_date(run_date)
 
         mock_dependencies.os.makedirs.assert_called_once_with(expected_dir, exist_ok=True)
-        mock_dependencies.open.assert_called_once_with("/app/data/last_run.txt", "w")
-        mock_dependencies.open().write.assert_called_once_with("2023-10-27")
+        mock_dependencies.open.assert_called_once_with("/app/data/last_run.txt.tmp", "w")
+        file_handle = mock_dependencies.open.return_value.__enter__.return_value
+        file_handle.write.assert_called_once_with("2023-10-27")
+        mock_dependencies.os.fsync.assert_called_once_with(file_handle.fileno())
+        mock_dependencies.os.replace.assert_called_once_with(
+            "/app/data/last_run.txt.tmp", "/app/data/last_run.txt"
+        )
+
+
+    def test_save_last_run_date_keeps_previous_file_when_write_fails(
+        self, scheduler: Scheduler, mock_dependencies: SimpleNamespace
+    ):
+        """Tests that a failed write never replaces the previous last run file."""
+        mock_dependencies.open.return_value.__enter__.return_value.write.side_effect = IOError("Disk full")
+
+        scheduler.save_last_run_date(date(2023, 10, 27))
+
+        mock_dependencies.os.replace.assert_not_called()
+        mock_dependencies.logger.error.assert_called_with("Error saving last run date: Disk full")
 
 
     def test_save_last_run_date_logs_error_on_io_error(
@@ -272,10 +297,34 @@ class TestSchedulerStateManagement:
         """Tests that `update_healthcheck` writes a timestamp and message to the healthcheck file."""
         mock_dependencies.datetime.now.return_value = datetime(2023, 10, 27)
         scheduler.update_healthcheck("testing")
-        mock_dependencies.open.assert_called_once_with("/app/healthcheck", "w")
+        mock_dependencies.open.assert_called_once_with("/app/healthcheck.tmp", "w")
         file_handle = mock_dependencies.open.return_value.__enter__.return_value
-        assert file_handle.write.call_args_list[0].args[0].startswith("Last update:")
-        assert "testing" in file_handle.write.call_args_list[1].args[0]
+        file_handle.write.assert_called_once_with("Last update: 2023-10-27T00:00:00\ntesting")
+        mock_dependencies.os.fsync.assert_not_called()
+        mock_dependencies.os.replace.assert_called_once_with("/app/healthcheck.tmp", "/app/healthcheck")
+
+
+    def test_update_healthcheck_only_touches_file_when_message_is_unchanged(
+        self, scheduler: Scheduler, mock_dependencies: SimpleNamespace
+    ):
+        """Tests that repeating the previous message bumps the file's mtime instead of rewriting it."""
+        scheduler.update_healthcheck("Scheduler heartbeat")
+        scheduler.update_healthcheck("Scheduler heartbeat")
+
+        mock_dependencies.open.assert_called_once_with("/app/healthcheck.tmp", "w")
+        mock_dependencies.os.utime.assert_called_once_with("/app/healthcheck", None)
+
+
+    def test_update_healthcheck_rewrites_file_when_touch_fails(
+        self, scheduler: Scheduler, mock_dependencies: SimpleNamespace
+    ):
+        """Tests that a missing healthcheck file is written again rather than only touched."""
+        scheduler.update_healthcheck("Scheduler heartbeat")
+        mock_dependencies.os.utime.side_effect = FileNotFoundError("No such file")
+
+        scheduler.update_healthcheck("Scheduler heartbeat")
+
+        assert mock_dependencies.open.call_count == 2
 
 
     def test_update_healthcheck_logs_warning_on_io_error(
@@ -352,10 +401,152 @@ class TestSchedulerTasks:
         scheduler.run_oracle(run_date_override=run_date_override)
 
         mock_dependencies.oracle.main.assert_called_once_with(run_date_override=expected_date_in_call)
+        mock_dependencies.invalidate_config_cache.assert_called_once()
         scheduler.save_last_run_date.assert_called_once_with(expected_date_in_call)
         scheduler.update_healthcheck.assert_called_once()
 
 
+    def test_run_oracle_holds_lock_for_the_run_and_releases_it(
+        self, scheduler: Scheduler, mock_dependencies: SimpleNamespace
+    ):
+        """Tests that the oracle lock file is locked before the run and released afterwards."""
+        scheduler.save_last_run_date = MagicMock()
+        scheduler.update_healthcheck = MagicMock()
+        lock_fd = mock_dependencies.os.open.return_value
+
+        scheduler.run_oracle()
+
+        mock_dependencies.os.open.assert_called_once_with(
+            "/app/data/oracle.lock", mock_dependencies.os.O_RDWR | mock_dependencies.os.O_CREAT
+        )
+        mock_dependencies.fcntl.flock.assert_called_once_with(
+            lock_fd, mock_dependencies.fcntl.LOCK_EX | mock_dependencies.fcntl.LOCK_NB
+        )
+        mock_dependencies.oracle.main.assert_called_once()
+        mock_dependencies.os.close.assert_called_once_with(lock_fd)
+
+
+    def test_run_oracle_keeps_lock_until_an_unjoined_run_ends(
+        self, scheduler: Scheduler, mock_dependencies: SimpleNamespace
+    ):
+        """Tests that the lock stays held while the worker still runs after an interrupted join, until it ends."""
+        lock_fd = mock_dependencies.os.open.return_value
+        with (
+            patch("src.models.scheduler.ThreadPoolExecutor") as mock_executor_cls,
+            patch("src.models.scheduler.wait", side_effect=KeyboardInterrupt),
+        ):
+            mock_executor = mock_executor_cls.return_value
+            mock_executor.shutdown.side_effect = KeyboardInterrupt
+            mock_future = mock_executor.submit.return_value
+            mock_future.done.return_value = False
+
+            with pytest.raises(KeyboardInterrupt):
+                scheduler.run_oracle()
+
+            mock_dependencies.os.close.assert_not_called()
+            release_lock = mock_future.add_done_callback.call_args.args[0]
+            release_lock(mock_future)
+            mock_dependencies.os.close.assert_called_once_with(lock_fd)
+
+
+    def test_run_oracle_skips_run_when_another_run_holds_the_lock(
+        self, scheduler: Scheduler, mock_dependencies: SimpleNamespace
+    ):
+        """Tests that the run is skipped, without recording it, while another process holds the lock."""
+        scheduler.save_last_run_date = MagicMock()
+        mock_dependencies.fcntl.flock.side_effect = BlockingIOError("Resource temporarily unavailable")
+
+        scheduler.run_oracle()
+
+        mock_dependencies.oracle.main.assert_not_called()
+        scheduler.save_last_run_date.assert_not_called()
+        mock_dependencies.os.close.assert_called_once_with(mock_dependencies.os.open.return_value)
+
+
+    def test_run_oracle_runs_without_lock_when_lock_file_is_unusable(
+        self, scheduler: Scheduler, mock_dependencies: SimpleNamespace
+    ):
+        """Tests that a lock file that cannot be opened, e.g. on a read-only volume, does not stop the run."""
+        scheduler.save_last_run_date = MagicMock()
+        mock_dependencies.os.open.side_effect = PermissionError("Read-only file system")
+
+        scheduler.run_oracle()
+
+        mock_dependencies.oracle.main.assert_called_once()
+        scheduler.save_last_run_date.assert_called_once()
+        mock_dependencies.os.close.assert_not_called()
+        assert "without it" in mock_dependencies.logger.warning.call_args.args[0]
+
+
+    def test_run_oracle_keeps_healthcheck_fresh_during_long_runs(
+        self, scheduler: Scheduler, mock_dependencies: SimpleNamespace
+    ):
+        """Tests that the healthcheck is updated while the oracle is still running in its worker thread."""
+        scheduler.save_last_run_date = MagicMock()
+        scheduler.update_healthcheck = MagicMock()
+        run_finished = threading.Event()
+        mock_dependencies.oracle.main.side_effect = lambda run_date_override: run_finished.wait(timeout=5)
+        scheduler.update_healthcheck.side_effect = lambda message: run_finished.set()
+
+        with patch("src.models.scheduler.HEARTBEAT_INTERVAL_SECONDS", 0.01):
+            scheduler.run_oracle(run_date_override=date(2023, 10, 26))
+
+        assert scheduler.update_healthcheck.call_args_list[0] == call("Oracle run for 2023-10-26 in progress")
+        scheduler.save_last_run_date.assert_called_once_with(date(2023, 10, 26))
+
+
+    def test_run_oracle_lets_in_flight_run_finish_on_shutdown(
+        self, scheduler: Scheduler, mock_dependencies: SimpleNamespace
+    ):
+        """Tests that a shutdown during a run waits for the run to finish, logs it, and is not retried."""
+        shutdown_logged = threading.Event()
+        run_completed = threading.Event()
+
+        def slow_run(run_date_override):
+            shutdown_logged.wait(timeout=5)
+            run_completed.set()
+
+        mock_dependencies.oracle.main.side_effect = slow_run
+        scheduler.update_healthcheck = MagicMock(side_effect=KeyboardInterrupt)
+        mock_dependencies.logger.warning.side_effect = lambda message: shutdown_logged.set()
+
+        with patch("src.models.scheduler.HEARTBEAT_INTERVAL_SECONDS", 0.01):
+            with pytest.raises(KeyboardInterrupt):
+                scheduler.run_oracle(run_date_override=date(2023, 10, 26))
+
+        mock_dependencies.logger.warning.assert_called_once_with(
+            "Shutdown requested, waiting for the oracle run for 2023-10-26 to finish first"
+        )
+        assert run_completed.is_set()
+        mock_dependencies.oracle.main.assert_called_once()
+
+
+    def test_run_oracle_joins_worker_when_heartbeat_fails(
+        self, scheduler: Scheduler, mock_dependencies: SimpleNamespace
+    ):
+        """Tests that an error leaving the heartbeat loop still waits for the running oracle before returning."""
+        heartbeat_failed = threading.Event()
+        run_completed = threading.Event()
+
+        def slow_run(run_date_override):
+            heartbeat_failed.wait(timeout=5)
+            run_completed.set()
+
+        def failing_heartbeat(message):
+            heartbeat_failed.set()
+            raise ValueError("Healthcheck failed")
+
+        mock_dependencies.oracle.main.side_effect = slow_run
+        scheduler.update_healthcheck = MagicMock(side_effect=failing_heartbeat)
+        scheduler.run_oracle.retry.wait = wait_fixed(0)
+
+        with patch("src.models.scheduler.HEARTBEAT_INTERVAL_SECONDS", 0.01):
+            with pytest.raises(ValueError):
+                scheduler.run_oracle()
+
+        assert run_completed.is_set()
+
+
     def test_run_oracle_retries_on_failure(self, scheduler: Scheduler, mock_dependencies: SimpleNamespace):
         """Tests that the @retry decorator on `run_oracle` functions as expected."""
         expected_attempts = 5
@@ -371,6 +562,108 @@ class TestSchedulerTasks:
         assert mock_dependencies.oracle.main.call_count == expected_attempts
 
 
+
+    def test_run_oracle_does_not_retry_non_retryable_errors(
+        self, scheduler: Scheduler, mock_dependencies: SimpleNamespace
+    ):
+        """Tests that configuration errors fail fast instead of being retried."""
+        mock_dependencies.oracle.main.side_effect = ConfigurationError("Missing env var")
+        scheduler.run_oracle.retry.wait = wait_fixed(0)
+
+        with pytest.raises(ConfigurationError):
+            scheduler.run_oracle()
+
+        mock_dependencies.oracle.main.assert_called_once()
+
+
+    def test_run_oracle_retries_key_errors(self, scheduler: Scheduler, mock_dependencies: SimpleNamespace):
+        """Tests that a KeyError, e.g. from a malformed RPC or BigQuery response, is retried like any failure."""
+        mock_dependencies.oracle.main.side_effect = KeyError("result")
+        scheduler.run_oracle.retry.wait = wait_fixed(0)
+
+        with pytest.raises(KeyError):
+            scheduler.run_oracle()
+
+        assert mock_dependencies.oracle.main.call_count == 5
+
+
+
+    def test_run_oracle_retries_failed_run_reported_by_oracle_exit(
+        self, scheduler: Scheduler, mock_dependencies: SimpleNamespace
+    ):
+        """Tests that a run which oracle.main reports as SystemExit(1) from a transient error is retried."""
+
+        def fail_with_exit(run_date_override):
+            try:
+                raise ConnectionError("RPC unreachable")
+            except ConnectionError as e:
+                raise SystemExit(1) from e
+
+        mock_dependencies.oracle.main.side_effect = fail_with_exit
+        scheduler.run_oracle.retry.wait = wait_fixed(0)
+
+        with pytest.raises(SystemExit):
+            scheduler.run_oracle()
+
+        assert mock_dependencies.oracle.main.call_count == 5
+
+
+    @pytest.mark.parametrize(
+        "error",
+        [SystemExit(1), KeyboardInterrupt()],
+        ids=["unchained_exit", "interrupt"],
+    )
+    def test_run_oracle_does_not_retry_exits_and_interrupts(
+        self, error, scheduler: Scheduler, mock_dependencies: SimpleNamespace
+    ):
+        """Tests that exits without a retryable cause and interrupts are not retried."""
+        mock_dependencies.oracle.main.side_effect = error
+        scheduler.run_oracle.retry.wait = wait_fixed(0)
+
+        with pytest.raises(type(error)):
+            scheduler.run_oracle()
+
+        mock_dependencies.oracle.main.assert_called_once()
+
+
+    def test_run_oracle_skips_run_halted_by_circuit_breaker(
+        self, scheduler: Scheduler, mock_dependencies: SimpleNamespace
+    ):
+        """
+        Tests that a circuit breaker halt, reported by oracle.main as SystemExit(0), skips the run without
+        retrying it or stopping the scheduler, and does not record the run as done.
+        """
+        mock_dependencies.oracle.main.side_effect = SystemExit(0)
+        scheduler.run_oracle.retry.wait = wait_fixed(0)
+        scheduler.save_last_run_date = MagicMock()
+
+        scheduler.run_oracle()
+
+        mock_dependencies.oracle.main.assert_called_once()
+        scheduler.save_last_run_date.assert_not_called()
+        mock_dependencies.os.close.assert_called_once()
+
+
+    def test_run_oracle_does_not_retry_oracle_exit_caused_by_configuration_error(
+        self, scheduler: Scheduler, mock_dependencies: SimpleNamespace
+    ):
+        """Tests that a run which oracle.main reports as SystemExit(1) from a configuration error fails fast."""
+
+        def fail_with_exit(run_date_override):
+            try:
+                raise ConfigurationError("Missing env var")
+            except ConfigurationError as e:
+                raise SystemExit(1) from e
+
+        mock_dependencies.oracle.main.side_effect = fail_with_exit
+        scheduler.run_oracle.retry.wait = wait_fixed(0)
+
+        with pytest.raises(SystemExit):
+            scheduler.run_oracle()
+
+        mock_dependencies.oracle.main.assert_called_once()
+
+
 class TestSchedulerRunLoop:
     """Tests for the main `run` loop of the scheduler."""
 
@@ -378,18 +671,32 @@ class TestSchedulerRunLoop:
     def test_run_loop_calls_run_pending_and_sleeps_correctly(
         self, scheduler: Scheduler, mock_dependencies: SimpleNamespace
     ):
-        """Tests that the run loop correctly calls schedule and sleeps."""
+        """Tests that the run loop sleeps until the next job, capped at the heartbeat interval."""
         mock_dependencies.schedule.run_pending.side_effect = [None, None, KeyboardInterrupt]
+        mock_dependencies.schedule.idle_seconds.side_effect = [3600.0, 42.5]
         scheduler.update_healthcheck = MagicMock()
 
         scheduler.run()
 
         assert mock_dependencies.schedule.run_pending.call_count == 3
-        mock_dependencies.time.sleep.assert_has_calls([call(60), call(60)])
+        mock_dependencies.time.sleep.assert_has_calls([call(HEARTBEAT_INTERVAL_SECONDS), call(42.5)])
         assert scheduler.update_healthcheck.call_count == 2
         mock_dependencies.logger.info.assert_any_call("Scheduler stopped by user")
 
 
+    @pytest.mark.parametrize("idle_seconds, expected_sleep", [(None, HEARTBEAT_INTERVAL_SECONDS), (-5.0, 0)])
+    def test_run_loop_sleeps_sensibly_without_an_upcoming_job(
+        self, scheduler: Scheduler, mock_dependencies: SimpleNamespace, idle_seconds, expected_sleep
+    ):
+        """Tests that the run loop falls back to the heartbeat interval, and never sleeps for negative time."""
+        mock_dependencies.schedule.run_pending.side_effect = [None, KeyboardInterrupt]
+        mock_dependencies.schedule.idle_seconds.return_value = idle_seconds
+
+        scheduler.run()
+
+        mock_dependencies.time.sleep.assert_called_once_with(expected_sleep)
+
+
     def test_run_loop_handles_keyboard_interrupt_gracefully(
         self, scheduler: Scheduler, mock_dependencies: SimpleNamespace
     ):
@@ -405,6 +712,19 @@ class TestSchedulerRunLoop:
         mock_dependencies.exit.assert_not_called()
 
 
+    def test_run_loop_stops_gracefully_on_sigterm(self, scheduler: Scheduler, mock_dependencies: SimpleNamespace):
+        """Tests that SIGTERM is routed through the same graceful shutdown path as KeyboardInterrupt."""
+        mock_dependencies.schedule.run_pending.side_effect = KeyboardInterrupt("Test interrupt")
+
+        scheduler.run()
+
+        mock_dependencies.signal.signal.assert_called_once_with(
+            mock_dependencies.signal.SIGTERM, _raise_keyboard_interrupt
+        )
+        with pytest.raises(KeyboardInterrupt):
+            _raise_keyboard_interrupt(15, None)
+
+
     def test_run_loop_handles_unexpected_exception_and_exits(
         self, scheduler: Scheduler, mock_dependencies: SimpleNamespace
     ):
@@ -174,6 +174,7 @@ def test_main_handles_failures_at_each_stage(oracle_context, failing_component,
         ctx["main"]()
 
     assert excinfo.value.code == 1, "The application should exit with status code 1 on failure."
+    assert excinfo.value.__cause__ is error, "The exit should be chained to the error that caused it."
 
     ctx["circuit_breaker"].record_failure.assert_called_once()
     ctx["logger_error"].assert_any_call(f"Oracle failed at stage '{expected_stage}': {error}", exc_info=True)
@@ -188,6 +189,43 @@ def test_main_handles_failures_at_each_stage(oracle_context, failing_component,
         assert call_args["error_message"] == str(error)
 
 
+def test_main_reports_blockchain_client_init_failure_at_submission_stage(oracle_context):
+    """Test that a client connecting in the background reports its failure at the Blockchain Submission stage."""
+    ctx = oracle_context
+    error = ConnectionError("All RPC providers are unreachable")
+    ctx["client_cls"].side_effect = error
+
+    with pytest.raises(SystemExit):
+        ctx["main"]()
+
+    ctx["pipeline"].process.assert_called_once()
+    ctx["logger_error"].assert_any_call(f"Oracle failed at stage 'Blockchain Submission': {error}", exc_info=True)
+
+
+def test_main_fetches_only_addresses_when_raw_archive_disabled(oracle_context):
+    """Test that disabling the raw data archive fetches grouped addresses and skips the full processing."""
+    ctx = oracle_context
+    ctx["load_config"].return_value = {**MOCK_CONFIG, "ARCHIVE_RAW_BIGQUERY_DATA": False}
+    ctx["bq_provider"].fetch_indexer_addresses_by_eligibility.return_value = {
+        1: ["0xEligible"],
+        0: ["0xIneligible"],
+    }
+    ctx["pipeline"].save_indexer_lists.return_value = (["0xEligible"], ["0xIneligible"])
+
+    ctx["main"]()
+
+    assert ctx["pipeline_cls"].call_args.kwargs["archive_raw_data"] is False
+    ctx["bq_provider"].fetch_indexer_issuance_eligibility_data.assert_not_called()
+    ctx["pipeline"].process.assert_not_called()
+    ctx["pipeline"].save_indexer_lists.assert_called_once_with(
+        eligible_indexers=["0xEligible"], ineligible_indexers=["0xIneligible"], current_date=date.today()
+    )
+    ctx["client"].batch_allow_indexers_issuance_eligibility.assert_called_once()
+    assert ctx["client"].batch_allow_indexers_issuance_eligibility.call_args.kwargs["indexer_addresses"] == [
+        "0xEligible"
+    ]
+
+
 def test_main_uses_date_override_correctly(oracle_context):
     """Test that providing a date override correctly adjusts the analysis window."""
     ctx = oracle_context
@@ -278,9 +316,8 @@ def test_main_uses_cached_data_when_fresh(oracle_context):
 
     ctx["main"]()
 
-    # Should check for fresh data (called twice due to our conditional logic)
-    assert ctx["pipeline"].has_fresh_processed_data.call_count == 2
-    ctx["pipeline"].has_fresh_processed_data.assert_called_with(date.today(), 30)
+    # Should check for fresh data exactly once
+    ctx["pipeline"].has_fresh_processed_data.assert_called_once_with(date.today(), 30)
     # Should load from cache
     ctx["pipeline"].load_eligible_indexers_from_csv.assert_called_once_with(date.today())
     # Should NOT call BigQuery